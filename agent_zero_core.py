@@ -14,15 +14,20 @@ VESSEL-NATIVE DESIGN:
 - No global memory/tool system - all resources come from vessels
 """
 
+import asyncio
+import inspect
 import logging
+import os
+import pickle
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass, field
+from typing import AbstractSet, Dict, List, Any, Optional, Callable, Set, Tuple, Union
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 import threading
-import queue
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -39,6 +44,45 @@ class AgentStatus(Enum):
     WAITING_ASYNC = "waiting_async"
 
 
+class AgentRuntime(Enum):
+    """How agent processing loops are driven."""
+    THREADS = "threads"  # Legacy: one polling thread per agent
+    SCHEDULER = "scheduler"  # Event-driven: bounded worker pool, wake on work
+    ASYNCIO = "asyncio"  # Agent, coordination and SSF tasks on one event loop
+
+
+class SubsystemInit(Enum):
+    """When the optional subsystems (tool registry, MCP explorer, ...) are built."""
+    LAZY = "lazy"  # On first access
+    EAGER = "eager"  # One after another in initialize()
+    PARALLEL = "parallel"  # Concurrently in initialize()
+
+
+class _LazySubsystem:
+    """
+    AgentZeroCore attribute built on first access by a subsystem initializer.
+
+    A non-data descriptor: the initializer assigns the real value on the
+    instance, which then shadows the descriptor, so later reads are plain
+    attribute lookups. Attributes set by the same initializer (the A2A
+    service, registry and discovery) share one subsystem.
+    """
+
+    def __init__(self, subsystem: str):
+        self.subsystem = subsystem
+        self.name = subsystem
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        instance._ensure_subsystem(self.subsystem)
+        # Unset if the initializer failed
+        return instance.__dict__.get(self.name)
+
+
 @dataclass
 class AgentSpecification:
     """Dynamic agent specification from natural language"""
@@ -52,6 +96,27 @@ class AgentSpecification:
     specialization: str = "general"
 
 
+def _new_mailbox(**kwargs) -> Any:
+    from vessels.a0.mailbox import Mailbox
+    return Mailbox(**kwargs)
+
+
+def _drain(items: Any) -> List[Any]:
+    """
+    Remove and return everything in a deque that other threads append to.
+
+    Each popleft() is atomic, so an entry appended while draining is either
+    returned or left for the next drain, never dropped.
+    """
+    drained = []
+    try:
+        while True:
+            drained.append(items.popleft())
+    except IndexError:
+        pass
+    return drained
+
+
 @dataclass
 class AgentInstance:
     """Live agent instance with vessel-scoped resources"""
@@ -65,10 +130,16 @@ class AgentInstance:
     memory_backend: Optional[Any] = None  # Vessel-injected memory backend
     action_gate: Optional[Any] = None  # Vessel-injected action gate
     tools: List[str] = field(default_factory=list)
-    connections: List[str] = field(default_factory=list)
-    message_queue: queue.Queue = field(default_factory=queue.Queue)
+    connections: AbstractSet[str] = field(default_factory=frozenset)  # Read-only view from the specialization graph
+    mailbox: Any = field(default_factory=_new_mailbox)  # Bounded, prioritized inbox
+    tasks_in_flight: int = 0  # Tasks running on the shared executor
     active_consultation: Optional[Any] = None
 
+    @property
+    def message_queue(self) -> Any:
+        """Backward-compatible alias for the agent's mailbox."""
+        return self.mailbox
+
 
 class AgentZeroCore:
     """
@@ -83,9 +154,56 @@ class AgentZeroCore:
     - Backward compatible: works without VesselRegistry (legacy mode)
     """
 
+    # Optional subsystems: name -> initializer, in eager initialization order
+    SUBSYSTEMS: Dict[str, str] = {
+        "tool_registry": "_initialize_tool_registry",
+        "birth_agent": "_initialize_birth_agent",
+        "mcp_explorer": "_initialize_mcp_explorer",
+        "ambassador_factory": "_initialize_ambassador_factory",
+        "a2a": "_initialize_a2a",
+        "conversation_store": "_initialize_conversation_store",
+        "gardener": "_initialize_gardener",
+        "ssf": "_initialize_ssf",
+    }
+
+    # Tool Registry - graph-based tool management (no hardcoding!)
+    tool_registry = _LazySubsystem("tool_registry")
+    # Specialized agents (not spawned, but coordinated through A0)
+    birth_agent = _LazySubsystem("birth_agent")  # Vessel creation
+    mcp_explorer = _LazySubsystem("mcp_explorer")  # Capability discovery
+    ambassador_factory = _LazySubsystem("ambassador_factory")  # MCP Ambassador agents
+    # MCP Ambassadors (server_id -> ambassador)
+    mcp_ambassadors = _LazySubsystem("ambassador_factory")
+    # A2A (Agent-to-Agent) Protocol - vessel-to-vessel communication
+    a2a_service = _LazySubsystem("a2a")
+    a2a_registry = _LazySubsystem("a2a")
+    a2a_discovery = _LazySubsystem("a2a")
+    # Conversation Store - ALL conversations persisted (CORE FEATURE)
+    conversation_store = _LazySubsystem("conversation_store")
+    # Gardener - automated memory and conversation hygiene
+    gardener = _LazySubsystem("gardener")
+    # SSF Integration - ALL actions go through SSFs
+    ssf_integration = _LazySubsystem("ssf")
+
     def __init__(self, vessel_registry: Optional[Any] = None, *,
                  default_memory=None, default_tools=None,
-                 llm_call: Optional[Callable[[str], str]] = None):
+                 llm_call: Optional[Callable[[str], str]] = None,
+                 agent_runtime: Any = AgentRuntime.THREADS,
+                 scheduler_workers: int = 8,
+                 agent_pool: Optional[Any] = None,
+                 mailbox_size: int = 1000,
+                 mailbox_policy: Any = "reject",
+                 mailbox_batch: int = 8,
+                 history_size: int = 256,
+                 history_spill_dir: Optional[str] = None,
+                 task_max_retries: int = 0,
+                 task_concurrency: int = 1,
+                 task_quantum: int = 1,
+                 experience_writer: Optional[Any] = None,
+                 agent_definitions_dir: Optional[str] = None,
+                 snapshot_path: Optional[str] = None,
+                 snapshot_interval: float = 300.0,
+                 subsystem_init: Any = SubsystemInit.LAZY):
         """
         Initialize AgentZeroCore.
 
@@ -94,15 +212,128 @@ class AgentZeroCore:
             default_memory: Fallback memory system (used if no vessel provided)
             default_tools: Fallback tool system (used if no vessel provided)
             llm_call: Function to call LLM for agent thinking (prompt -> response)
+            agent_runtime: AgentRuntime (or its value) driving agent loops
+            scheduler_workers: Worker threads used by the SCHEDULER runtime
+            agent_pool: AgentPool of warm request agents (default: AgentPool())
+            mailbox_size: Max pending messages per agent mailbox
+            mailbox_policy: OverflowPolicy (or its value) for full mailboxes:
+                "block", "drop_oldest" or "reject"
+            mailbox_batch: Max messages an agent drains per cycle
+            history_size: Interaction records kept in memory per agent
+            history_spill_dir: Directory for per-agent JSONL files of evicted history
+            task_max_retries: Default retries for failed agent tasks
+            task_concurrency: Max tasks per agent running at once on the shared
+                executor (1 runs tasks inline in the agent cycle)
+            task_quantum: Max tasks an agent starts per cycle before yielding
+                to other agents
+            experience_writer: ExperienceWriter batching learned patterns to
+                memory backends (default: ExperienceWriter())
+            agent_definitions_dir: Directory of agent *.yml definitions whose
+                executor sections route task execution (default: agents/)
+            snapshot_path: File for agent state snapshots; restored by
+                initialize() if present, rewritten periodically and on shutdown
+            snapshot_interval: Seconds between periodic snapshots (0 disables)
+            subsystem_init: SubsystemInit (or its value): build the optional
+                subsystems on first access ("lazy"), or in initialize() one
+                after another ("eager") or concurrently ("parallel")
+
+        With AgentRuntime.ASYNCIO, process_request and send_message remain
+        synchronous and thread-safe. Blocking work (request handling and
+        agent spawning, sync task executors, coordination passes and their
+        snapshot writes) runs off the runtime's loop so it never stalls the
+        agent tasks hosted there.
         """
         self.vessel_registry = vessel_registry
-        self.agents: Dict[str, AgentInstance] = {}
+
+        # Optional subsystems are built by _ensure_subsystem, each under its
+        # own lock so independent ones can initialize concurrently
+        self.subsystem_init = SubsystemInit(subsystem_init)
+        self.subsystem_init_times: Dict[str, float] = {}
+        self._subsystems_ready: Set[str] = set()
+        self._subsystem_locks: Dict[str, threading.RLock] = {
+            name: threading.RLock() for name in self.SUBSYSTEMS
+        }
+
+        # Sharded, lock-protected agent table with snapshot iteration and a
+        # per-vessel index (spawns race with coordination and status reads)
+        from vessels.a0.agent_table import AgentTable
+        self.agents: "AgentTable" = AgentTable()
         self.agent_specifications: Dict[str, AgentSpecification] = {}
-        self.message_bus = queue.Queue()
+
+        # Topic pub/sub: broadcasts are appended once to a shared ring buffer
+        from vessels.a0.message_bus import MessageBus
+        self.message_bus = MessageBus()
         self.executor = ThreadPoolExecutor(max_workers=50)
+        # Separate pool for CPU-bound executors so they cannot starve I/O tasks
+        self.cpu_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4, thread_name_prefix="a0-cpu"
+        )
         self.running = False
         self.coordination_thread = None
 
+        # Per-agent mailbox settings
+        from vessels.a0.mailbox import OverflowPolicy
+        self.mailbox_size = mailbox_size
+        self.mailbox_policy = OverflowPolicy(mailbox_policy)
+        self.mailbox_batch = max(1, mailbox_batch)
+
+        # Per-agent task queues and bounded interaction history
+        self.history_size = history_size
+        self.history_spill_dir = history_spill_dir
+        self.task_max_retries = task_max_retries
+        self.task_concurrency = max(1, task_concurrency)
+        self.task_quantum = max(1, task_quantum)
+        self._task_lock = threading.Lock()
+        self._thread_wakeups: Dict[str, threading.Event] = {}
+
+        # Agent state snapshots for warm restarts
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self._last_snapshot = time.monotonic()
+
+        # Specialization -> task executor dispatch table
+        self.executor_registry = self._build_executor_registry(agent_definitions_dir)
+
+        # Write-behind batching of learned patterns to memory backends
+        if experience_writer is None:
+            from vessels.a0.experience_writer import ExperienceWriter
+            experience_writer = ExperienceWriter()
+        self.experience_writer = experience_writer
+
+        # Warm agents reused across requests, keyed by (vessel, specialization)
+        if agent_pool is None:
+            from vessels.a0.pool import AgentPool
+            agent_pool = AgentPool()
+        self.agent_pool = agent_pool
+
+        # Specialization index; agent connections are maintained incrementally
+        from vessels.a0.connections import SpecializationGraph
+        self.specialization_graph = SpecializationGraph()
+
+        # Liveness deadlines; the monitor only visits agents that are due
+        from vessels.a0.liveness import LivenessTracker
+        self.liveness = LivenessTracker(stall_timeout=300.0)
+
+        # Agent runtime: legacy per-agent threads, event-driven scheduler,
+        # or a single asyncio loop (which also hosts the coordination loop)
+        self.agent_runtime = AgentRuntime(agent_runtime)
+        self.scheduler = None
+        if self.agent_runtime == AgentRuntime.SCHEDULER:
+            from vessels.a0.scheduler import AgentScheduler
+            self.scheduler = AgentScheduler(
+                self._run_agent_cycle, max_workers=scheduler_workers,
+                resolve_group=self.message_bus.subscribers,
+            )
+        elif self.agent_runtime == AgentRuntime.ASYNCIO:
+            from vessels.a0.async_runtime import AsyncAgentRuntime
+            self.scheduler = AsyncAgentRuntime(
+                self._run_agent_cycle, coordinate=self._coordination_step,
+                resolve_group=self.message_bus.subscribers,
+            )
+
+        if self.scheduler:
+            self.message_bus.add_listener(self._on_bus_publish)
+
         # LLM interface for agent thinking
         self.llm_call = llm_call
 
@@ -116,32 +347,8 @@ class AgentZeroCore:
         self.consensus_engine = None  # Village consensus engine (optional)
         self.interface = None  # Interface for sending messages to users
 
-        # Specialized agents (not spawned, but coordinated through A0)
-        self.birth_agent = None  # Birth Agent for vessel creation
-        self.mcp_explorer = None  # MCP Explorer for capability discovery
-        self.ambassador_factory = None  # Factory for MCP Ambassador agents
-
-        # Track MCP Ambassadors (server_id -> ambassador)
-        self.mcp_ambassadors: Dict[str, Any] = {}
-
-        # Tool Registry - graph-based tool management (no hardcoding!)
-        self.tool_registry = None
-
-        # A2A (Agent-to-Agent) Protocol - vessel-to-vessel communication
-        self.a2a_service = None
-        self.a2a_registry = None
-        self.a2a_discovery = None
-
-        # Conversation Store - ALL conversations persisted (CORE FEATURE)
-        self.conversation_store = None
-
-        # Gardener - automated memory and conversation hygiene
-        self.gardener = None
-
-        # SSF Integration - ALL actions go through SSFs
-        self.ssf_integration = None
-
-        # Intent patterns for natural language processing (merged from DynamicAgentFactory)
+        # Built-in intent patterns (merged from DynamicAgentFactory); used when
+        # config/intent_config.json is missing or invalid
         self.intent_patterns = {
             "grant_discovery": [
                 r"find.*grant", r"search.*funding", r"discover.*opportunit",
@@ -169,6 +376,12 @@ class AgentZeroCore:
             ]
         }
 
+        # Precompiled intent matcher, loaded from config and hot-reloaded
+        from vessels.a0.intents import IntentEngine
+        self.intent_engine = IntentEngine.from_config(
+            fallback_patterns=self.intent_patterns
+        )
+
         # Capability matrix for each intent
         self.capability_matrix = {
             "grant_discovery": ["web_search", "data_analysis", "opportunity_matching", "deadline_tracking"],
@@ -179,47 +392,124 @@ class AgentZeroCore:
             "resource_management": ["inventory_tracking", "allocation_optimization", "usage_monitoring", "distribution"]
         }
 
-    def initialize(self, memory_system=None, tool_system=None):
+    def initialize(self, memory_system=None, tool_system=None,
+                   snapshot_path: Optional[str] = None):
         """
         Initialize the coordination system.
 
         Note: When using vessel_registry, memory/tools come from vessels.
         This method is primarily for backward compatibility.
+
+        Args:
+            memory_system: Fallback memory system
+            tool_system: Fallback tool system
+            snapshot_path: Restore agents from this snapshot if it exists
+                (default: the snapshot_path given to the constructor)
         """
         if memory_system:
             self.memory_system = memory_system
         if tool_system:
             self.tool_system = tool_system
+        if snapshot_path:
+            self.snapshot_path = snapshot_path
         self.running = True
-        self.coordination_thread = threading.Thread(target=self._coordination_loop)
-        self.coordination_thread.daemon = True
-        self.coordination_thread.start()
-
-        # Initialize Tool Registry - graph-based tool management
-        self._initialize_tool_registry()
 
-        # Initialize Birth Agent with A0's LLM interface
-        self._initialize_birth_agent()
+        # Warm restart: rebuild agents from the last snapshot instead of
+        # re-spawning them
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            from vessels.a0.snapshot import SnapshotError
+            try:
+                self.restore_snapshot(self.snapshot_path)
+            except SnapshotError as e:
+                logger.warning(f"Starting cold: {e}")
+        if self.agent_runtime != AgentRuntime.ASYNCIO:
+            self.coordination_thread = threading.Thread(target=self._coordination_loop)
+            self.coordination_thread.daemon = True
+            self.coordination_thread.start()
+
+        self.experience_writer.start()
+
+        if self.scheduler:
+            self.scheduler.start()
+            # Agents spawned before initialize() may already have work queued
+            self.scheduler.notify_many(list(self.agents))
+
+        # Tool registry, birth agent, MCP explorer, ambassadors, A2A,
+        # conversation store, gardener and SSF integration; in LAZY mode
+        # each is built on first access instead
+        if self.subsystem_init != SubsystemInit.LAZY:
+            self.warm_up(parallel=self.subsystem_init == SubsystemInit.PARALLEL)
 
-        # Initialize MCP Explorer for capability discovery
-        self._initialize_mcp_explorer()
+        logger.info("Agent Zero Core initialized")
 
-        # Initialize Ambassador Factory for MCP server personification
-        self._initialize_ambassador_factory()
+    def _ensure_subsystem(self, name: str) -> None:
+        """Build a subsystem once; concurrent callers wait for the first."""
+        if name in self._subsystems_ready:
+            return
+        with self._subsystem_locks[name]:
+            if name in self._subsystems_ready:
+                return
+            start = time.perf_counter()
+            try:
+                getattr(self, self.SUBSYSTEMS[name])()
+            except Exception as e:
+                logger.error(f"Could not initialize subsystem {name}: {e}")
+            finally:
+                # Includes subsystems it depends on that were not built yet
+                self.subsystem_init_times[name] = time.perf_counter() - start
+                self._subsystems_ready.add(name)
+
+    def _loaded_subsystem(self, attribute: str) -> Any:
+        """A subsystem attribute if already built, without building it."""
+        return self.__dict__.get(attribute)
+
+    def warm_up(self, parallel: bool = True,
+                subsystems: Optional[List[str]] = None) -> Dict[str, float]:
+        """
+        Build subsystems now rather than on first access.
 
-        # Initialize A2A Protocol for vessel-to-vessel communication
-        self._initialize_a2a()
+        In parallel mode each subsystem initializes on its own thread; one
+        that needs another (the MCP explorer registers tools in the tool
+        registry) waits on that subsystem's lock instead of building it twice.
 
-        # Initialize Conversation Store for ALL conversation persistence
-        self._initialize_conversation_store()
+        Args:
+            parallel: Initialize independent subsystems concurrently
+            subsystems: Names from SUBSYSTEMS (default: all)
 
-        # Initialize Gardener for memory and conversation hygiene
-        self._initialize_gardener()
+        Returns:
+            Seconds spent initializing each requested subsystem
+        """
+        names = list(subsystems or self.SUBSYSTEMS)
+        unknown = [name for name in names if name not in self.SUBSYSTEMS]
+        if unknown:
+            raise ValueError(f"Unknown subsystems: {', '.join(unknown)}")
+
+        start = time.perf_counter()
+        if parallel and len(names) > 1:
+            with ThreadPoolExecutor(max_workers=len(names),
+                                    thread_name_prefix="a0-warmup") as pool:
+                list(pool.map(self._ensure_subsystem, names))
+        else:
+            for name in names:
+                self._ensure_subsystem(name)
 
-        # Initialize SSF Integration - ALL actions go through SSFs
-        self._initialize_ssf()
+        times = {name: self.subsystem_init_times.get(name, 0.0) for name in names}
+        logger.info(
+            f"Subsystems ready in {time.perf_counter() - start:.3f}s "
+            f"({'parallel' if parallel else 'sequential'}): "
+            + ", ".join(f"{name}={seconds:.3f}s" for name, seconds in times.items())
+        )
+        return times
 
-        logger.info("Agent Zero Core initialized")
+    def get_subsystem_stats(self) -> Dict[str, Any]:
+        """Get which subsystems are built and how long each took."""
+        return {
+            "mode": self.subsystem_init.value,
+            "initialized": [name for name in self.SUBSYSTEMS if name in self._subsystems_ready],
+            "pending": [name for name in self.SUBSYSTEMS if name not in self._subsystems_ready],
+            "init_seconds": dict(self.subsystem_init_times),
+            "total_init_seconds": sum(self.subsystem_init_times.values()),
+        }
 
     def _initialize_tool_registry(self):
         """Initialize the Tool Registry for graph-based tool management."""
@@ -271,6 +561,7 @@ class AgentZeroCore:
 
     def _initialize_ambassador_factory(self):
         """Initialize the Ambassador Factory for MCP server personification."""
+        self.mcp_ambassadors = {}
         try:
             from vessels.agents.mcp_ambassador import MCPAmbassadorFactory
             self.ambassador_factory = MCPAmbassadorFactory(
@@ -298,18 +589,12 @@ class AgentZeroCore:
             llm_call: Function to call LLM (prompt -> response)
         """
         self.llm_call = llm_call
-        # Update Birth Agent if it exists
-        if self.birth_agent:
-            self.birth_agent.llm_call = llm_call
-        # Update MCP Explorer if it exists
-        if self.mcp_explorer:
-            self.mcp_explorer.llm_call = llm_call
-        # Update Tool Registry if it exists
-        if self.tool_registry:
-            self.tool_registry.llm_call = llm_call
-        # Update Ambassador Factory if it exists
-        if self.ambassador_factory:
-            self.ambassador_factory.llm_call = llm_call
+        # Update subsystems already built; the rest pick up self.llm_call
+        # when they are initialized
+        for attribute in ("birth_agent", "mcp_explorer", "tool_registry", "ambassador_factory"):
+            subsystem = self._loaded_subsystem(attribute)
+            if subsystem:
+                subsystem.llm_call = llm_call
         logger.info("LLM call function configured for AgentZeroCore")
 
     def _initialize_a2a(self):
@@ -454,11 +739,59 @@ class AgentZeroCore:
             logger.warning(f"Could not initialize SSF Integration: {e}")
             self.ssf_integration = None
 
+    async def handle_ssf_tool_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        persona: Any,
+        agent: Any,
+        context: Optional[Any] = None,
+    ) -> Any:
+        """
+        Route a tool call through the SSF integration.
+
+        Under the ASYNCIO runtime this runs natively on the runtime loop,
+        alongside agent tasks, without bridging between threads. A lazy SSF
+        subsystem is built on the loop's default executor on first use.
+
+        Returns:
+            ToolResult from the SSF integration
+
+        Raises:
+            RuntimeError: If the SSF integration is not available
+        """
+        if "ssf" not in self._subsystems_ready:
+            # Building it imports and registers the SSF stack: keep that off the loop
+            await asyncio.get_running_loop().run_in_executor(None, self._ensure_subsystem, "ssf")
+        if not self.ssf_integration:
+            raise RuntimeError("SSF integration not available")
+
+        return await self.ssf_integration.handle_tool_call(
+            tool_name, arguments, persona, agent, context
+        )
+
+    def call_ssf_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        persona: Any,
+        agent: Any,
+        context: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Thread-safe synchronous wrapper around handle_ssf_tool_call.
+
+        Must not be called from a running event loop; use
+        handle_ssf_tool_call there instead.
+        """
+        coro = self.handle_ssf_tool_call(tool_name, arguments, persona, agent, context)
+        if self.agent_runtime == AgentRuntime.ASYNCIO and self.scheduler.running:
+            return self.scheduler.run_sync(coro, timeout)
+        return asyncio.run(coro)
+
     def start_gardener(self) -> bool:
         """Start the Gardener agent for automated maintenance."""
-        if not self.gardener:
-            self._initialize_gardener()
-
         if self.gardener:
             self.gardener.start()
             return True
@@ -466,16 +799,14 @@ class AgentZeroCore:
 
     def stop_gardener(self) -> bool:
         """Stop the Gardener agent."""
-        if self.gardener:
-            self.gardener.stop()
+        gardener = self._loaded_subsystem("gardener")
+        if gardener:
+            gardener.stop()
             return True
         return False
 
     def run_gardener_cycle(self) -> Dict[str, Any]:
         """Manually trigger a Gardener maintenance cycle."""
-        if not self.gardener:
-            self._initialize_gardener()
-
         if self.gardener:
             stats = self.gardener.force_run()
             return stats.to_dict()
@@ -492,9 +823,6 @@ class AgentZeroCore:
         Returns:
             Response dict with message and metadata
         """
-        if not self.birth_agent:
-            self._initialize_birth_agent()
-
         if self.birth_agent:
             return self.birth_agent.process_message(user_id, message)
         else:
@@ -514,9 +842,6 @@ class AgentZeroCore:
         Returns:
             Intent detection result
         """
-        if not self.birth_agent:
-            self._initialize_birth_agent()
-
         if self.birth_agent:
             return self.birth_agent.detect_creation_intent(message)
         else:
@@ -529,8 +854,9 @@ class AgentZeroCore:
 
     def has_active_birth_session(self, user_id: str) -> bool:
         """Check if user has an active birth session."""
-        if self.birth_agent:
-            return self.birth_agent.has_active_session(user_id)
+        birth_agent = self._loaded_subsystem("birth_agent")
+        if birth_agent:
+            return birth_agent.has_active_session(user_id)
         return False
 
     # =========================================================================
@@ -548,6 +874,10 @@ class AgentZeroCore:
         3. Generates agent specifications
         4. Spawns and coordinates agents
 
+        Thread-safe. Under the ASYNCIO runtime the work runs on the
+        calling thread, off the runtime's loop; on the loop itself use
+        process_request_async instead, which moves it to an executor.
+
         Args:
             user_input: Natural language input from user
             user_id: User identifier
@@ -555,36 +885,183 @@ class AgentZeroCore:
         Returns:
             Response dictionary with results
         """
-        # Step 1: Detect intents
-        detected_intents = self._detect_intents(user_input)
+        return self._handle_request(user_input, user_id)
 
-        # Step 2: Generate agent specifications for detected intents
-        if detected_intents:
-            agent_specs = self._generate_agent_specs(detected_intents)
+    async def process_request_async(self, user_input: str,
+                                    user_id: str = "default") -> Dict[str, Any]:
+        """
+        Coroutine form of process_request for callers on an event loop.
 
-            # Step 3: Spawn agents
-            agent_ids = self.spawn_agents(agent_specs)
+        Intent detection and agent spawning block, so the request runs in
+        the current loop's default executor, including on the ASYNCIO
+        runtime's own loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._handle_request, user_input, user_id)
 
-            return {
-                "status": "success",
-                "message": f"Spawned {len(agent_ids)} agents for your request",
-                "intents": detected_intents,
-                "agents": agent_ids,
-                "user_id": user_id
-            }
-        else:
-            # No specific intent detected - provide general response
-            return {
-                "status": "success",
-                "message": "I understand your request. How can I help you further?",
-                "intents": [],
-                "agents": [],
-                "user_id": user_id
-            }
+    def _handle_request(self, user_input: str, user_id: str) -> Dict[str, Any]:
+        """Detect intents, generate specs and acquire agents for one request."""
+        return self._handle_requests([(user_input, user_id)], user_id)[0]
+
+    def process_requests(
+        self,
+        batch: List[Union[str, Tuple[str, str]]],
+        user_id: str = "default",
+    ) -> List[Dict[str, Any]]:
+        """
+        Process a batch of natural language requests.
+
+        Intents are detected for the whole batch at once, identical agent
+        specifications are deduplicated, and each unique specification is
+        served by a warm agent from the agent pool when one is available
+        instead of spawning a new one.
+
+        Args:
+            batch: Requests, each either a string or a (user_input, user_id) tuple
+            user_id: User identifier for items given as plain strings
+
+        Returns:
+            One response dictionary per request, in input order
+        """
+        return self._handle_requests(batch, user_id)
+
+    def _handle_requests(
+        self,
+        batch: List[Union[str, Tuple[str, str]]],
+        user_id: str,
+    ) -> List[Dict[str, Any]]:
+        """Batch counterpart of _handle_request."""
+        items = [
+            (item, user_id) if isinstance(item, str) else (item[0], item[1])
+            for item in batch
+        ]
+
+        # Step 1: Detect intents for the whole batch
+        batch_intents = self.intent_engine.detect_many([text for text, _ in items])
+
+        # Step 2: One specification per distinct intent across the batch
+        unique_intents = list(dict.fromkeys(
+            intent for intents in batch_intents for intent in intents
+        ))
+        intent_specs: Dict[str, Tuple] = {}
+        spec_agents: Dict[Tuple, Any] = {}
+        spawned = 0
+        for intent, spec in zip(unique_intents, self._generate_agent_specs(unique_intents)):
+            key = self._spec_key(spec)
+            if key not in spec_agents:
+                # Step 3: Reuse a warm pooled agent, else spawn one. Spawns
+                # already in flight for another caller are joined, not
+                # repeated, and only waited on once this batch's own spawns
+                # are done.
+                agent_id, pending, was_spawned = self._claim_agent(spec)
+                spawned += was_spawned
+                spec_agents[key] = pending if pending is not None else agent_id
+            intent_specs[intent] = key
+
+        intent_agents = {
+            intent: (spec_agents[key].result() if isinstance(spec_agents[key], Future)
+                     else spec_agents[key])
+            for intent, key in intent_specs.items()
+        }
+
+        if spawned:
+            logger.info(f"Spawned {spawned} agents for batch of {len(items)} requests")
+
+        results = []
+        for (_, item_user_id), intents in zip(items, batch_intents):
+            if intents:
+                agent_ids = list(dict.fromkeys(intent_agents[i] for i in intents))
+                results.append({
+                    "status": "success",
+                    "message": f"Assigned {len(agent_ids)} agents to your request",
+                    "intents": intents,
+                    "agents": agent_ids,
+                    "user_id": item_user_id
+                })
+            else:
+                results.append({
+                    "status": "success",
+                    "message": "I understand your request. How can I help you further?",
+                    "intents": [],
+                    "agents": [],
+                    "user_id": item_user_id
+                })
+        return results
+
+    @staticmethod
+    def _spec_key(spec: AgentSpecification) -> Tuple:
+        """Hashable identity of an agent specification."""
+        return (
+            spec.name,
+            spec.specialization,
+            tuple(spec.capabilities),
+            tuple(spec.tools_needed),
+            spec.communication_style,
+            spec.autonomy_level,
+            spec.memory_type,
+        )
+
+    def _acquire_agent(self, specification: AgentSpecification,
+                       vessel: Optional[Any] = None) -> Tuple[str, bool]:
+        """
+        Get a pooled agent for a specification, spawning one on a miss.
+
+        Returns:
+            Tuple of (agent_id, whether a new agent was spawned)
+        """
+        agent_id, pending, spawned = self._claim_agent(specification, vessel)
+        if pending is not None:
+            agent_id = pending.result()
+        return agent_id, spawned
+
+    def _claim_agent(self, specification: AgentSpecification,
+                     vessel: Optional[Any] = None) -> Tuple[Optional[str], Optional[Future], bool]:
+        """
+        Like _acquire_agent, but returns another caller's in-flight spawn
+        for the same pool key as a future instead of waiting on it.
+
+        Returns:
+            Tuple of (agent_id or None, future of the in-flight spawn or
+            None, whether a new agent was spawned)
+        """
+        vessel_id = vessel.vessel_id if vessel else None
+        key = (vessel_id, specification.specialization)
+
+        agent_id, pending = self.agent_pool.acquire(key, self._is_agent_available)
+        if agent_id is not None or pending is not None:
+            return agent_id, pending, False
+
+        # Miss: this caller holds the key's spawn reservation
+        try:
+            agent_id = self._spawn_agent(specification, vessel=vessel)
+        except BaseException as e:
+            self.agent_pool.abandon(key, e)
+            raise
+        self.agent_pool.add(key, agent_id)
+        for evicted_id in self.agent_pool.collect_over_capacity(self._is_agent_available):
+            self._remove_agent(evicted_id)
+        return agent_id, None, True
+
+    def _is_agent_available(self, agent_id: str) -> bool:
+        """Whether an agent is idle with no pending messages or tasks."""
+        agent = self.agents.get(agent_id)
+        return (agent is not None
+                and agent.status == AgentStatus.IDLE
+                and agent.mailbox.empty()
+                and not agent.tasks_in_flight
+                and not self.message_bus.has_pending(agent_id)
+                and not self._get_active_tasks(agent))
+
+    def _agent_idle_since(self, agent_id: str) -> Optional[float]:
+        """Timestamp an available agent was last active, or None if busy."""
+        agent = self.agents.get(agent_id)
+        if agent is None or not self._is_agent_available(agent_id):
+            return None
+        return agent.last_active.timestamp()
 
     def _detect_intents(self, request: str) -> List[str]:
         """
-        Detect intents from user request using regex patterns.
+        Detect intents from user request using the precompiled intent engine.
 
         Args:
             request: User input text
@@ -592,18 +1069,7 @@ class AgentZeroCore:
         Returns:
             List of detected intent names
         """
-        import re
-        detected = []
-        request_lower = request.lower()
-
-        for intent, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, request_lower, re.IGNORECASE):
-                    if intent not in detected:
-                        detected.append(intent)
-                    break
-
-        return detected
+        return self.intent_engine.detect(request)
 
     def _generate_agent_specs(self, intents: List[str]) -> List[AgentSpecification]:
         """
@@ -1000,9 +1466,6 @@ class AgentZeroCore:
         Returns:
             Dict with server info, tools provisioned, and status
         """
-        if not self.mcp_explorer:
-            self._initialize_mcp_explorer()
-
         if not self.mcp_explorer:
             return {
                 "success": False,
@@ -1280,8 +1743,10 @@ class AgentZeroCore:
             if self.tool_registry:
                 self._register_mcp_server_tools(server)
 
-            # Birth an ambassador for this MCP server
-            self._birth_mcp_ambassador(server)
+            # Birth an ambassador for this MCP server (building the factory
+            # first may already have birthed one for every known server)
+            if server.server_id not in self.mcp_ambassadors:
+                self._birth_mcp_ambassador(server)
 
         return added
 
@@ -1625,9 +2090,6 @@ class AgentZeroCore:
         Returns:
             Dict with task info and status
         """
-        if not self.a2a_service:
-            self._initialize_a2a()
-
         if not self.a2a_service:
             return {
                 "success": False,
@@ -1995,9 +2457,6 @@ class AgentZeroCore:
         Returns:
             Dict with conversation and turn info
         """
-        if not self.conversation_store:
-            self._initialize_conversation_store()
-
         if not self.conversation_store:
             return {"success": False, "error": "ConversationStore not available"}
 
@@ -2398,9 +2857,6 @@ class AgentZeroCore:
         Returns:
             Tool ID
         """
-        if not self.tool_registry:
-            self._initialize_tool_registry()
-
         if not self.tool_registry:
             raise RuntimeError("Tool Registry not available")
 
@@ -2698,7 +3154,8 @@ class AgentZeroCore:
             last_active=datetime.now(),
             vessel_id=vessel_id,
             action_gate=action_gate,
-            memory_backend=memory_backend
+            memory_backend=memory_backend,
+            mailbox=_new_mailbox(maxsize=self.mailbox_size, policy=self.mailbox_policy)
         )
 
         # Assign tools based on specification and vessel
@@ -2712,28 +3169,9 @@ class AgentZeroCore:
             agent.tools = self._assign_tools(specification.tools_needed)
 
         # Initialize agent memory namespace
-        if memory_backend and hasattr(memory_backend, 'create_namespace'):
-            # Create namespaced memory for this agent
-            agent_memory = memory_backend.create_namespace(agent_id)
-            agent.memory = agent_memory
-        else:
-            # Fallback to in-memory dict
-            agent.memory = {
-                "specification": specification,
-                "interaction_history": [],
-                "learned_patterns": [],
-                "active_tasks": []
-            }
+        agent.memory = self._new_agent_memory(agent_id, specification, memory_backend)
 
-        self.agents[agent_id] = agent
-        self.agent_specifications[agent_id] = specification
-
-        # Start agent processing loop
-        agent_thread = threading.Thread(
-            target=self._agent_processing_loop, args=(agent_id,)
-        )
-        agent_thread.daemon = True
-        agent_thread.start()
+        self._register_agent(agent, vessel)
 
         msg = f"Spawned agent {specification.name} with ID {agent_id}"
         if vessel_id:
@@ -2741,6 +3179,76 @@ class AgentZeroCore:
         logger.info(msg)
         return agent_id
 
+    def _new_agent_memory(self, agent_id: str, specification: AgentSpecification,
+                          memory_backend: Optional[Any] = None) -> Any:
+        """Namespaced backend memory, or the in-memory dict fallback."""
+        if memory_backend and hasattr(memory_backend, 'create_namespace'):
+            # Create namespaced memory for this agent
+            return memory_backend.create_namespace(agent_id)
+
+        # Fallback to in-memory dict
+        from vessels.a0.tasks import InteractionHistory, TaskQueue
+        spill_path = None
+        if self.history_spill_dir:
+            spill_path = os.path.join(self.history_spill_dir, f"{agent_id}.jsonl")
+        return {
+            "specification": specification,
+            "interaction_history": InteractionHistory(
+                capacity=self.history_size, spill_path=spill_path
+            ),
+            "learned_patterns": deque(maxlen=self.history_size),
+            "active_tasks": TaskQueue(max_retries=self.task_max_retries)
+        }
+
+    def _register_agent(self, agent: AgentInstance, vessel: Optional[Any] = None,
+                        connect: bool = True) -> None:
+        """
+        Add a built agent to the table and indexes and start its processing.
+
+        With connect=False the caller adds it to the specialization graph
+        (e.g. in bulk when restoring a snapshot).
+        """
+        agent_id = agent.id
+        self.agents[agent_id] = agent
+        self.agent_specifications[agent_id] = agent.specification
+
+        # Connect to agents with complementary specializations
+        if connect:
+            agent.connections = self.specialization_graph.add(
+                agent_id, agent.specification.specialization
+            )
+        self.liveness.touch(agent_id)
+        self.message_bus.subscribe(agent_id, self._agent_topics(agent, vessel))
+
+        # Start agent processing: the scheduler runs it on demand, the legacy
+        # runtime gives every agent its own polling thread
+        if not self.scheduler:
+            agent_thread = threading.Thread(
+                target=self._agent_processing_loop, args=(agent_id,)
+            )
+            agent_thread.daemon = True
+            agent_thread.start()
+
+    def _remove_agent(self, agent_id: str) -> bool:
+        """
+        Remove an agent and stop its processing.
+
+        Returns:
+            True if the agent existed
+        """
+        agent = self.agents.pop(agent_id, None)
+        if agent is None:
+            return False
+        self.agent_specifications.pop(agent_id, None)
+        self.specialization_graph.remove(agent_id)
+        self.liveness.remove(agent_id)
+        self.agent_pool.remove(agent_id)
+        self.message_bus.unsubscribe(agent_id)
+        if self.scheduler:
+            self.scheduler.discard(agent_id)
+        logger.info(f"Removed agent {agent.specification.name} ({agent_id})")
+        return True
+
     def _resolve_vessel_tools(self, tools_needed: List[str],
                               vessel: Any) -> List[str]:
         """
@@ -2800,66 +3308,145 @@ class AgentZeroCore:
 
     def _agent_processing_loop(self, agent_id: str):
         """
-        Main processing loop for each agent.
+        Main processing loop for each agent (THREADS runtime).
 
         Uses vessel-injected memory backend if available, otherwise falls back
         to legacy memory system.
         """
-        agent = self.agents[agent_id]
+        wakeup = self._thread_wakeups.setdefault(agent_id, threading.Event())
+        try:
+            while self.running and agent_id in self.agents:
+                if not self._run_agent_cycle(agent_id):
+                    # Brief pause when there is no work; _wake_agent cuts it short
+                    wakeup.wait(1)
+                    wakeup.clear()
+        finally:
+            self._thread_wakeups.pop(agent_id, None)
+
+    def _run_agent_cycle(self, agent_id: str) -> bool:
+        """
+        Run one processing cycle for an agent.
 
-        while self.running:
-            try:
-                # Check for messages
-                if not agent.message_queue.empty():
-                    message = agent.message_queue.get_nowait()
-                    self._process_agent_message(agent_id, message)
+        Handles up to mailbox_batch messages and starts up to task_quantum
+        tasks, then shares learnings with the memory backend. Used by both the
+        polling loop and the scheduler.
 
-                # Process active tasks
-                active_tasks = None
-                if isinstance(agent.memory, dict):
-                    active_tasks = agent.memory.get("active_tasks")
-                elif hasattr(agent.memory, 'get_active_tasks'):
-                    active_tasks = agent.memory.get_active_tasks()
-
-                if active_tasks:
-                    agent.status = AgentStatus.PROCESSING
-                    self._process_agent_tasks(agent_id)
-                    agent.last_active = datetime.now()
-                else:
-                    agent.status = AgentStatus.IDLE
+        Returns:
+            True if the agent still has pending messages or tasks it can start
+        """
+        agent = self.agents.get(agent_id)
+        if agent is None:
+            return False
+
+        try:
+            # Drain a batch of messages: mailbox (priority order) first,
+            # then bus topics
+            messages = agent.mailbox.drain(self.mailbox_batch)
+            if len(messages) < self.mailbox_batch:
+                messages.extend(self.message_bus.poll(
+                    agent_id, max_messages=self.mailbox_batch - len(messages)
+                ))
+            for message in messages:
+                self._process_agent_message(agent_id, message)
+
+            # Process active tasks
+            active_tasks = self._get_active_tasks(agent)
+
+            if active_tasks:
+                agent.status = AgentStatus.PROCESSING
+                self._process_agent_tasks(agent_id)
+                self._touch_agent(agent)
+            elif not agent.tasks_in_flight:
+                agent.status = AgentStatus.IDLE
 
-                # Share learnings with memory backend (vessel-native or legacy)
-                memory_backend = agent.memory_backend or self.memory_system
-                learned_patterns = None
+            # Share learnings with memory backend (vessel-native or legacy)
+            memory_backend = agent.memory_backend or self.memory_system
+            learned_patterns = None
 
+            if memory_backend:
                 if isinstance(agent.memory, dict):
-                    learned_patterns = agent.memory.get("learned_patterns", [])
+                    # Task threads append concurrently; take what is there
+                    learned_patterns = _drain(agent.memory["learned_patterns"])
                 elif hasattr(agent.memory, 'get_learned_patterns'):
-                    learned_patterns = agent.memory.get_learned_patterns()
-
-                if memory_backend and learned_patterns:
-                    if hasattr(memory_backend, 'store_experience'):
-                        memory_backend.store_experience(
-                            agent_id, learned_patterns
-                        )
-                    # Clear learned patterns after storing
-                    if isinstance(agent.memory, dict):
-                        agent.memory["learned_patterns"] = []
-                    elif hasattr(agent.memory, 'clear_learned_patterns'):
+                    learned_patterns = list(agent.memory.get_learned_patterns())
+                    if learned_patterns and hasattr(agent.memory, 'clear_learned_patterns'):
                         agent.memory.clear_learned_patterns()
 
-            except Exception as e:
-                logger.error(f"Agent {agent_id} processing error: {e}")
-                agent.status = AgentStatus.ERROR
+            if learned_patterns and (hasattr(memory_backend, 'store_experiences')
+                                     or hasattr(memory_backend, 'store_experience')):
+                # Buffered and flushed in batches across agents
+                self.experience_writer.add(memory_backend, agent_id, learned_patterns)
+
+        except Exception as e:
+            logger.error(f"Agent {agent_id} processing error: {e}")
+            agent.status = AgentStatus.ERROR
+            self.liveness.mark_error(agent_id)
+            return False
 
-            threading.Event().wait(1)  # Brief pause
+        more_work = (not agent.mailbox.empty()
+                     or self.message_bus.has_pending(agent_id)
+                     or self._has_startable_tasks(agent))
+        if (not more_work and not agent.tasks_in_flight
+                and agent.status == AgentStatus.PROCESSING):
+            # Event-driven runtimes may not cycle again until the next wakeup
+            agent.status = AgentStatus.IDLE
+        return more_work
+
+    def _touch_agent(self, agent: AgentInstance) -> None:
+        """Record agent activity and push back its liveness deadline."""
+        agent.last_active = datetime.now()
+        self.liveness.touch(agent.id)
+
+    def _has_startable_tasks(self, agent: AgentInstance) -> bool:
+        """Whether an agent has pending tasks and a free concurrency slot."""
+        if not self._get_active_tasks(agent):
+            return False
+        if not self._offloads_tasks(agent):
+            return True
+        return agent.tasks_in_flight < self.task_concurrency
+
+    def _offloads_tasks(self, agent: AgentInstance) -> bool:
+        """Whether an agent's tasks run on a pool rather than inline in its cycle."""
+        from vessels.a0.executors import ExecutorKind
+        if self.task_concurrency > 1:
+            return True
+        if self.agent_runtime == AgentRuntime.ASYNCIO:
+            # Inline sync executors would block every agent on the loop
+            return True
+        kind = self.executor_registry.resolve(agent.specification.specialization).kind
+        return kind != ExecutorKind.SYNC
+
+    def _get_active_tasks(self, agent: AgentInstance) -> Optional[Any]:
+        """Get an agent's pending tasks from dict or namespaced memory."""
+        if isinstance(agent.memory, dict):
+            return agent.memory.get("active_tasks")
+        elif hasattr(agent.memory, 'get_active_tasks'):
+            return agent.memory.get_active_tasks()
+        return None
 
     def _process_agent_message(self, agent_id: str, message: Dict[str, Any]):
         """Process message for specific agent"""
         agent = self.agents[agent_id]
 
         if message.get("type") == "task":
-            agent.memory["active_tasks"].append(message.get("content"))
+            tasks = agent.memory["active_tasks"]
+            if hasattr(tasks, "submit"):
+                try:
+                    tasks.submit(
+                        message.get("content"),
+                        task_id=message.get("task_id"),
+                        deadline=message.get("deadline"),
+                        max_retries=message.get("max_retries"),
+                    )
+                except (TypeError, ValueError) as e:
+                    # Duplicate or unhashable caller-supplied task_id
+                    logger.warning(f"Agent {agent_id} rejected task: {e}")
+            else:
+                tasks.append(message.get("content"))
+
+        elif message.get("type") == "cancel":
+            # Shares the task lane, so it is handled after the task it cancels
+            self.cancel_task(agent_id, message.get("task_id"))
 
         elif message.get("type") == "query":
             response = self._generate_agent_response(agent_id, message.get("content"))
@@ -2869,28 +3456,151 @@ class AgentZeroCore:
                 "sender_id": agent_id
             })
 
-    def _process_agent_tasks(self, agent_id: str):
-        """Process active tasks for agent"""
+    def _process_agent_tasks(self, agent_id: str) -> int:
+        """
+        Start up to task_quantum of an agent's tasks.
+
+        With task_concurrency 1, sync executors run tasks inline, one after
+        another. Otherwise tasks are placed on the pool matching the
+        executor's kind (see _submit_agent_task) with at most
+        task_concurrency in flight per agent, so an agent with a deep backlog
+        holds a bounded share of the pool while the scheduler's round-robin
+        serves the other agents.
+
+        Returns:
+            Number of tasks started
+        """
         agent = self.agents[agent_id]
+        tasks = agent.memory["active_tasks"]
+        parallel = self._offloads_tasks(agent)
+
+        started = 0
+        while tasks and started < self.task_quantum:
+            if parallel:
+                with self._task_lock:
+                    if agent.tasks_in_flight >= self.task_concurrency:
+                        break
+                    agent.tasks_in_flight += 1
+
+            if hasattr(tasks, "next"):
+                queued = tasks.next()
+                if queued is None:
+                    # Only cancelled or expired tasks were left
+                    if parallel:
+                        with self._task_lock:
+                            agent.tasks_in_flight -= 1
+                    break
+                task = queued.payload
+            else:
+                queued, task = None, tasks.pop(0)
+
+            if parallel:
+                try:
+                    future = self._submit_agent_task(agent_id, task)
+                except Exception as e:
+                    # E.g. the executor was shut down: put the task back and
+                    # free its slot so the agent does not look busy forever
+                    logger.error(f"Could not start task for agent {agent_id}: {e}")
+                    with self._task_lock:
+                        agent.tasks_in_flight -= 1
+                    if queued is not None:
+                        tasks.requeue(queued)
+                    else:
+                        tasks.insert(0, task)
+                    break
+                started += 1
+                future.add_done_callback(
+                    lambda f, queued=queued, task=task:
+                        self._on_agent_task_done(agent, queued, task, f)
+                )
+            else:
+                started += 1
+                # Execute task based on agent specialization
+                result = self._execute_agent_task(agent_id, task)
+                self._record_task_result(agent, queued, task, result)
+        return started
 
-        if agent.memory["active_tasks"]:
-            task = agent.memory["active_tasks"].pop(0)
+    def _submit_agent_task(self, agent_id: str, task: Any) -> Any:
+        """
+        Place a task on the pool matching its executor kind.
 
-            # Execute task based on agent specialization
-            result = self._execute_agent_task(agent_id, task)
+        Async executors run on the ASYNCIO runtime's loop (or a private loop
+        on the shared pool), CPU-bound ones on the CPU pool, and sync ones on
+        the shared pool.
 
-            # Store result and learning
-            agent.memory["interaction_history"].append({
-                "task": task,
-                "result": result,
-                "timestamp": datetime.now()
-            })
+        Returns:
+            concurrent.futures.Future of the task result
+        """
+        from vessels.a0.executors import ExecutorKind
+        spec = self.agents[agent_id].specification
+        kind = self.executor_registry.resolve(spec.specialization).kind
 
-            agent.memory["learned_patterns"].append({
-                "task_type": task.get("type"),
-                "success": result.get("success", False),
-                "approach": result.get("approach", "")
-            })
+        if kind == ExecutorKind.ASYNC:
+            coro = self._execute_agent_task_async(agent_id, task)
+            try:
+                if self.agent_runtime == AgentRuntime.ASYNCIO and self.scheduler.running:
+                    return self.scheduler.submit(coro)
+                return self.executor.submit(asyncio.run, coro)
+            except BaseException:
+                coro.close()
+                raise
+        if kind == ExecutorKind.CPU:
+            return self.cpu_executor.submit(self._execute_agent_task, agent_id, task)
+        return self.executor.submit(self._execute_agent_task, agent_id, task)
+
+    def _on_agent_task_done(self, agent: AgentInstance, queued: Optional[Any],
+                            task: Any, future: Any) -> None:
+        """Executor callback: record a finished task and wake its agent."""
+        if self.agent_runtime == AgentRuntime.ASYNCIO and self.scheduler.in_loop_thread():
+            # Tasks run on the loop finish there; recording can spill
+            # interaction history to disk, so do it on the default executor
+            try:
+                self.scheduler.loop.run_in_executor(
+                    None, self._finish_agent_task, agent, queued, task, future
+                )
+                return
+            except RuntimeError:
+                pass  # Executor already shut down: finish inline
+        self._finish_agent_task(agent, queued, task, future)
+
+    def _finish_agent_task(self, agent: AgentInstance, queued: Optional[Any],
+                           task: Any, future: Any) -> None:
+        """Record a finished task's result, free its slot and wake its agent."""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Task execution error for agent {agent.id}: {e}")
+            result = {"success": False, "error": str(e)}
+
+        with self._task_lock:
+            agent.tasks_in_flight -= 1
+        self._record_task_result(agent, queued, task, result)
+        self._touch_agent(agent)
+        # Start the next task or settle the agent back to idle
+        self._wake_agent(agent.id)
+
+    def _record_task_result(self, agent: AgentInstance, queued: Optional[Any],
+                            task: Any, result: Dict[str, Any]) -> None:
+        """Report a task outcome to its queue and store result and learning."""
+        if queued is not None:
+            agent.memory["active_tasks"].complete(queued, result.get("success", False))
+
+        # Store result and learning
+        record = {
+            "task": task,
+            "result": result,
+            "timestamp": datetime.now()
+        }
+        if queued is not None:
+            record["task_id"] = queued.task_id
+            record["attempt"] = queued.attempts
+        agent.memory["interaction_history"].append(record)
+
+        agent.memory["learned_patterns"].append({
+            "task_type": task.get("type"),
+            "success": result.get("success", False),
+            "approach": result.get("approach", "")
+        })
 
     def _execute_agent_task(self, agent_id: str, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute specific task for agent"""
@@ -2900,16 +3610,28 @@ class AgentZeroCore:
         result = {"success": False, "approach": spec.specialization}
 
         try:
-            if spec.specialization == "grant_discovery":
-                result = self._execute_grant_discovery_task(task)
-            elif spec.specialization == "grant_writing":
-                result = self._execute_grant_writing_task(task)
-            elif spec.specialization == "community_coordination":
-                result = self._execute_coordination_task(task)
-            elif spec.specialization == "elder_care":
-                result = self._execute_elder_care_task(task)
-            else:
-                result = self._execute_general_task(task)
+            outcome = self.executor_registry.resolve(spec.specialization).handler(task)
+            if inspect.isawaitable(outcome):
+                outcome = self._run_awaitable(outcome)
+            result = outcome
+
+        except Exception as e:
+            logger.error(f"Task execution error for agent {agent_id}: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    async def _execute_agent_task_async(self, agent_id: str, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Coroutine counterpart of _execute_agent_task for async executors"""
+        spec = self.agents[agent_id].specification
+
+        result = {"success": False, "approach": spec.specialization}
+
+        try:
+            outcome = self.executor_registry.resolve(spec.specialization).handler(task)
+            if inspect.isawaitable(outcome):
+                outcome = await outcome
+            result = outcome
 
         except Exception as e:
             logger.error(f"Task execution error for agent {agent_id}: {e}")
@@ -2917,6 +3639,52 @@ class AgentZeroCore:
 
         return result
 
+    @staticmethod
+    async def _await(awaitable: Any) -> Any:
+        return await awaitable
+
+    def _run_awaitable(self, awaitable: Any) -> Any:
+        """
+        Block on an async executor's result from synchronous code.
+
+        Runs on the calling thread's own loop. Never goes through
+        self.executor: the caller may be one of its workers, and with every
+        worker waiting here a nested submit would never run.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._await(awaitable))
+        # Already on a running loop (the ASYNCIO runtime's): use a private thread
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="a0-await") as pool:
+            return pool.submit(asyncio.run, self._await(awaitable)).result()
+
+    def _build_executor_registry(self, agent_definitions_dir: Optional[str] = None) -> Any:
+        """Register the built-in executors and load routes from agent definitions."""
+        from vessels.a0.executors import ExecutorRegistry
+        registry = ExecutorRegistry(default="general")
+        registry.register("grant_discovery", self._execute_grant_discovery_task)
+        registry.register("grant_writing", self._execute_grant_writing_task)
+        registry.register("elder_care", self._execute_elder_care_task)
+        registry.register_executor("coordination", self._execute_coordination_task)
+        registry.route("community_coordination", "coordination")
+        registry.register_executor("general", self._execute_general_task)
+        registry.load_agent_definitions(agent_definitions_dir)
+        return registry
+
+    def register_task_executor(self, specialization: str,
+                               handler: Callable[[Dict[str, Any]], Any],
+                               kind: Any = "sync") -> None:
+        """
+        Route a specialization's tasks to a custom handler.
+
+        Args:
+            specialization: Agent specialization
+            handler: handler(task) -> result dict; a coroutine function for kind "async"
+            kind: "sync", "async" or "cpu" (or an ExecutorKind)
+        """
+        self.executor_registry.register(specialization, handler, kind)
+
     def _execute_grant_discovery_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute grant discovery task"""
         # This would integrate with the grant coordination system
@@ -2971,20 +3739,153 @@ class AgentZeroCore:
 
         return f"Agent {spec.name} ({spec.specialization}) received query: {query}"
 
-    def send_message(self, agent_id: str, message: Dict[str, Any]):
-        """Send message to specific agent"""
-        if agent_id in self.agents:
-            self.agents[agent_id].message_queue.put(message)
+    def _agent_topics(self, agent: AgentInstance, vessel: Optional[Any] = None) -> List[str]:
+        """Bus topics an agent subscribes to when spawned."""
+        from vessels.a0.message_bus import ALL_TOPIC, topic
+        topics = [ALL_TOPIC, topic("specialization", agent.specification.specialization)]
+        if agent.vessel_id:
+            topics.append(topic("vessel", agent.vessel_id))
+        for community_id in getattr(vessel, "community_ids", None) or ():
+            topics.append(topic("community", community_id))
+        return topics
+
+    def send_message(self, agent_id: str, message: Dict[str, Any]) -> bool:
+        """
+        Send message to specific agent.
+
+        If the agent's mailbox is full and its policy rejects or drops the
+        message, an error message is bounced to the sender (if it is an agent).
+
+        Returns:
+            True if the message was delivered
+        """
+        from vessels.a0.mailbox import MailboxFullError
+        agent = self.agents.get(agent_id)
+        if agent is None:
+            return False
+        # Never block the asyncio runtime's loop thread waiting for space
+        block = not (self.agent_runtime == AgentRuntime.ASYNCIO
+                     and self.scheduler.in_loop_thread())
+        try:
+            agent.mailbox.put(message, block=block)
+        except MailboxFullError as e:
+            logger.warning(f"Message to agent {agent_id} rejected: {e}")
+            self._bounce_message(agent_id, message, str(e))
+            return False
+        self._wake_agent(agent_id)
+        return True
+
+    def cancel_task(self, agent_id: str, task_id: str) -> bool:
+        """
+        Cancel a pending task on an agent's task queue.
+
+        Returns:
+            True if the task was pending and is now cancelled
+        """
+        agent = self.agents.get(agent_id)
+        if agent is None or not task_id:
+            return False
+        tasks = self._get_active_tasks(agent)
+        if tasks is None or not hasattr(tasks, "cancel"):
+            return False
+        return tasks.cancel(task_id)
+
+    def _bounce_message(self, agent_id: str, message: Dict[str, Any], error: str) -> None:
+        """Return a mailbox error to the sender of an undeliverable message."""
+        from vessels.a0.mailbox import MailboxFullError
+        sender = self.agents.get(message.get("sender_id"))
+        if sender is None or message.get("type") == "error":
+            return
+        try:
+            sender.mailbox.put_nowait({
+                "type": "error",
+                "error": "mailbox_full",
+                "content": error,
+                "recipient_id": agent_id,
+                "sender_id": agent_id
+            })
+        except MailboxFullError:
+            return
+        self._wake_agent(sender.id)
+
+    def broadcast_message(self, message: Dict[str, Any], vessel_id: Optional[str] = None):
+        """
+        Broadcast message to all agents.
+
+        Args:
+            message: Message to deliver
+            vessel_id: Only deliver to agents in this vessel (default: all agents)
+        """
+        from vessels.a0.message_bus import ALL_TOPIC, topic
+        if vessel_id is None:
+            self.publish_message(ALL_TOPIC, message)
+        else:
+            self.publish_message(topic("vessel", vessel_id), message)
+
+    def publish_message(self, topic_name: str, message: Dict[str, Any]) -> Optional[int]:
+        """
+        Publish a message to a bus topic.
 
-    def broadcast_message(self, message: Dict[str, Any]):
-        """Broadcast message to all agents"""
-        for agent_id in self.agents:
-            self.send_message(agent_id, message)
+        The message is frozen and shared by all subscribers rather than
+        copied onto each agent's queue.
+
+        Args:
+            topic_name: "all", "vessel:<id>", "specialization:<name>" or "community:<id>"
+            message: Message to publish
+
+        Returns:
+            Sequence number of the message, or None if the topic has no subscribers
+        """
+        return self.message_bus.publish(topic_name, message)
+
+    def _on_bus_publish(self, topic_name: str, seq: int) -> None:
+        """
+        Bus listener: wake the topic's subscribers on event-driven runtimes.
+
+        O(1) for the publisher: the topic is only marked, and its
+        subscribers are resolved and woken by the scheduler.
+        """
+        self.scheduler.notify_group(topic_name)
+
+    def _task_stats(self, agent: AgentInstance) -> Optional[Dict[str, Any]]:
+        """Task queue counters for an agent, if it uses a TaskQueue."""
+        tasks = self._get_active_tasks(agent)
+        return tasks.get_stats() if hasattr(tasks, "get_stats") else None
+
+    def get_experience_writer_stats(self) -> Dict[str, Any]:
+        """Get buffered learned patterns and batch write counters."""
+        return self.experience_writer.get_stats()
+
+    def get_mailbox_stats(self) -> Dict[str, Any]:
+        """Get mailbox depth per agent plus totals for drops and rejections."""
+        by_agent = {agent.id: agent.mailbox.get_stats() for agent in self.agents.values()}
+        return {
+            "policy": self.mailbox_policy.value,
+            "maxsize": self.mailbox_size,
+            "batch": self.mailbox_batch,
+            "depth": sum(stats["depth"] for stats in by_agent.values()),
+            "dropped": sum(stats["dropped"] for stats in by_agent.values()),
+            "rejected": sum(stats["rejected"] for stats in by_agent.values()),
+            "by_agent": by_agent,
+        }
+
+    def get_message_bus_stats(self) -> Dict[str, Any]:
+        """Get message bus topics, counters and drops."""
+        return self.message_bus.get_stats()
+
+    def _wake_agent(self, agent_id: str) -> None:
+        """Schedule an agent cycle, or cut short a THREADS agent's idle pause."""
+        if self.scheduler:
+            self.scheduler.notify(agent_id)
+        else:
+            wakeup = self._thread_wakeups.get(agent_id)
+            if wakeup is not None:
+                wakeup.set()
 
     def get_agent_status(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """Get status of specific agent"""
-        if agent_id in self.agents:
-            agent = self.agents[agent_id]
+        agent = self.agents.get(agent_id)
+        if agent is not None:
             return {
                 "id": agent.id,
                 "name": agent.specification.name,
@@ -2992,65 +3893,110 @@ class AgentZeroCore:
                 "specialization": agent.specification.specialization,
                 "last_active": agent.last_active.isoformat(),
                 "active_tasks": len(agent.memory.get("active_tasks", [])),
-                "tools": agent.tools
+                "mailbox_depth": agent.mailbox.qsize(),
+                "task_queue": self._task_stats(agent),
+                "bus_lag": self.message_bus.lag(agent_id),
+                "tools": agent.tools,
+                "pool": self.agent_pool.describe(agent_id)
             }
         return None
 
-    def get_all_agents_status(self) -> List[Dict[str, Any]]:
-        """Get status of all agents"""
-        return [self.get_agent_status(agent_id) for agent_id in self.agents]
+    def get_all_agents_status(self, vessel_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get status of all agents, optionally only those in one vessel"""
+        if vessel_id is None:
+            agent_ids = self.agents.keys()
+        else:
+            agent_ids = self.agents.ids_in_vessel(vessel_id)
+        statuses = (self.get_agent_status(agent_id) for agent_id in agent_ids)
+        # Agents removed since the snapshot report None
+        return [status for status in statuses if status is not None]
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get agent pool occupancy, hit rate and eviction metrics."""
+        return self.agent_pool.get_stats()
+
+    def get_liveness_stats(self) -> Dict[str, Any]:
+        """Get counts of stalled, errored and restarted agents."""
+        return self.liveness.get_stats()
+
+    def get_runtime_stats(self) -> Dict[str, Any]:
+        """Get statistics for the agent runtime."""
+        return {
+            "agent_runtime": self.agent_runtime.value,
+            "agents": len(self.agents),
+            "scheduler": self.scheduler.get_stats() if self.scheduler else None,
+        }
 
     def _coordination_loop(self):
         """Main coordination system loop"""
         while self.running:
             try:
-                # Monitor agent health
-                self._monitor_agents()
-
-                # Optimize agent connections
-                self._optimize_connections()
-
-                # Handle system-level tasks
-                self._handle_system_tasks()
-
+                self._coordination_step()
             except Exception as e:
                 logger.error(f"Coordination loop error: {e}")
 
             threading.Event().wait(5)  # Coordination interval
 
-    def _monitor_agents(self):
-        """Monitor agent health and performance"""
-        for agent_id, agent in self.agents.items():
-            # Check if agent is responsive
-            time_since_active = (datetime.now() - agent.last_active).seconds
+    def _coordination_step(self):
+        """Run one coordination pass (thread loop or asyncio task)."""
+        # Monitor agent health
+        self._monitor_agents()
 
-            if time_since_active > 300 and agent.status != AgentStatus.IDLE:  # 5 minutes
-                logger.warning(f"Agent {agent_id} may be unresponsive")
+        # Handle system-level tasks
+        self._handle_system_tasks()
 
-            # Restart agents in error state
-            if agent.status == AgentStatus.ERROR:
-                logger.info(f"Restarting agent {agent_id}")
-                agent.status = AgentStatus.IDLE
+        # Evict pooled agents idle past their TTL
+        self._reap_pooled_agents()
 
-    def _optimize_connections(self):
-        """Optimize agent connections based on workload"""
-        # Simple connection optimization
-        for agent_id, agent in self.agents.items():
-            # Connect agents with complementary specializations
-            for other_id, other_agent in self.agents.items():
-                if agent_id != other_id:
-                    specs_differ = (
-                        agent.specification.specialization !=
-                        other_agent.specification.specialization
-                    )
-                    if specs_differ and other_id not in agent.connections:
-                        agent.connections.append(other_id)
+        # Periodic agent state snapshot
+        self._maybe_snapshot()
+
+    def _maybe_snapshot(self):
+        """Write a snapshot if snapshot_interval has elapsed since the last one."""
+        if not self.snapshot_path or self.snapshot_interval <= 0:
+            return
+        now = time.monotonic()
+        if now - self._last_snapshot < self.snapshot_interval:
+            return
+        self._last_snapshot = now
+        try:
+            self.save_snapshot()
+        except Exception as e:
+            logger.error(f"Snapshot failed: {e}")
+
+    def _reap_pooled_agents(self):
+        """Remove pooled agents that have been idle longer than the pool TTL."""
+        for agent_id in self.agent_pool.collect_expired(self._agent_idle_since):
+            self._remove_agent(agent_id)
+
+    def _monitor_agents(self):
+        """Monitor agent health: only agents past their deadline or in error"""
+        self.liveness.poll(self._on_agent_stall, self._on_agent_error)
+
+    def _on_agent_stall(self, agent_id: str) -> bool:
+        """Liveness callback: an agent has been inactive past the stall timeout."""
+        agent = self.agents.get(agent_id)
+        if agent is None or agent.status == AgentStatus.IDLE:
+            return False
+        logger.warning(f"Agent {agent_id} may be unresponsive")
+        return True
+
+    def _on_agent_error(self, agent_id: str) -> bool:
+        """Liveness callback: restart an agent that entered the error state."""
+        agent = self.agents.get(agent_id)
+        if agent is None or agent.status != AgentStatus.ERROR:
+            return False
+        logger.info(f"Restarting agent {agent_id}")
+        agent.status = AgentStatus.IDLE
+        self._wake_agent(agent_id)
+        return True
 
     def _handle_system_tasks(self):
         """Handle system-level coordination tasks"""
         # Distribute workload among agents
-        active_agents = [a for a in self.agents.values() if a.status == AgentStatus.ACTIVE]
-        idle_agents = [a for a in self.agents.values() if a.status == AgentStatus.IDLE]
+        agents = self.agents.values()
+        active_agents = [a for a in agents if a.status == AgentStatus.ACTIVE]
+        idle_agents = [a for a in agents if a.status == AgentStatus.IDLE]
 
         # Balance load if needed
         if len(active_agents) > len(idle_agents) * 2:
@@ -3219,6 +4165,7 @@ class AgentZeroCore:
                 )
                 agent.status = AgentStatus.ACTIVE
                 agent.active_consultation = None
+                self._wake_agent(agent_id)
                 return {
                     "success": True,
                     "message": "Precedent applied. Resuming action.",
@@ -3253,20 +4200,244 @@ class AgentZeroCore:
             )
             agent.status = AgentStatus.ACTIVE
             agent.active_consultation = None
+            self._wake_agent(agent_id)
             return {
                 "success": True,
                 "message": "Wisdom received. Action unblocked.",
                 "action": "resolved"
             }
 
+    def save_snapshot(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Snapshot agent state to a file for a later warm restart.
+
+        Captures each agent's specification, status, tools, pool membership,
+        pending mailbox messages, queued tasks, recent interaction history,
+        learned patterns and (if picklable) active consultation. Tasks
+        running at snapshot time are not captured. Connections and bus
+        subscriptions are rebuilt from specializations on restore.
+
+        Args:
+            path: Snapshot file (default: snapshot_path)
+
+        Returns:
+            Dict with path, agent count, size in bytes and seconds taken
+        """
+        from vessels.a0.snapshot import write_snapshot
+        path = path or self.snapshot_path
+        if not path:
+            raise ValueError("No snapshot path configured")
+
+        start = time.perf_counter()
+        records = [self._capture_agent(agent) for agent in self.agents.values()]
+        size = write_snapshot(path, {"agents": records})
+        elapsed = time.perf_counter() - start
+        logger.info(f"Snapshot of {len(records)} agents written to {path} "
+                    f"({size} bytes, {elapsed * 1000:.1f} ms)")
+        return {"path": path, "agents": len(records), "bytes": size, "seconds": elapsed}
+
+    def _capture_agent(self, agent: AgentInstance) -> Dict[str, Any]:
+        """Plain-data record of an agent for a snapshot."""
+        from vessels.a0.snapshot import thaw
+        record = {
+            "id": agent.id,
+            "specification": asdict(agent.specification),
+            "status": agent.status.value,
+            "created_at": agent.created_at,
+            "last_active": agent.last_active,
+            "vessel_id": agent.vessel_id,
+            "tools": list(agent.tools),
+            "pool_key": self.agent_pool.key_of(agent.id),
+            "messages": thaw(agent.mailbox.snapshot()),
+            "consultation": None,
+            "tasks": [],
+            "history": [],
+            "learned_patterns": [],
+        }
+
+        if agent.active_consultation is not None:
+            try:
+                record["consultation"] = pickle.dumps(agent.active_consultation, protocol=5)
+            except Exception as e:
+                logger.warning(f"Consultation of agent {agent.id} not snapshotted: {e}")
+
+        if isinstance(agent.memory, dict):
+            tasks = agent.memory.get("active_tasks")
+            if hasattr(tasks, "pending"):
+                record["tasks"] = [
+                    {
+                        "task_id": task.task_id,
+                        "payload": thaw(task.payload),
+                        "created_at": task.created_at,
+                        "deadline": task.deadline,
+                        "max_retries": task.max_retries,
+                        "attempts": task.attempts,
+                    }
+                    for task in tasks.pending()
+                ]
+            elif tasks:
+                record["tasks"] = [{"payload": thaw(task)} for task in tasks]
+            # Copies taken in one step: task threads may be appending
+            history = agent.memory.get("interaction_history", [])
+            record["history"] = thaw(history.recent() if hasattr(history, "recent") else list(history))
+            record["learned_patterns"] = thaw(list(agent.memory.get("learned_patterns", deque()).copy()))
+        return record
+
+    def restore_snapshot(self, path: Optional[str] = None) -> int:
+        """
+        Rebuild agents from a snapshot written by save_snapshot.
+
+        Agents are reconstructed directly, without spawn side effects such
+        as tool registry lookups; vessel-scoped gates and memory are
+        re-attached if the agent's vessel is in the registry. Agents whose
+        IDs already exist are skipped.
+
+        Args:
+            path: Snapshot file (default: snapshot_path)
+
+        Returns:
+            Number of agents restored
+
+        Raises:
+            SnapshotError: The snapshot is unreadable, from another version or
+                holds a malformed agent record (no agents are restored then)
+        """
+        from vessels.a0.snapshot import SnapshotError, read_snapshot
+        path = path or self.snapshot_path
+        if not path:
+            raise ValueError("No snapshot path configured")
+
+        start = time.perf_counter()
+        snapshot = read_snapshot(path)
+        restored: List[AgentInstance] = []
+        try:
+            for record in snapshot["state"]["agents"]:
+                if record["id"] not in self.agents:
+                    restored.append(self._restore_agent(record))
+        except Exception as e:
+            # All or nothing: a caller falling back to a cold start must not
+            # be left with part of the snapshot's agents
+            for agent in restored:
+                self._remove_agent(agent.id)
+            raise SnapshotError(f"Malformed agent record in {path}: {e!r}") from e
+
+        # Rebuild connections in one pass rather than agent by agent
+        connections = self.specialization_graph.add_many(
+            (agent.id, agent.specification.specialization) for agent in restored
+        )
+        for agent in restored:
+            agent.connections = connections[agent.id]
+
+        if self.scheduler and self.scheduler.running:
+            self.scheduler.notify_many(agent.id for agent in restored)
+
+        logger.info(f"Restored {len(restored)} agents from {path} in "
+                    f"{(time.perf_counter() - start) * 1000:.1f} ms")
+        return len(restored)
+
+    def _restore_agent(self, record: Dict[str, Any]) -> AgentInstance:
+        """
+        Rebuild one agent from a snapshot record and register it (unconnected).
+
+        Everything is parsed before the agent is registered, so a malformed
+        record raises without leaving a partial agent behind.
+        """
+        from vessels.a0.mailbox import MailboxFullError
+        from vessels.a0.tasks import AgentTask
+
+        specification = AgentSpecification(**record["specification"])
+        pool_key = tuple(record["pool_key"]) if record["pool_key"] is not None else None
+        vessel = None
+        if record["vessel_id"] and self.vessel_registry:
+            vessel = self.vessel_registry.get_vessel(record["vessel_id"])
+            if not vessel:
+                logger.warning(f"Vessel {record['vessel_id']} of agent {record['id']} "
+                               f"not in registry; restoring with fallback resources")
+        memory_backend = vessel.memory_backend if vessel else self.memory_system
+
+        status = AgentStatus(record["status"])
+        if status in (AgentStatus.ACTIVE, AgentStatus.PROCESSING):
+            status = AgentStatus.IDLE  # Work resumes from the restored queues
+
+        agent = AgentInstance(
+            id=record["id"],
+            specification=specification,
+            status=status,
+            created_at=record["created_at"],
+            last_active=record["last_active"],
+            vessel_id=record["vessel_id"],
+            action_gate=vessel.action_gate if vessel else self.gate,
+            memory_backend=memory_backend,
+            tools=list(record["tools"]),
+            mailbox=_new_mailbox(maxsize=self.mailbox_size, policy=self.mailbox_policy)
+        )
+        agent.memory = self._new_agent_memory(agent.id, specification, memory_backend)
+
+        if isinstance(agent.memory, dict):
+            tasks = agent.memory["active_tasks"]
+            tasks.restore(AgentTask(**task) for task in record["tasks"] if "task_id" in task)
+            for task in record["tasks"]:
+                if "task_id" not in task:
+                    tasks.append(task["payload"])
+            for entry in record["history"]:
+                agent.memory["interaction_history"].append(entry)
+            agent.memory["learned_patterns"].extend(record["learned_patterns"])
+
+        for message in record["messages"]:
+            try:
+                agent.mailbox.put_nowait(message)
+            except MailboxFullError:
+                logger.warning(f"Mailbox of restored agent {agent.id} full; message dropped")
+                break
+
+        if record["consultation"] is not None:
+            agent.active_consultation = pickle.loads(record["consultation"])
+
+        self._register_agent(agent, vessel, connect=False)
+        if pool_key is not None:
+            self.agent_pool.add(pool_key, agent.id)
+        return agent
+
     def shutdown(self):
         """Shutdown the coordination system"""
         self.running = False
+        if self.scheduler:
+            self.scheduler.stop()
         if self.coordination_thread:
             self.coordination_thread.join(timeout=10)
         self.executor.shutdown(wait=True)
+        self.cpu_executor.shutdown(wait=True)
+        if self.snapshot_path:
+            try:
+                self.save_snapshot()
+            except Exception as e:
+                logger.error(f"Final snapshot failed: {e}")
+        self.experience_writer.stop()
+        # Persist buffered interaction history spills
+        for agent in self.agents.values():
+            if isinstance(agent.memory, dict):
+                history = agent.memory.get("interaction_history")
+                if hasattr(history, "flush"):
+                    history.flush()
         logger.info("Agent Zero Core shutdown complete")
 
 
-# Global instance for easy access
-agent_zero = AgentZeroCore()
+_agent_zero: Optional[AgentZeroCore] = None
+_agent_zero_lock = threading.Lock()
+
+
+def get_agent_zero() -> AgentZeroCore:
+    """Shared AgentZeroCore, created on first call rather than at import."""
+    global _agent_zero
+    if _agent_zero is None:
+        with _agent_zero_lock:
+            if _agent_zero is None:
+                _agent_zero = AgentZeroCore()
+    return _agent_zero
+
+
+def __getattr__(name: str) -> Any:
+    # Backward compatibility: `from agent_zero_core import agent_zero`
+    if name == "agent_zero":
+        return get_agent_zero()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
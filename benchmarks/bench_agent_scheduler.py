@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-agent polling threads vs the event-driven agent runtimes
+(bounded scheduler pool and single asyncio loop).
+
+Spawns N agents under each AgentRuntime, sends one message per agent
+(round-robin up to --messages) and reports messages/sec, p50/p99 dispatch
+latency (send_message -> _process_agent_message) and OS thread count.
+
+Usage:
+    python benchmarks/bench_agent_scheduler.py
+    python benchmarks/bench_agent_scheduler.py --sizes 100 1000 --messages 5000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_zero_core import AgentZeroCore, AgentRuntime, AgentSpecification  # noqa: E402
+from vessels.latency import percentile  # noqa: E402
+
+
+class _BenchCore(AgentZeroCore):
+    """AgentZeroCore that records dispatch latency of benchmark messages."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.latencies: List[float] = []
+
+    def _process_agent_message(self, agent_id: str, message: Dict[str, Any]):
+        if message.get("type") == "bench":
+            self.latencies.append(time.perf_counter() - message["sent_at"])
+            return
+        super()._process_agent_message(agent_id, message)
+
+
+def run_case(runtime: AgentRuntime, n_agents: int, n_messages: int,
+             workers: int, timeout: float) -> Dict[str, Any]:
+    baseline_threads = threading.active_count()
+    core = _BenchCore(agent_runtime=runtime, scheduler_workers=workers)
+    # Start agent processing without the coordination loop so the benchmark
+    # only measures message dispatch.
+    core.running = True
+    if core.scheduler:
+        core.scheduler.start()
+
+    spec = AgentSpecification(
+        name="BenchAgent",
+        description="Benchmark agent",
+        capabilities=[],
+        tools_needed=[],
+    )
+    agent_ids = core.spawn_agents([spec] * n_agents)
+    threads = threading.active_count() - baseline_threads
+
+    start = time.perf_counter()
+    for i in range(n_messages):
+        core.send_message(agent_ids[i % n_agents], {
+            "type": "bench",
+            "sent_at": time.perf_counter(),
+        })
+
+    deadline = start + timeout
+    while len(core.latencies) < n_messages and time.perf_counter() < deadline:
+        time.sleep(0.005)
+    elapsed = time.perf_counter() - start
+
+    processed = len(core.latencies)
+    core.shutdown()
+    # Let polling threads notice shutdown before the next case starts
+    settle_deadline = time.perf_counter() + 2.0
+    while threading.active_count() > baseline_threads and time.perf_counter() < settle_deadline:
+        time.sleep(0.05)
+
+    return {
+        "runtime": runtime.value,
+        "agents": n_agents,
+        "messages": processed,
+        "threads": threads,
+        "msgs_per_sec": processed / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(core.latencies, 50) * 1000,
+        "p99_ms": percentile(core.latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument(
+        "--runtimes", nargs="+", default=[r.value for r in AgentRuntime],
+        choices=[r.value for r in AgentRuntime],
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    header = f"{'runtime':<10} {'agents':>7} {'msgs':>7} {'threads':>8} {'msgs/s':>10} {'p50 ms':>9} {'p99 ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        for runtime in args.runtimes:
+            r = run_case(AgentRuntime(runtime), size, args.messages, args.workers, args.timeout)
+            print(
+                f"{r['runtime']:<10} {r['agents']:>7} {r['messages']:>7} {r['threads']:>8} "
+                f"{r['msgs_per_sec']:>10.0f} {r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
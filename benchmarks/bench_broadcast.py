@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark: publisher cost and memory of broadcasting to N agents.
+
+Compares the original broadcast (one queue.Queue put per agent) with a
+publish to the MessageBus "all" topic, which appends one shared frozen
+message to a ring buffer.
+
+The bus is timed bare and inside an AgentZeroCore, whose bus listener
+wakes the subscribers on the event-driven runtimes (--runtime). "eager
+listener" is the listener that copied the subscriber list and notified
+every agent on each publish; "core" is the current one, which only marks
+the topic for the scheduler. Core timings are the publisher's cost only;
+the scheduler's workers fan the wakeup out meanwhile.
+
+Usage:
+    python benchmarks/bench_broadcast.py
+    python benchmarks/bench_broadcast.py --agents 1000 10000 --messages 200
+    python benchmarks/bench_broadcast.py --runtime asyncio
+"""
+
+import argparse
+import logging
+import os
+import queue
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_zero_core import AgentRuntime, AgentZeroCore  # noqa: E402
+from vessels.a0.message_bus import ALL_TOPIC, MessageBus  # noqa: E402
+
+
+def make_message(i: int) -> dict:
+    return {"type": "system", "content": {"notice": "community update", "seq": i}}
+
+
+def bench_queues(n_agents: int, n_messages: int):
+    queues = [queue.Queue() for _ in range(n_agents)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(n_messages):
+        message = make_message(i)
+        for q in queues:
+            q.put(dict(message))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / n_messages, peak
+
+
+def bench_bus(n_agents: int, n_messages: int):
+    bus = MessageBus()
+    for i in range(n_agents):
+        bus.subscribe(f"agent-{i}", [ALL_TOPIC])
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(n_messages):
+        bus.publish(ALL_TOPIC, make_message(i))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / n_messages, peak
+
+
+def bench_core(n_agents: int, n_messages: int, runtime: AgentRuntime, eager: bool = False):
+    core = AgentZeroCore(agent_runtime=runtime)
+    bus, scheduler = core.message_bus, core.scheduler
+    if eager:
+        bus._listeners = [lambda name, seq: scheduler.notify_many(bus.subscribers(name))]
+    # Subscribers are bare IDs: their cycles find no agent and return at once
+    for i in range(n_agents):
+        bus.subscribe(f"agent-{i}", [ALL_TOPIC])
+    scheduler.start()
+    try:
+        start = time.perf_counter()
+        for i in range(n_messages):
+            core.publish_message(ALL_TOPIC, make_message(i))
+        elapsed = time.perf_counter() - start
+    finally:
+        scheduler.stop()
+        core.experience_writer.stop()
+    return elapsed / n_messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agents", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--messages", type=int, default=100)
+    parser.add_argument("--runtime", choices=["scheduler", "asyncio"], default="scheduler",
+                        help="Event-driven runtime for the core columns")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    runtime = AgentRuntime(args.runtime)
+
+    header = (f"{'agents':>7} {'queues us/msg':>14} {'queues peak KB':>15} "
+              f"{'bus us/msg':>11} {'bus peak KB':>12} {'eager listener us/msg':>22} "
+              f"{'core us/msg':>12}")
+    print(header)
+    print("-" * len(header))
+    for n_agents in args.agents:
+        q_time, q_peak = bench_queues(n_agents, args.messages)
+        b_time, b_peak = bench_bus(n_agents, args.messages)
+        eager_time = bench_core(n_agents, args.messages, runtime, eager=True)
+        core_time = bench_core(n_agents, args.messages, runtime)
+        print(f"{n_agents:>7} {q_time * 1e6:>14.1f} {q_peak / 1024:>15.0f} "
+              f"{b_time * 1e6:>11.1f} {b_peak / 1024:>12.0f} {eager_time * 1e6:>22.1f} "
+              f"{core_time * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
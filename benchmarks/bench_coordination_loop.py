@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: coordination-loop time against agent count.
+
+Compares one pass of the original coordination step (monitor + nested-loop
+connection rebuild over list-based connections + system tasks) with
+AgentZeroCore._coordination_step, where connections are maintained
+incrementally by the specialization graph at spawn time.
+
+Usage:
+    python benchmarks/bench_coordination_loop.py
+    python benchmarks/bench_coordination_loop.py --sizes 500 1000 2000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_zero_core import AgentZeroCore, AgentRuntime, AgentSpecification  # noqa: E402
+
+SPECIALIZATIONS = [
+    "grant_discovery", "grant_writing", "volunteer_coordination",
+    "elder_care", "community_coordination", "resource_management",
+]
+
+
+def legacy_optimize_connections(core: AgentZeroCore, connections: Dict[str, List[str]]) -> None:
+    """The original O(n^2 * k) _optimize_connections over list connections."""
+    for agent_id, agent in core.agents.items():
+        agent_connections = connections[agent_id]
+        for other_id, other_agent in core.agents.items():
+            if agent_id != other_id:
+                specs_differ = (
+                    agent.specification.specialization !=
+                    other_agent.specification.specialization
+                )
+                if specs_differ and other_id not in agent_connections:
+                    agent_connections.append(other_id)
+
+
+def build_core(n_agents: int) -> Tuple[AgentZeroCore, float]:
+    # Scheduler runtime that is never started: agents exist but never run
+    core = AgentZeroCore(agent_runtime=AgentRuntime.SCHEDULER)
+    specs = [
+        AgentSpecification(
+            name=f"{spec}_agent", description="", capabilities=[],
+            tools_needed=[], specialization=spec,
+        )
+        for spec in SPECIALIZATIONS
+    ]
+    start = time.perf_counter()
+    core.spawn_agents([specs[i % len(specs)] for i in range(n_agents)])
+    return core, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    header = (f"{'agents':>7} {'legacy 1st ms':>14} {'legacy steady ms':>17} "
+              f"{'indexed ms':>11} {'spawn us/agent':>15}")
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        core, spawn_time = build_core(size)
+        connections = {agent_id: [] for agent_id in core.agents}
+
+        start = time.perf_counter()
+        core._monitor_agents()
+        legacy_optimize_connections(core, connections)
+        core._handle_system_tasks()
+        legacy_first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        core._monitor_agents()
+        legacy_optimize_connections(core, connections)
+        core._handle_system_tasks()
+        legacy_steady = time.perf_counter() - start
+
+        start = time.perf_counter()
+        core._coordination_step()
+        indexed = time.perf_counter() - start
+
+        # Sanity check: both approaches produce the same graph
+        for agent_id, agent in core.agents.items():
+            assert agent.connections == set(connections[agent_id])
+
+        print(f"{size:>7} {legacy_first * 1000:>14.1f} {legacy_steady * 1000:>17.1f} "
+              f"{indexed * 1000:>11.2f} {spawn_time / size * 1e6:>15.1f}")
+        core.shutdown()
+
+
+if __name__ == "__main__":
+    main()
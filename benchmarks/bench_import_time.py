@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: import time of the CLI entry points (python -X importtime).
+
+Each module is imported in a fresh interpreter with -X importtime and the
+cumulative time of its top-level import is reported, with the slowest
+modules it pulls in. With --baseline, the same measurements are taken on
+a git ref (extracted to a temporary directory) for comparison, e.g. the
+commit before import-time singletons were made lazy.
+
+Usage:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --baseline HEAD~1 --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_MODULES = ["main", "vessels_cli", "vessels_interface", "agent_zero_core", "community_memory"]
+
+
+def import_times(root: str, module: str) -> Optional[List[Tuple[str, int, int]]]:
+    """(name, self us, cumulative us) for each import, or None if the import failed."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return None
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times.append((name.strip(), int(self_us), int(cumulative_us)))
+    return times
+
+
+def measure(root: str, module: str, runs: int) -> Tuple[Optional[float], List[Tuple[str, int]]]:
+    """Median cumulative import time in ms and the slowest imports of one run."""
+    totals = []
+    slowest: List[Tuple[str, int]] = []
+    for _ in range(runs):
+        times = import_times(root, module)
+        if times is None:
+            return None, []
+        totals.append(next(c for name, _, c in reversed(times) if name == module) / 1000)
+        slowest = sorted(((name, s) for name, s, _ in times), key=lambda t: -t[1])[:3]
+    return statistics.median(totals), slowest
+
+
+def extract(ref: str, directory: str) -> str:
+    archive = subprocess.run(["git", "archive", ref], cwd=REPO_ROOT, check=True,
+                             capture_output=True).stdout
+    subprocess.run(["tar", "-x", "-C", directory], input=archive, check=True)
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per module")
+    parser.add_argument("--baseline", help="Git ref to compare against")
+    parser.add_argument("--modules", nargs="+", default=ENTRY_MODULES)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        baseline_root = extract(args.baseline, directory) if args.baseline else None
+
+        header = f"{'module':>18} {'import ms':>10}"
+        if baseline_root:
+            header += f" {'baseline ms':>12} {'speedup':>8}"
+        header += "  slowest imports (self ms)"
+        print(header)
+        print("-" * len(header))
+
+        for module in args.modules:
+            current, slowest = measure(REPO_ROOT, module, args.runs)
+            row = f"{module:>18} " + (f"{current:>10.1f}" if current is not None else f"{'error':>10}")
+            if baseline_root:
+                baseline, _ = measure(baseline_root, module, args.runs)
+                row += f" {baseline:>12.1f}" if baseline is not None else f" {'error':>12}"
+                if current and baseline:
+                    row += f" {baseline / current:>7.1f}x"
+                else:
+                    row += f" {'-':>8}"
+            row += "  " + ", ".join(f"{name} {us / 1000:.1f}" for name, us in slowest)
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-pattern re.search loop vs the precompiled IntentEngine.
+
+Builds a synthetic corpus of user requests (a mix of matching and
+non-matching text), runs both matchers over it with the patterns from
+config/intent_config.json and reports requests/sec. Matcher correctness
+is covered by tests/test_intents.py.
+
+Usage:
+    python benchmarks/bench_intent_matching.py
+    python benchmarks/bench_intent_matching.py --requests 100000 --seed 7
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vessels.a0.intents import DEFAULT_INTENT_CONFIG, IntentEngine  # noqa: E402
+
+PHRASES = [
+    "find a grant for our elder care program",
+    "search for funding sources in puna",
+    "can you write a grant application for the food bank",
+    "help me coordinate volunteers for saturday",
+    "we need senior care services near hilo",
+    "organize a community event at the park",
+    "manage resources for the shelter and track inventory",
+    "draft a proposal for the youth garden",
+    "what is the weather like today",
+    "tell me about the history of the ahupuaa",
+    "schedule a meeting with the board next week",
+    "thank you so much for your help",
+]
+
+FILLER = [
+    "please", "urgently", "for the ohana", "this month", "if possible",
+    "with the kupuna", "before the deadline", "and keep me posted",
+]
+
+
+def legacy_detect(intent_patterns: Dict[str, List[str]], request: str) -> List[str]:
+    """The original AgentZeroCore._detect_intents loop."""
+    detected = []
+    request_lower = request.lower()
+
+    for intent, patterns in intent_patterns.items():
+        for pattern in patterns:
+            if re.search(pattern, request_lower, re.IGNORECASE):
+                if intent not in detected:
+                    detected.append(intent)
+                break
+
+    return detected
+
+
+def build_corpus(size: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        words = [rng.choice(PHRASES)]
+        for _ in range(rng.randint(0, 3)):
+            words.append(rng.choice(FILLER))
+        if rng.random() < 0.2:
+            words.append(rng.choice(PHRASES))
+        corpus.append(" ".join(words).capitalize())
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    engine = IntentEngine(config_path=DEFAULT_INTENT_CONFIG, reload_interval=0)
+    patterns = engine.patterns
+    corpus = build_corpus(args.requests, args.seed)
+
+    start = time.perf_counter()
+    for text in corpus:
+        legacy_detect(patterns, text)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in corpus:
+        engine.detect(text)
+    engine_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine.detect_many(corpus)
+    batch_time = time.perf_counter() - start
+
+    print(f"corpus: {len(corpus)} requests, {sum(len(p) for p in patterns.values())} patterns")
+    print(f"{'matcher':<22} {'seconds':>9} {'req/s':>12} {'speedup':>8}")
+    for name, elapsed in (
+        ("per-pattern loop", legacy_time),
+        ("IntentEngine.detect", engine_time),
+        ("IntentEngine.detect_many", batch_time),
+    ):
+        print(f"{name:<22} {elapsed:>9.3f} {len(corpus) / elapsed:>12.0f} {legacy_time / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
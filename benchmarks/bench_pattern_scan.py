@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: forbidden-pattern scanning of large SSF payloads.
+
+Compares, for the forbidden patterns of the builtin SSFs:
+
+- legacy: what SSFRuntime did before PatternScanner, one search per
+  pattern over str(data)
+- scanner: PatternScanner.search(data), walking keys and string leaves
+
+on two payload shapes of each --sizes megabytes:
+
+- page: a fetch_url_content output, the size in one content string
+- records: a list of small dicts with short string fields
+
+Latency is the mean of --iterations clean scans (no match, so every
+pattern is searched over everything). Peak memory is measured separately
+with tracemalloc and is the allocation on top of the payload itself.
+
+Usage:
+    python benchmarks/bench_pattern_scan.py
+    python benchmarks/bench_pattern_scan.py --sizes 1 10 --iterations 3
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vessels.ssf import SSFRegistry  # noqa: E402
+from vessels.ssf.builtins import register_all_builtins  # noqa: E402
+from vessels.ssf.plan import compile_patterns  # noqa: E402
+from vessels.ssf.scanner import PatternScanner  # noqa: E402
+
+MB = 1024 * 1024
+
+
+def legacy_search(patterns: List[Tuple[str, Any]], data: Any) -> Optional[str]:
+    """SSFRuntime._validate_against_manifold's pattern check, as it was."""
+    data_str = str(data)
+    for pattern, regex in patterns:
+        if regex.search(data_str):
+            return pattern
+    return None
+
+
+def page(size: int) -> dict:
+    body = "community garden update\n" * (size // 24)
+    return {"status": "success", "url": "https://example.org/garden", "content": body,
+            "content_type": "text/html", "length": len(body)}
+
+
+def records(size: int) -> list:
+    record = {"name": "community garden", "plot": "north bed 4", "status": "watered today"}
+    per_record = sum(len(k) + len(v) for k, v in record.items())
+    return [dict(record, plot=f"north bed {i}") for i in range(size // per_record)]
+
+
+def mean_ms(iterations: int, call: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def peak_mb(call: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / MB
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 10], help="Payload sizes in MB")
+    parser.add_argument("--iterations", type=int, default=3, help="Scans per measurement")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    registry = SSFRegistry()
+    asyncio.run(register_all_builtins(registry))
+    sources = sorted({
+        pattern
+        for ssf in registry.list_all()
+        for pattern in (ssf.constraint_binding.forbidden_input_patterns
+                        + ssf.constraint_binding.forbidden_output_patterns)
+    })
+    patterns, _ = compile_patterns(sources)
+    scanner = PatternScanner(patterns)
+    print(f"{len(patterns)} forbidden patterns from the builtin SSFs\n")
+
+    header = (f"{'payload':>8} {'MB':>5} {'legacy ms':>10} {'scanner ms':>11} {'speedup':>8} "
+              f"{'legacy peak MB':>15} {'scanner peak MB':>16}")
+    print(header)
+    print("-" * len(header))
+    for megabytes in args.sizes:
+        for name, build in (("page", page), ("records", records)):
+            data = build(int(megabytes * MB))
+            assert legacy_search(patterns, data) is None and scanner.search(data) is None
+            legacy = mean_ms(args.iterations, lambda: legacy_search(patterns, data))
+            scanned = mean_ms(args.iterations, lambda: scanner.search(data))
+            legacy_peak = peak_mb(lambda: legacy_search(patterns, data))
+            scanner_peak = peak_mb(lambda: scanner.search(data))
+            print(f"{name:>8} {megabytes:>5g} {legacy:>10.1f} {scanned:>11.1f} "
+                  f"{legacy / scanned:>7.1f}x {legacy_peak:>15.2f} {scanner_peak:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
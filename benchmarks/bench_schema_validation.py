@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compiled SSF schema validators vs the per-call schema walk.
+
+For every builtin SSF, a valid sample is generated from its input schema
+(and output schema) and validated repeatedly:
+
+- legacy: the loop SSFRuntime used before compiled contracts, which
+  walks "properties"/"required" from the raw dict on each call and only
+  checks top-level types
+- compiled: compile_schema(schema).first_error(), as the runtime now
+  calls it (nested objects, arrays and enums included)
+
+Compile time is reported separately; the runtime pays it once per SSF.
+
+A second table validates fetch_url_content outputs whose page body is
+--payload-mb megabytes, against what serializing the output first
+(json.dumps) would cost. The compiled validator checks the body's type
+without reading it, so its time does not grow with the payload.
+
+Usage:
+    python benchmarks/bench_schema_validation.py
+    python benchmarks/bench_schema_validation.py --iterations 50000
+    python benchmarks/bench_schema_validation.py --payload-mb 1 10 50
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vessels.ssf import SSFRegistry  # noqa: E402
+from vessels.ssf.builtins import register_all_builtins  # noqa: E402
+from vessels.ssf.contracts import SchemaValidator, compile_schema  # noqa: E402
+
+
+def legacy_validate(schema: Dict[str, Any], inputs: Dict[str, Any]) -> Optional[str]:
+    """SSFRuntime._validate_input_schema and _check_type, as they were."""
+    if not schema:
+        return None
+
+    def check_type(value, expected_type):
+        type_mapping = {
+            "string": str,
+            "number": (int, float),
+            "integer": int,
+            "boolean": bool,
+            "array": list,
+            "object": dict,
+            "null": type(None),
+        }
+        expected = type_mapping.get(expected_type)
+        if expected:
+            return isinstance(value, expected)
+        return True
+
+    try:
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        for field_name in required:
+            if field_name not in inputs:
+                return f"Missing required field: {field_name}"
+        if not schema.get("additionalProperties", True):
+            for key in inputs:
+                if key not in properties:
+                    return f"Unknown field: {key}"
+        for key, value in inputs.items():
+            if key in properties:
+                expected_type = properties[key].get("type")
+                if expected_type and not check_type(value, expected_type):
+                    return f"Field {key} has wrong type, expected {expected_type}"
+        return None
+    except Exception as e:
+        return f"Schema validation error: {str(e)}"
+
+
+SAMPLES = {
+    "string": "community garden",
+    "integer": 3,
+    "number": 2.5,
+    "boolean": True,
+    "null": None,
+}
+
+
+def sample(schema: Dict[str, Any]) -> Any:
+    """A value that satisfies the schema (all properties filled in)."""
+    if "default" in schema:
+        return schema["default"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = kind[0]
+    if kind == "object" or "properties" in schema:
+        return {key: sample(prop) for key, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [sample(schema.get("items", {})) for _ in range(3)]
+    return SAMPLES.get(kind, "value")
+
+
+def per_call_us(iterations: int, call) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=20000, help="Validations per schema")
+    parser.add_argument("--payload-mb", type=float, nargs="+", default=[1, 10],
+                        help="Page body sizes for the large-output table")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    registry = SSFRegistry()
+    asyncio.run(register_all_builtins(registry))
+    ssfs = sorted(registry.list_all(), key=lambda ssf: ssf.name)
+
+    header = (f"{'ssf':>26} {'schema':>7} {'compile us':>11} {'legacy us':>10} "
+              f"{'compiled us':>12} {'speedup':>8}")
+    print(header)
+    print("-" * len(header))
+    totals = {"input": [0.0, 0.0], "output": [0.0, 0.0]}
+    for ssf in ssfs:
+        for kind, schema in (("input", ssf.input_schema), ("output", ssf.output_schema)):
+            if not schema:
+                continue
+            value = sample(schema)
+            assert compile_schema(schema).first_error(value) is None, (ssf.name, kind)
+            compile_us = per_call_us(200, lambda: SchemaValidator(schema))
+            validator = compile_schema(schema)
+            legacy = per_call_us(args.iterations, lambda: legacy_validate(schema, value))
+            compiled = per_call_us(args.iterations, lambda: validator.first_error(value))
+            totals[kind][0] += legacy
+            totals[kind][1] += compiled
+            print(f"{ssf.name:>26} {kind:>7} {compile_us:>11.1f} {legacy:>10.2f} "
+                  f"{compiled:>12.2f} {legacy / compiled:>7.1f}x")
+    print("-" * len(header))
+    for kind, (legacy, compiled) in totals.items():
+        print(f"{'total':>26} {kind:>7} {'':>11} {legacy:>10.2f} {compiled:>12.2f} "
+              f"{legacy / compiled:>7.1f}x")
+
+    fetch = next(ssf for ssf in ssfs if ssf.name == "fetch_url_content")
+    validator = compile_schema(fetch.output_schema)
+    header = f"\n{'payload MB':>10} {'validate us':>12} {'json.dumps us':>14}"
+    print(header)
+    print("-" * (len(header) - 1))
+    for megabytes in args.payload_mb:
+        body = "community garden update\n" * int(megabytes * 1024 * 1024 / 24)
+        output = {"status": "success", "url": "https://example.org", "content": body,
+                  "content_type": "text/html", "length": len(body)}
+        assert validator.first_error(output) is None
+        validate = per_call_us(args.iterations, lambda: validator.first_error(output))
+        dumps = per_call_us(5, lambda: json.dumps(output))
+        print(f"{megabytes:>10g} {validate:>12.2f} {dumps:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
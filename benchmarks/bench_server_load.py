@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Load test: requests/sec and latency percentiles of the Vessels server.
+
+Starts a local vessels_server.py on a free port (or targets --url) and
+drives POST /requests over keep-alive HTTP connections and over
+multiplexed WebSocket connections, where each connection keeps
+--pipeline requests in flight at once.
+
+Usage:
+    python benchmarks/bench_server_load.py
+    python benchmarks/bench_server_load.py --requests 5000 --connections 32 --pipeline 8
+    python benchmarks/bench_server_load.py --url http://localhost:5000 --modes ws
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+import aiohttp
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from vessels.latency import percentile  # noqa: E402
+
+REQUESTS = [
+    "find grants for elder care programs",
+    "coordinate volunteers for the food bank",
+    "manage resource inventory for the shelter",
+    "organize a community event",
+]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.get(f"{url}/health") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Server at {url} did not become ready")
+            await asyncio.sleep(0.2)
+
+
+async def run_http(url: str, total: int, connections: int) -> Tuple[List[float], int]:
+    """Each connection sends requests back to back over one keep-alive socket."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def client(session: aiohttp.ClientSession):
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                async with session.post(f"{url}/requests",
+                                        json={"input": REQUESTS[i % len(REQUESTS)],
+                                              "user_id": "load"}) as response:
+                    await response.read()
+                    errors += response.status != 200
+            except aiohttp.ClientError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    connector = aiohttp.TCPConnector(limit=connections)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*(client(session) for _ in range(connections)))
+    return latencies, errors
+
+
+async def run_ws(url: str, total: int, connections: int, pipeline: int) -> Tuple[List[float], int]:
+    """Each connection keeps `pipeline` requests in flight, matched by id."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+    ws_url = url.replace("http", "ws", 1) + "/ws"
+
+    async def client(session: aiohttp.ClientSession):
+        nonlocal errors
+        async with session.ws_connect(ws_url) as ws:
+            sent = {}
+
+            async def send_next() -> bool:
+                i = next(counter, None)
+                if i is None:
+                    return False
+                sent[i] = time.perf_counter()
+                await ws.send_str(json.dumps({
+                    "id": i, "type": "request",
+                    "input": REQUESTS[i % len(REQUESTS)], "user_id": "load",
+                }))
+                return True
+
+            for _ in range(pipeline):
+                if not await send_next():
+                    break
+            while sent:
+                msg = await ws.receive()
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    errors += len(sent)
+                    return
+                reply = json.loads(msg.data)
+                latencies.append(time.perf_counter() - sent.pop(reply["id"]))
+                errors += not reply.get("ok")
+                await send_next()
+
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(*(client(session) for _ in range(connections)))
+    return latencies, errors
+
+
+async def run(args) -> None:
+    server = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(REPO_ROOT, "vessels_server.py"),
+             "--host", "127.0.0.1", "--port", str(port),
+             "--max-concurrency", str(args.max_concurrency)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+    try:
+        await wait_ready(url)
+        # Warm up pooled agents so the first measured requests do not spawn
+        await run_http(url, len(REQUESTS) * 2, 1)
+
+        header = (f"{'mode':>6} {'conns':>6} {'pipeline':>9} {'requests':>9} {'errors':>7} "
+                  f"{'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        print(header)
+        print("-" * len(header))
+        for mode in args.modes:
+            start = time.perf_counter()
+            if mode == "http":
+                latencies, errors = await run_http(url, args.requests, args.connections)
+                pipeline = 1
+            else:
+                latencies, errors = await run_ws(url, args.requests, args.connections, args.pipeline)
+                pipeline = args.pipeline
+            elapsed = time.perf_counter() - start
+            ms = [latency * 1000 for latency in latencies]
+            print(f"{mode:>6} {args.connections:>6} {pipeline:>9} {len(latencies):>9} {errors:>7} "
+                  f"{len(latencies) / elapsed:>9.0f} {percentile(ms, 50):>8.2f} "
+                  f"{percentile(ms, 95):>8.2f} {percentile(ms, 99):>8.2f}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="Target server (default: start a local instance)")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per mode")
+    parser.add_argument("--connections", type=int, default=16, help="Concurrent connections")
+    parser.add_argument("--pipeline", type=int, default=4,
+                        help="In-flight requests per WebSocket connection")
+    parser.add_argument("--max-concurrency", type=int, default=64,
+                        help="Server --max-concurrency for the local instance")
+    parser.add_argument("--modes", nargs="+", choices=["http", "ws"], default=["http", "ws"])
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
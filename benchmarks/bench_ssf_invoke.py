@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SSFRuntime.invoke() overhead per call, excluding the handler.
+
+Registers SSFs whose module handler does nothing and invokes them
+repeatedly under the servant_default manifold. The handler's own cost,
+measured by calling it directly, is subtracted, so the numbers are the
+runtime's overhead: SSF lookup, permission and schema checks, forbidden
+pattern scans, constraint checks and binding. They are reported against
+the runtime's latency_budget_ms (50 ms by default).
+
+"minimal" has no schema or patterns; "guarded" has an 8-property input
+schema and --patterns forbidden patterns per direction. With --baseline,
+the same runs are taken on a git ref (e.g. the commit before invocation
+plans) in a fresh interpreter for comparison. Where the runtime records
+per-stage latencies, their percentiles are listed as well.
+
+Usage:
+    python benchmarks/bench_ssf_invoke.py
+    python benchmarks/bench_ssf_invoke.py --baseline HEAD~1 --invocations 20000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter with the tree under test on sys.path; uses
+# only the public SSF API so it also runs against older trees.
+RUN_ONCE = """
+import asyncio, json, logging, statistics, sys, time
+sys.path.insert(0, {root!r})
+logging.disable(logging.WARNING)
+from uuid import uuid4
+from vessels.constraints import Manifold
+from vessels.ssf import (SSFRegistry, SSFRuntime, SSFDefinition, SSFHandler,
+                         ConstraintBindingConfig, SSFCategory, SSFStatus)
+from vessels.ssf.runtime import Persona, A0AgentInstance
+
+def noop(**inputs):
+    return {{"ok": True}}
+
+def timed(n, call):
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return times
+
+async def main():
+    registry = SSFRegistry()
+    runtime = SSFRuntime(manifold=Manifold.servant_default(), registry=registry)
+    persona = Persona(id=uuid4(), name="bench", community_id="bench",
+                      virtue_state={{"truthfulness": 0.8, "service": 0.7}})
+    agent = A0AgentInstance(agent_id="bench", persona_id=persona.id)
+    props = {{f"field_{{i}}": {{"type": "string"}} for i in range(8)}}
+    patterns = [rf"\\bforbidden_{{i}}\\b" for i in range({patterns})]
+    scenarios = {{
+        "minimal": SSFDefinition(name="minimal", handler=SSFHandler.module("__main__", "noop")),
+        "guarded": SSFDefinition(
+            name="guarded", category=SSFCategory.COMMUNICATION,
+            handler=SSFHandler.module("__main__", "noop"),
+            input_schema={{"type": "object", "properties": props,
+                          "required": list(props)[:4], "additionalProperties": False}},
+            constraint_binding=ConstraintBindingConfig(
+                forbidden_input_patterns=patterns, forbidden_output_patterns=patterns)),
+    }}
+    inputs = {{f"field_{{i}}": f"community value {{i}}" for i in range(8)}}
+    handler_s = statistics.mean(timed({n}, lambda: noop(**inputs)))
+    results = {{}}
+    for name, ssf in scenarios.items():
+        await registry.register(ssf)
+        for _ in range(200):  # warm caches
+            await runtime.invoke(ssf.id, inputs, persona, agent)
+        times = []
+        for _ in range({n}):
+            start = time.perf_counter()
+            result = await runtime.invoke(ssf.id, inputs, persona, agent)
+            times.append(time.perf_counter() - start - handler_s)
+            assert result.status == SSFStatus.SUCCESS, result.error
+        times.sort()
+        results[name] = {{
+            "mean": statistics.mean(times), "p50": times[len(times) // 2],
+            "p99": times[min(len(times) - 1, int(0.99 * len(times)))],
+        }}
+    # Per-stage percentiles, on trees whose runtime records them
+    stages = runtime.get_stats().get("stages", {{}})
+    results["stages"] = {{name: stages[name]["stages"] for name in scenarios if name in stages}}
+    results["budget_ms"] = runtime.latency_budget_ms
+    print(json.dumps(results))
+
+asyncio.run(main())
+"""
+
+SCENARIOS = ["minimal", "guarded"]
+
+
+def run_once(root: str, invocations: int, patterns: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", RUN_ONCE.format(root=root, n=invocations, patterns=patterns)],
+        check=True, capture_output=True, text=True, cwd=root,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def extract(ref: str, directory: str) -> str:
+    archive = subprocess.run(["git", "archive", ref], cwd=REPO_ROOT, check=True,
+                             capture_output=True).stdout
+    subprocess.run(["tar", "-x", "-C", directory], input=archive, check=True)
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--invocations", type=int, default=5000, help="Invocations per scenario")
+    parser.add_argument("--patterns", type=int, default=20,
+                        help="Forbidden patterns per direction in the guarded scenario")
+    parser.add_argument("--baseline", help="Git ref to compare against")
+    args = parser.parse_args()
+
+    current = run_once(REPO_ROOT, args.invocations, args.patterns)
+    baseline = None
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = run_once(extract(args.baseline, directory), args.invocations, args.patterns)
+
+    budget_us = current["budget_ms"] * 1000
+    header = f"{'scenario':>10} {'mean us':>9} {'p50 us':>9} {'p99 us':>9} {'% budget':>9}"
+    if baseline:
+        header += f" {'baseline us':>12} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for name in SCENARIOS:
+        stats = {key: seconds * 1e6 for key, seconds in current[name].items()}
+        row = (f"{name:>10} {stats['mean']:>9.1f} {stats['p50']:>9.1f} {stats['p99']:>9.1f} "
+               f"{stats['p99'] / budget_us * 100:>8.2f}%")
+        if baseline:
+            base_mean = baseline[name]["mean"] * 1e6
+            row += f" {base_mean:>12.1f} {base_mean / stats['mean']:>7.1f}x"
+        print(row)
+    print(f"\nlatency_budget_ms = {current['budget_ms']:g} (% budget uses p99 overhead)")
+
+    if current.get("stages"):
+        header = f"\n{'scenario':>10} {'stage':>16} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9}"
+        print(header)
+        print("-" * (len(header) - 1))
+        for name in SCENARIOS:
+            for stage, stats in current["stages"].get(name, {}).items():
+                print(f"{name:>10} {stage:>16} {stats['p50_ms'] * 1000:>9.1f} "
+                      f"{stats['p95_ms'] * 1000:>9.1f} {stats['p99_ms'] * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
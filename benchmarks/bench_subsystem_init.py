@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: AgentZeroCore.initialize() with lazy, eager and parallel subsystems.
+
+Each run happens in a fresh interpreter so heavy subsystem imports are paid
+every time, as they are at CLI and container start. The table shows the
+time of initialize() itself and, for eager and parallel runs, the time
+each subsystem took (including subsystems it depends on). Subsystems whose
+dependencies are not installed fail fast and show near-zero times.
+
+Usage:
+    python benchmarks/bench_subsystem_init.py
+    python benchmarks/bench_subsystem_init.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RUN_ONCE = """
+import json, logging, sys, time
+sys.path.insert(0, {root!r})
+logging.disable(logging.WARNING)
+from agent_zero_core import AgentZeroCore, AgentRuntime
+core = AgentZeroCore(agent_runtime=AgentRuntime.SCHEDULER, subsystem_init={mode!r})
+start = time.perf_counter()
+core.initialize()
+elapsed = time.perf_counter() - start
+stats = core.get_subsystem_stats()
+core.shutdown()
+print(json.dumps({{"initialize": elapsed, "subsystems": stats["init_seconds"]}}))
+"""
+
+MODES = ["lazy", "eager", "parallel"]
+
+
+def run_once(mode: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", RUN_ONCE.format(root=REPO_ROOT, mode=mode)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per mode")
+    args = parser.parse_args()
+
+    results = {mode: [run_once(mode) for _ in range(args.runs)] for mode in MODES}
+    subsystems = sorted({name for runs in results.values() for run in runs for name in run["subsystems"]})
+
+    header = f"{'':>20} " + " ".join(f"{mode + ' ms':>12}" for mode in MODES)
+    print(header)
+    print("-" * len(header))
+    print(f"{'initialize()':>20} " + " ".join(
+        f"{statistics.median(run['initialize'] for run in results[mode]) * 1000:>12.1f}"
+        for mode in MODES
+    ))
+    for name in subsystems:
+        cells = []
+        for mode in MODES:
+            times = [run["subsystems"][name] for run in results[mode] if name in run["subsystems"]]
+            cells.append(f"{statistics.median(times) * 1000:>12.1f}" if times else f"{'-':>12}")
+        print(f"{name:>20} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
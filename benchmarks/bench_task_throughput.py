@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark: agent task throughput and fairness against task concurrency.
+
+Runs grant-discovery and coordination task mixes on the SCHEDULER runtime
+for several (task_concurrency, task_quantum) settings and reports
+tasks/sec. Task executors sleep --task-ms to stand in for the I/O (search,
+LLM, API calls) real tasks wait on.
+
+The fairness case gives one "hot" agent a large backlog next to light
+agents with a few tasks each, and reports how long the light agents take
+to finish. Without fairness the light agents would wait behind the backlog.
+
+Usage:
+    python benchmarks/bench_task_throughput.py
+    python benchmarks/bench_task_throughput.py --agents 20 --tasks 50 --task-ms 5
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_zero_core import AgentZeroCore, AgentRuntime, AgentSpecification  # noqa: E402
+
+MIXES = {
+    "grant_discovery": ["grant_discovery"],
+    "coordination": ["community_coordination"],
+    "mixed": ["grant_discovery", "community_coordination"],
+}
+
+
+class _BenchCore(AgentZeroCore):
+    """AgentZeroCore whose task executors wait task_ms like an I/O call."""
+
+    def __init__(self, task_ms: float, **kwargs):
+        super().__init__(**kwargs)
+        self.task_seconds = task_ms / 1000.0
+
+    def _execute_grant_discovery_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        time.sleep(self.task_seconds)
+        return super()._execute_grant_discovery_task(task)
+
+    def _execute_coordination_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        time.sleep(self.task_seconds)
+        return super()._execute_coordination_task(task)
+
+
+def _spec(specialization: str) -> AgentSpecification:
+    return AgentSpecification(
+        name=f"{specialization}_agent", description="", capabilities=[],
+        tools_needed=[], specialization=specialization,
+    )
+
+
+def _completed(core: AgentZeroCore, agent_id: str) -> int:
+    return core.agents[agent_id].memory["active_tasks"].get_stats()["completed"]
+
+
+def _start_core(args, concurrency: int, quantum: int) -> _BenchCore:
+    core = _BenchCore(
+        task_ms=args.task_ms,
+        agent_runtime=AgentRuntime.SCHEDULER,
+        scheduler_workers=args.workers,
+        task_concurrency=concurrency,
+        task_quantum=quantum,
+        mailbox_size=max(1000, args.hot_tasks + 1),
+    )
+    # Agent processing only; the coordination loop is not part of the measurement
+    core.running = True
+    core.scheduler.start()
+    return core
+
+
+def _send_tasks(core: AgentZeroCore, agent_id: str, count: int) -> None:
+    for i in range(count):
+        core.send_message(agent_id, {"type": "task", "content": {"type": "bench", "i": i}})
+
+
+def run_throughput(args, mix: List[str], concurrency: int, quantum: int) -> float:
+    core = _start_core(args, concurrency, quantum)
+    agent_ids = core.spawn_agents([_spec(mix[i % len(mix)]) for i in range(args.agents)])
+    total = args.agents * args.tasks
+
+    start = time.perf_counter()
+    for agent_id in agent_ids:
+        _send_tasks(core, agent_id, args.tasks)
+    deadline = start + args.timeout
+    while time.perf_counter() < deadline:
+        if sum(_completed(core, agent_id) for agent_id in agent_ids) >= total:
+            break
+        time.sleep(0.005)
+    elapsed = time.perf_counter() - start
+    done = sum(_completed(core, agent_id) for agent_id in agent_ids)
+    core.shutdown()
+    return done / elapsed
+
+
+def run_fairness(args, concurrency: int, quantum: int) -> Tuple[float, int]:
+    """Seconds until all light agents finish, and hot tasks done by then."""
+    core = _start_core(args, concurrency, quantum)
+    hot_id = core.spawn_agents([_spec("grant_discovery")])[0]
+    light_ids = core.spawn_agents([_spec("community_coordination")] * args.light_agents)
+
+    start = time.perf_counter()
+    _send_tasks(core, hot_id, args.hot_tasks)
+    for agent_id in light_ids:
+        _send_tasks(core, agent_id, args.light_tasks)
+    deadline = start + args.timeout
+    while time.perf_counter() < deadline:
+        if all(_completed(core, agent_id) >= args.light_tasks for agent_id in light_ids):
+            break
+        time.sleep(0.002)
+    elapsed = time.perf_counter() - start
+    hot_done = _completed(core, hot_id)
+    core.shutdown()
+    return elapsed, hot_done
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agents", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=40, help="Tasks per agent")
+    parser.add_argument("--task-ms", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=8, help="Scheduler workers")
+    parser.add_argument("--configs", nargs="+", default=["1:1", "1:4", "4:4", "16:8"],
+                        help="task_concurrency:task_quantum pairs")
+    parser.add_argument("--hot-tasks", type=int, default=2000)
+    parser.add_argument("--light-agents", type=int, default=20)
+    parser.add_argument("--light-tasks", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    configs = [tuple(int(v) for v in c.split(":")) for c in args.configs]
+
+    print(f"Throughput: {args.agents} agents x {args.tasks} tasks, {args.task_ms} ms/task, "
+          f"{args.workers} scheduler workers")
+    header = f"{'concurrency:quantum':>20}" + "".join(f"{mix + ' t/s':>22}" for mix in MIXES)
+    print(header)
+    print("-" * len(header))
+    for concurrency, quantum in configs:
+        row = f"{f'{concurrency}:{quantum}':>20}"
+        for mix in MIXES.values():
+            row += f"{run_throughput(args, mix, concurrency, quantum):>22.0f}"
+        print(row)
+
+    print()
+    print(f"Fairness: 1 agent x {args.hot_tasks} tasks + "
+          f"{args.light_agents} agents x {args.light_tasks} tasks")
+    header = f"{'concurrency:quantum':>20} {'light agents done s':>20} {'hot tasks done':>15}"
+    print(header)
+    print("-" * len(header))
+    for concurrency, quantum in configs:
+        elapsed, hot_done = run_fairness(args, concurrency, quantum)
+        print(f"{f'{concurrency}:{quantum}':>20} {elapsed:>20.2f} {hot_done:>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold start (spawn every agent) vs warm start (restore snapshot).
+
+Cold start constructs an AgentZeroCore and spawns N agents, then queues
+--tasks tasks on each. Warm start constructs a core and restores the same
+agents, their queued tasks and history from a snapshot. Both exclude
+initialize(), whose subsystem setup is the same either way.
+
+Usage:
+    python benchmarks/bench_warm_restart.py
+    python benchmarks/bench_warm_restart.py --sizes 100 1000 --tasks 20
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_zero_core import AgentZeroCore, AgentRuntime, AgentSpecification  # noqa: E402
+
+SPECIALIZATIONS = [
+    "grant_discovery", "grant_writing", "volunteer_coordination",
+    "elder_care", "community_coordination", "resource_management",
+]
+
+
+def cold_start(n_agents: int, n_tasks: int) -> AgentZeroCore:
+    core = AgentZeroCore(agent_runtime=AgentRuntime.SCHEDULER)
+    specs = [
+        AgentSpecification(
+            name=f"{spec}_agent", description="", capabilities=[],
+            tools_needed=["web_search", "database_query"], specialization=spec,
+        )
+        for spec in SPECIALIZATIONS
+    ]
+    agent_ids = core.spawn_agents([specs[i % len(specs)] for i in range(n_agents)])
+    for agent_id in agent_ids:
+        tasks = core.agents[agent_id].memory["active_tasks"]
+        for i in range(n_tasks):
+            tasks.submit({"type": "grant_search", "query": f"query {i}"})
+    return core
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000, 2000])
+    parser.add_argument("--tasks", type=int, default=10, help="Queued tasks per agent")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    header = (f"{'agents':>7} {'cold ms':>9} {'save ms':>9} {'snapshot KB':>12} "
+              f"{'warm ms':>9} {'speedup':>8}")
+    print(header)
+    print("-" * len(header))
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            path = os.path.join(directory, f"agents-{size}.snapshot")
+
+            start = time.perf_counter()
+            core = cold_start(size, args.tasks)
+            cold = time.perf_counter() - start
+
+            saved = core.save_snapshot(path)
+            core.shutdown()
+
+            start = time.perf_counter()
+            warm_core = AgentZeroCore(agent_runtime=AgentRuntime.SCHEDULER)
+            restored = warm_core.restore_snapshot(path)
+            warm = time.perf_counter() - start
+            assert restored == size
+            warm_core.shutdown()
+
+            print(f"{size:>7} {cold * 1000:>9.1f} {saved['seconds'] * 1000:>9.1f} "
+                  f"{saved['bytes'] / 1024:>12.0f} {warm * 1000:>9.1f} {cold / warm:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ All data stored in memory, managed through AgentZeroCore.
 import logging
 import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
@@ -58,8 +58,10 @@ class CommunityMemory:
         # Initialize Kala integration
         self._init_kala_system()
 
-        # Simple hash-based embeddings
-        self._load_embedding_model()
+        # Embedding model is loaded on first use (falls back to hash embeddings)
+        self._embedding_model = None
+        self._embedding_model_loaded = False
+        self._embedding_model_lock = threading.Lock()
 
         logger.info("Community Memory System initialized")
 
@@ -73,14 +75,24 @@ class CommunityMemory:
             logger.warning(f"Kala system not available: {e}")
             self.kala_system = None
 
+    @property
+    def embedding_model(self):
+        """Sentence embedding model, loaded on first use (None: hash embeddings)."""
+        if not self._embedding_model_loaded:
+            with self._embedding_model_lock:
+                if not self._embedding_model_loaded:
+                    self._embedding_model = self._load_embedding_model()
+                    self._embedding_model_loaded = True
+        return self._embedding_model
+
     def _load_embedding_model(self):
         """Load embedding model (falls back to hash)."""
-        self.embedding_model = None
         try:
             from sentence_transformers import SentenceTransformer
-            self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+            return SentenceTransformer('all-MiniLM-L6-v2')
         except ImportError:
             logger.warning("Falling back to hash embeddings: No module named 'sentence_transformers'")
+            return None
 
     def store_experience(self, agent_id: str, experience: Dict[str, Any]) -> str:
         """Store an experience memory."""
@@ -96,16 +108,57 @@ class CommunityMemory:
             confidence=experience.get("confidence", 1.0)
         )
 
+        # Generate embedding outside the lock
+        embedding = self._generate_embedding(experience)
+
         with self._lock:
             self.memory_store[memory_id] = entry
             self.agent_memories[agent_id].append(memory_id)
-
-            # Generate embedding
-            self.embeddings[memory_id] = self._generate_embedding(experience)
+            self.embeddings[memory_id] = embedding
 
         logger.info(f"Stored experience for agent {agent_id}: {memory_id}")
         return memory_id
 
+    def store_experiences(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Store a batch of experience memories.
+
+        Embeddings are computed for the whole batch in one call, and entries
+        are inserted under a single lock acquisition.
+
+        Args:
+            items: (agent_id, experience) pairs
+
+        Returns:
+            Memory IDs, in input order
+        """
+        if not items:
+            return []
+
+        now = datetime.utcnow()
+        entries = [
+            MemoryEntry(
+                id=str(uuid.uuid4()),
+                type=MemoryType.EXPERIENCE,
+                content=experience,
+                agent_id=agent_id,
+                timestamp=now,
+                tags=experience.get("tags", []),
+                confidence=experience.get("confidence", 1.0)
+            )
+            for agent_id, experience in items
+        ]
+        embeddings = self._generate_embeddings([experience for _, experience in items])
+
+        with self._lock:
+            for entry, embedding in zip(entries, embeddings):
+                self.memory_store[entry.id] = entry
+                self.agent_memories[entry.agent_id].append(entry.id)
+                self.embeddings[entry.id] = embedding
+
+        logger.info(f"Stored {len(entries)} experiences in batch")
+        return [entry.id for entry in entries]
+
     def store_knowledge(self, agent_id: str, knowledge: Dict[str, Any]) -> str:
         """Store a knowledge memory."""
         memory_id = str(uuid.uuid4())
@@ -215,10 +268,24 @@ class CommunityMemory:
         if self.embedding_model:
             return self.embedding_model.encode(text)
 
-        # Fallback: simple hash-based embedding
+        return self._hash_embedding(text)
+
+    def _generate_embeddings(self, contents: List[Dict[str, Any]]) -> List[np.ndarray]:
+        """Generate embeddings for several contents with one model call."""
+        texts = [str(content) for content in contents]
+
+        if self.embedding_model:
+            return list(self.embedding_model.encode(texts))
+
+        return [self._hash_embedding(text) for text in texts]
+
+    @staticmethod
+    def _hash_embedding(text: str) -> np.ndarray:
+        """Fallback: simple hash-based embedding"""
+        # A private RandomState gives the same vector as seeding the global
+        # generator, without racing other threads for it
         hash_val = hash(text)
-        np.random.seed(abs(hash_val) % (2**32))
-        return np.random.randn(384)
+        return np.random.RandomState(abs(hash_val) % (2**32)).randn(384)
 
     def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """Calculate cosine similarity between vectors."""
@@ -246,5 +313,22 @@ class CommunityMemory:
             }
 
 
-# Global instance
-community_memory = CommunityMemory()
+_community_memory: Optional[CommunityMemory] = None
+_community_memory_lock = threading.Lock()
+
+
+def get_community_memory() -> CommunityMemory:
+    """Shared CommunityMemory, created on first call rather than at import."""
+    global _community_memory
+    if _community_memory is None:
+        with _community_memory_lock:
+            if _community_memory is None:
+                _community_memory = CommunityMemory()
+    return _community_memory
+
+
+def __getattr__(name: str) -> Any:
+    # Backward compatibility: `from community_memory import community_memory`
+    if name == "community_memory":
+        return get_community_memory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
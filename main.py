@@ -6,9 +6,11 @@ Starts the Vessels platform with full service initialization and monitoring.
 This is the primary entry point when running in Docker container.
 """
 
+import argparse
 import sys
 import os
 import logging
+from contextlib import nullcontext
 
 # Setup logging
 logging.basicConfig(
@@ -22,21 +24,38 @@ def main():
     """
     Main entry point for Vessels platform.
 
-    Initializes all services and starts the CLI/web interface.
+    Initializes all services and starts the CLI/web interface. With
+    --profile-startup it reports where startup time went and exits.
     """
+    from vessels.startup_profile import StartupProfiler, add_profile_startup_argument
+
+    parser = argparse.ArgumentParser(description='Vessels platform')
+    add_profile_startup_argument(parser)
+    args = parser.parse_args()
+    profiler = StartupProfiler().start() if args.profile_startup else None
+
     try:
         # Import and run the CLI
-        from vessels_cli import VesselsCLI
+        with profiler.phase("import vessels_cli") if profiler else nullcontext():
+            from vessels_cli import VesselsCLI
 
         # Create CLI instance (this will run startup checks)
-        cli = VesselsCLI(show_startup_banner=True)
+        cli = VesselsCLI(show_startup_banner=True, profiler=profiler)
+
+        if profiler:
+            profiler.finish(args.profile_startup)
+            return
 
         # Check if running in web mode
         if os.getenv("VESSELS_MODE", "cli").lower() == "web":
-            logger.info("Starting web interface on port 5000...")
-            # TODO: Import and start web server
-            # For now, just run interactive mode
-            cli.interactive_mode()
+            from vessels_server import run_server
+            # The container entry point must be reachable through its published
+            # port, so bind all interfaces unless VESSELS_HOST says otherwise
+            host = os.getenv("VESSELS_HOST", "0.0.0.0")
+            try:
+                run_server(cli.agent_zero, host=host)
+            finally:
+                cli.agent_zero.shutdown()
         else:
             # Run interactive CLI
             cli.interactive_mode()
@@ -0,0 +1,44 @@
+"""Shared pytest setup: make the repository root importable, plus runtime helpers."""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _wait_for(predicate, timeout=5.0):
+    """Poll until predicate() is true, failing the test after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def wait_for():
+    return _wait_for
+
+
+@pytest.fixture
+def started():
+    """
+    Factory that builds and starts a runtime, stopping it on teardown.
+
+    Call as started(RuntimeClass, *args, **kwargs); works for anything with
+    start() and stop(), e.g. AgentScheduler or AsyncAgentRuntime.
+    """
+    running = []
+
+    def start(factory, *args, **kwargs):
+        runtime = factory(*args, **kwargs)
+        runtime.start()
+        running.append(runtime)
+        return runtime
+
+    yield start
+    for runtime in reversed(running):
+        runtime.stop()
@@ -0,0 +1,45 @@
+"""Tests for vessels.a0.agent_table.AgentTable."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from vessels.a0.agent_table import AgentTable
+
+
+def _agent(vessel_id=None):
+    return SimpleNamespace(vessel_id=vessel_id)
+
+
+def test_behaves_like_a_dict():
+    table = AgentTable(shards=3)
+    table["a"] = agent = _agent()
+    assert table["a"] is agent and "a" in table and len(table) == 1
+    assert table.get("missing") is None
+    assert table.pop("missing", None) is None
+    with pytest.raises(KeyError):
+        table.pop("missing")
+    del table["a"]
+    assert not table
+
+
+def test_iteration_snapshots_allow_mutation():
+    table = AgentTable()
+    for i in range(10):
+        table[f"a{i}"] = _agent()
+    for agent_id in table.keys():
+        del table[agent_id]
+    assert len(table) == 0
+
+
+def test_vessel_index_follows_updates():
+    table = AgentTable()
+    table["a"] = _agent("v1")
+    table["b"] = _agent("v1")
+    table["c"] = _agent("v2")
+    assert sorted(table.ids_in_vessel("v1")) == ["a", "b"]
+
+    table["b"] = _agent("v2")
+    table.pop("c")
+    assert table.ids_in_vessel("v1") == ["a"]
+    assert table.ids_in_vessel("v2") == ["b"]
@@ -0,0 +1,204 @@
+"""Tests for AgentZeroCore request handling."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agent_zero_core import AgentRuntime, AgentZeroCore
+from vessels.a0.pool import AgentPool
+
+
+@pytest.fixture
+def core():
+    core = AgentZeroCore(
+        agent_runtime=AgentRuntime.SCHEDULER,
+        agent_pool=AgentPool(max_per_key=4),
+    )
+    core.running = True
+    core.scheduler.start()
+    yield core
+    core.running = False
+    core.scheduler.stop()
+
+
+def _concurrently(func, n):
+    barrier = threading.Barrier(n)
+
+    def call(_):
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        return list(executor.map(call, range(n)))
+
+
+def test_concurrent_requests_share_one_spawn(core):
+    results = _concurrently(lambda: core.process_request("find grants for us"), 32)
+
+    assert len(core.agents) == 1
+    stats = core.get_pool_stats()
+    assert stats["misses"] == 1
+    assert stats["occupancy"] == 1
+    agent_ids = {agent_id for result in results for agent_id in result["agents"]}
+    assert agent_ids == set(core.agents)
+
+
+def test_concurrent_batches_deduplicate_across_callers(core):
+    batch = ["find grants for us", "coordinate volunteers for the cleanup"]
+    results = _concurrently(lambda: core.process_requests(batch), 16)
+
+    assert len(core.agents) == 2
+    assert core.get_pool_stats()["misses"] == 2
+    for responses in results:
+        assert [len(r["agents"]) for r in responses] == [1, 1]
+
+
+def test_sequential_requests_reuse_pooled_agent(core):
+    first = core.process_request("find grants for us")
+    second = core.process_request("find grants for us")
+
+    assert first["agents"] == second["agents"]
+    assert first["message"] == "Assigned 1 agents to your request"
+    assert len(core.agents) == 1
+
+
+
+class _ThreadRecordingCore(AgentZeroCore):
+    """AgentZeroCore noting which threads spawn agents and run sync tasks."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.spawn_threads = []
+        self.task_threads = []
+        self.finish_threads = []
+        self.ssf_threads = []
+        self.executor_registry.register("grant_discovery", self._record_task)
+
+    def _spawn_agent(self, *args, **kwargs):
+        self.spawn_threads.append(threading.current_thread())
+        return super()._spawn_agent(*args, **kwargs)
+
+    def _record_task(self, task):
+        self.task_threads.append(threading.current_thread())
+        return {"success": True}
+
+    async def _record_async_task(self, task):
+        return {"success": True}
+
+    def _finish_agent_task(self, *args):
+        self.finish_threads.append(threading.current_thread())
+        return super()._finish_agent_task(*args)
+
+    def _initialize_ssf(self):
+        self.ssf_threads.append(threading.current_thread())
+        self.ssf_integration = None
+
+
+def test_asyncio_runtime_keeps_blocking_work_off_the_loop(wait_for):
+    core = _ThreadRecordingCore(agent_runtime=AgentRuntime.ASYNCIO)
+    core.running = True
+    core.scheduler.start()
+    loop_thread = core.scheduler._thread
+    try:
+        async def request():
+            return await core.process_request_async("find grants for us")
+
+        agent_id = core.scheduler.submit(request()).result(5)["agents"][0]
+        core.send_message(agent_id, {"type": "task", "content": {"type": "grant_search"}})
+        wait_for(lambda: core.task_threads)
+    finally:
+        core.running = False
+        core.scheduler.stop()
+
+    assert core.spawn_threads and core.task_threads
+    assert loop_thread not in core.spawn_threads + core.task_threads
+
+
+def test_asyncio_runtime_records_loop_tasks_and_builds_ssf_off_the_loop(wait_for):
+    core = _ThreadRecordingCore(agent_runtime=AgentRuntime.ASYNCIO)
+    core.executor_registry.register("grant_discovery", core._record_async_task, kind="async")
+    core.running = True
+    core.scheduler.start()
+    loop_thread = core.scheduler._thread
+    try:
+        async def request():
+            return await core.process_request_async("find grants for us")
+
+        agent_id = core.scheduler.submit(request()).result(5)["agents"][0]
+        core.send_message(agent_id, {"type": "task", "content": {"type": "grant_search"}})
+        wait_for(lambda: core.finish_threads)
+
+        with pytest.raises(RuntimeError):
+            core.call_ssf_tool("find_ssf", {}, persona=None, agent=None, timeout=5)
+    finally:
+        core.running = False
+        core.scheduler.stop()
+
+    assert core.finish_threads and core.ssf_threads
+    assert loop_thread not in core.finish_threads + core.ssf_threads
+
+
+def test_message_dropped_by_full_mailbox_is_not_reported_delivered():
+    core = AgentZeroCore(mailbox_size=1, mailbox_policy="drop_oldest")
+    recipient = core.process_request("find grants for us")["agents"][0]
+    sender = core.process_request("coordinate volunteers")["agents"][0]
+    woken = []
+    core._wake_agent = woken.append
+
+    assert core.send_message(recipient, {"type": "system", "content": "first"})
+    assert not core.send_message(recipient, {"type": "task", "sender_id": sender})
+
+    assert core.agents[recipient].mailbox.snapshot() == [{"type": "system", "content": "first"}]
+    assert woken == [recipient, sender]
+    bounced = core.agents[sender].mailbox.get_nowait()
+    assert bounced["error"] == "mailbox_full" and bounced["recipient_id"] == recipient
+
+
+def test_failed_task_submission_releases_slot_and_requeues():
+    core = AgentZeroCore(task_concurrency=2, task_quantum=2)
+    agent_id = core.process_request("find grants for us")["agents"][0]
+    agent = core.agents[agent_id]
+    tasks = agent.memory["active_tasks"]
+    tasks.submit({"type": "grant_search"}, task_id="t1")
+    tasks.submit({"type": "grant_search"}, task_id="t2")
+    core.executor.shutdown()
+
+    assert core._process_agent_tasks(agent_id) == 0
+    assert agent.tasks_in_flight == 0
+    assert [task.task_id for task in tasks.pending()] == ["t1", "t2"]
+    assert tasks.pending()[0].attempts == 0
+    assert core._has_startable_tasks(agent)
+
+
+def test_task_concurrency_runs_an_agents_tasks_in_parallel(wait_for):
+    core = AgentZeroCore(agent_runtime=AgentRuntime.SCHEDULER, task_concurrency=2, task_quantum=4)
+    barrier = threading.Barrier(2, timeout=5)
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0, "done": 0}
+
+    def handler(task):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        barrier.wait()  # Passes only if two tasks run at once
+        with lock:
+            state["running"] -= 1
+            state["done"] += 1
+        return {"success": True}
+
+    core.executor_registry.register("grant_discovery", handler)
+    core.running = True
+    core.scheduler.start()
+    try:
+        agent_id = core.process_request("find grants for us")["agents"][0]
+        for n in range(4):
+            core.send_message(agent_id, {"type": "task", "content": {"type": "grant_search", "n": n}})
+        wait_for(lambda: state["done"] == 4)
+    finally:
+        core.running = False
+        core.scheduler.stop()
+
+    assert not barrier.broken
+    assert state["peak"] == 2  # Never more than task_concurrency at once
+    assert core.agents[agent_id].tasks_in_flight == 0
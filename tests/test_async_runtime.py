@@ -0,0 +1,54 @@
+"""Tests for vessels.a0.async_runtime.AsyncAgentRuntime."""
+
+import functools
+import threading
+
+import pytest
+
+from vessels.a0.async_runtime import AsyncAgentRuntime
+
+
+@pytest.fixture
+def make_runtime(started):
+    return functools.partial(started, AsyncAgentRuntime)
+
+
+def test_notify_runs_cycles_until_no_work(make_runtime, wait_for):
+    remaining = {"a": 3}
+    runtime = make_runtime(lambda agent_id: _step(remaining, agent_id))
+
+    runtime.notify("a")
+    wait_for(lambda: remaining["a"] == 0)
+    assert runtime.get_stats()["agent_tasks"] == 1
+
+
+def _step(remaining, agent_id):
+    remaining[agent_id] -= 1
+    return remaining[agent_id] > 0
+
+
+def test_notify_group_resolves_members(make_runtime, wait_for):
+    seen = set()
+    runtime = make_runtime(lambda agent_id: seen.add(agent_id),
+                           resolve_group=lambda group: ["a", "b"])
+    runtime.notify_group("topic")
+    wait_for(lambda: seen == {"a", "b"})
+
+
+def test_coordination_runs_off_the_loop(make_runtime, wait_for):
+    threads = []
+    runtime = make_runtime(lambda agent_id: False,
+                           coordinate=lambda: threads.append(threading.current_thread()),
+                           coordination_interval=0.01)
+    wait_for(lambda: threads)
+    assert runtime._thread not in threads
+
+
+def test_call_and_run_sync(make_runtime):
+    runtime = make_runtime(lambda agent_id: False)
+    assert runtime.call(threading.current_thread) is runtime._thread
+
+    async def answer():
+        return 42
+
+    assert runtime.run_sync(answer(), timeout=5) == 42
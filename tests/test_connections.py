@@ -0,0 +1,73 @@
+"""Tests for vessels.a0.connections.SpecializationGraph."""
+
+import threading
+
+from vessels.a0.connections import SpecializationGraph
+
+
+def test_connects_complementary_specializations_only():
+    graph = SpecializationGraph()
+    graph.add("a", "grant_discovery")
+    graph.add("b", "grant_discovery")
+    graph.add("c", "volunteer_coordination")
+
+    assert graph.connections("a") == {"c"}
+    assert graph.connections("c") == {"a", "b"}
+    assert graph.agents_with("grant_discovery") == {"a", "b"}
+
+
+def test_add_returns_read_only_live_view():
+    graph = SpecializationGraph()
+    view = graph.add("a", "grant_discovery")
+    assert not hasattr(view, "add") and not hasattr(view, "discard")
+
+    graph.add("b", "general")
+    assert view == {"b"}
+    assert "b" in view and len(view) == 1
+
+    graph.remove("b")
+    assert view == set()
+
+
+def test_add_many_matches_incremental_adds():
+    agents = [(f"a{i}", ["x", "y", "z"][i % 3]) for i in range(12)]
+    incremental = SpecializationGraph()
+    incremental.add("seed", "x")
+    for agent_id, spec in agents:
+        incremental.add(agent_id, spec)
+
+    bulk = SpecializationGraph()
+    bulk.add("seed", "x")
+    views = bulk.add_many(agents)
+
+    for agent_id, _ in agents + [("seed", "x")]:
+        assert bulk.connections(agent_id) == incremental.connections(agent_id)
+    assert views["a1"] == incremental.connections("a1")
+
+
+def test_iterating_view_while_graph_changes():
+    graph = SpecializationGraph()
+    view = graph.add("hub", "hub")
+    errors = []
+    stop = threading.Event()
+
+    def churn():
+        i = 0
+        while not stop.is_set():
+            graph.add(f"p{i}", "peer")
+            graph.remove(f"p{i - 5}")
+            i += 1
+
+    thread = threading.Thread(target=churn)
+    thread.start()
+    try:
+        for _ in range(2000):
+            try:
+                for _ in view:
+                    pass
+            except RuntimeError as e:  # Set changed size during iteration
+                errors.append(e)
+    finally:
+        stop.set()
+        thread.join()
+    assert not errors
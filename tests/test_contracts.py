@@ -0,0 +1,93 @@
+"""Tests for vessels.ssf.contracts."""
+
+from vessels.ssf.contracts import compile_schema
+
+ADDRESS_SCHEMA = {
+    "type": "object",
+    "required": ["name", "address"],
+    "properties": {
+        "name": {"type": "string"},
+        "count": {"type": "integer", "default": 1},
+        "address": {
+            "type": "object",
+            "required": ["city"],
+            "additionalProperties": False,
+            "properties": {
+                "city": {"type": "string"},
+                "country": {"type": "string", "default": "US"},
+            },
+        },
+        "recipients": {"type": "array", "items": {"type": "string"}},
+        "channel": {"type": "string", "enum": ["sms", "email"]},
+    },
+}
+
+
+def test_errors_report_nested_paths():
+    validator = compile_schema(ADDRESS_SCHEMA)
+    errors = validator.errors({
+        "name": "Ana",
+        "address": {"zip": "96720"},
+        "recipients": ["a", "b", 3],
+        "channel": "fax",
+    })
+
+    assert errors == [
+        "Missing required field: address.city",
+        "Unknown field: address.zip",
+        "Field recipients[2] has wrong type, expected string",
+        "Field channel must be one of ['sms', 'email']",
+    ]
+    assert validator.first_error({"name": "Ana"}) == "Missing required field: address"
+    assert validator({"name": "Ana", "address": {"city": "Hilo"}}) is None
+
+
+def test_additional_properties_only_checked_when_enabled():
+    payload = {"name": "Ana", "address": {"city": "Hilo", "zip": "96720"}}
+    assert compile_schema(ADDRESS_SCHEMA).first_error(payload) == "Unknown field: address.zip"
+    assert compile_schema(ADDRESS_SCHEMA, check_additional=False).first_error(payload) is None
+
+
+def test_bools_are_not_numbers():
+    validator = compile_schema({"type": "object", "properties": {"count": {"type": "integer"}}})
+    assert validator.first_error({"count": True}) == "Field count has wrong type, expected integer"
+    assert validator.first_error({"count": 2}) is None
+    assert compile_schema({"type": "number"}).first_error(False) == "Expected type number, got bool"
+
+
+def test_apply_defaults_fills_nested_fields_without_mutating():
+    validator = compile_schema(ADDRESS_SCHEMA)
+    payload = {"name": "Ana", "address": {"city": "Hilo"}}
+
+    filled = validator.apply_defaults(payload)
+
+    assert filled == {"name": "Ana", "count": 1, "address": {"city": "Hilo", "country": "US"}}
+    assert payload == {"name": "Ana", "address": {"city": "Hilo"}}
+
+
+def test_apply_defaults_returns_complete_value_unchanged():
+    validator = compile_schema(ADDRESS_SCHEMA)
+    payload = {"name": "Ana", "count": 2, "address": {"city": "Hilo", "country": "CA"}}
+    assert validator.apply_defaults(payload) is payload
+
+
+def test_apply_defaults_fills_array_items():
+    validator = compile_schema({
+        "type": "array",
+        "items": {"type": "object", "properties": {"priority": {"type": "integer", "default": 0}}},
+    })
+    assert validator.apply_defaults([{}, {"priority": 3}]) == [{"priority": 0}, {"priority": 3}]
+
+
+def test_identical_schemas_share_a_validator():
+    first = compile_schema({"type": "object", "properties": {"a": {"type": "string"}}})
+    second = compile_schema({"properties": {"a": {"type": "string"}}, "type": "object"})
+    assert first is second
+    assert compile_schema(ADDRESS_SCHEMA, check_additional=False) is not compile_schema(ADDRESS_SCHEMA)
+
+
+def test_cached_validator_ignores_later_edits_to_the_schema():
+    schema = {"type": "object", "required": ["a"], "properties": {"a": {"type": "string"}}}
+    validator = compile_schema(schema)
+    schema["required"].append("b")
+    assert validator.first_error({"a": "x"}) is None
@@ -0,0 +1,52 @@
+"""Tests for vessels.a0.executors.ExecutorRegistry."""
+
+import pytest
+
+from vessels.a0.executors import ExecutorKind, ExecutorRegistry
+
+
+def _handler(task):
+    return {"success": True}
+
+
+def test_unrouted_specialization_uses_default():
+    registry = ExecutorRegistry(default="general")
+    registry.register("general", _handler)
+    registry.register("grant_discovery", _handler, kind="cpu")
+
+    assert registry.resolve("grant_discovery").kind == ExecutorKind.CPU
+    assert registry.resolve("unknown").name == "general"
+
+
+def test_missing_default_raises():
+    with pytest.raises(KeyError):
+        ExecutorRegistry().resolve("anything")
+
+
+def test_replacing_executor_repoints_routes():
+    registry = ExecutorRegistry()
+    registry.register_executor("search", _handler)
+    registry.route("grant_discovery", "search")
+
+    replacement = registry.register_executor("search", lambda task: {}, kind="async")
+    assert registry.resolve("grant_discovery") is replacement
+    assert registry.describe() == {"grant_discovery": {"executor": "search", "kind": "async"}}
+
+
+def test_route_to_unknown_executor_raises():
+    with pytest.raises(KeyError):
+        ExecutorRegistry().route("grant_discovery", "missing")
+
+
+def test_agent_definitions_route_specializations(tmp_path):
+    pytest.importorskip("yaml")
+    (tmp_path / "finder.yml").write_text(
+        "specialization: grant_discovery\nexecutor:\n  handler: search\n  kind: cpu\n"
+    )
+    (tmp_path / "broken.yml").write_text("executor:\n  handler: missing\n")
+    registry = ExecutorRegistry()
+    registry.register_executor("search", _handler)
+
+    assert registry.load_agent_definitions(tmp_path) == 1
+    executor = registry.resolve("grant_discovery")
+    assert executor.kind == ExecutorKind.CPU and executor.handler is _handler
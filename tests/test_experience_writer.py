@@ -0,0 +1,78 @@
+"""Tests for vessels.a0.experience_writer.ExperienceWriter."""
+
+import time
+
+from vessels.a0.experience_writer import ExperienceWriter
+
+
+class _BatchBackend:
+    def __init__(self):
+        self.calls = []
+
+    def store_experiences(self, items):
+        self.calls.append(list(items))
+
+
+class _SingleBackend:
+    def __init__(self):
+        self.calls = []
+
+    def store_experience(self, agent_id, experience):
+        self.calls.append((agent_id, experience))
+
+
+def test_groups_patterns_per_agent_in_one_batch_call():
+    backend = _BatchBackend()
+    writer = ExperienceWriter(max_batch=100)
+    writer.add(backend, "a", [1, 2])
+    writer.add(backend, "b", [3])
+    writer.add(backend, "a", [4])
+
+    assert writer.flush() == 2
+    assert backend.calls == [[
+        ("a", {"learned_patterns": [1, 2, 4]}),
+        ("b", {"learned_patterns": [3]}),
+    ]]
+
+
+def test_falls_back_to_single_writes():
+    backend = _SingleBackend()
+    writer = ExperienceWriter()
+    writer.add(backend, "a", [1])
+    writer.flush()
+    assert backend.calls == [("a", {"learned_patterns": [1]})]
+    assert writer.get_stats()["fallback_calls"] == 1
+
+
+def test_full_batch_flushes_inline_when_not_started():
+    backend = _BatchBackend()
+    writer = ExperienceWriter(max_batch=2)
+    writer.add(backend, "a", [1])
+    assert not backend.calls
+    writer.add(backend, "a", [2])
+    assert len(backend.calls) == 1
+
+
+def test_background_thread_flushes_after_interval():
+    backend = _BatchBackend()
+    writer = ExperienceWriter(flush_interval=0.05)
+    writer.start()
+    try:
+        writer.add(backend, "a", [1])
+        deadline = time.monotonic() + 5
+        while not backend.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        writer.stop()
+    assert backend.calls == [[("a", {"learned_patterns": [1]})]]
+
+
+def test_backend_errors_are_counted_not_raised():
+    class _Failing:
+        def store_experiences(self, items):
+            raise OSError("down")
+
+    writer = ExperienceWriter()
+    writer.add(_Failing(), "a", [1])
+    assert writer.flush() == 0
+    assert writer.get_stats()["errors"] == 1
@@ -0,0 +1,94 @@
+"""Tests for vessels.a0.intents."""
+
+import re
+
+import pytest
+
+from vessels.a0.intents import IntentDefinition, IntentEngine, compile_intents
+
+
+def _engine(patterns):
+    return IntentEngine(intents=[
+        IntentDefinition(name=name, patterns=list(intent_patterns))
+        for name, intent_patterns in patterns.items()
+    ])
+
+
+def test_detects_in_definition_order():
+    engine = _engine({
+        "grant_writing": [r"write.*grant"],
+        "grant_discovery": [r"find.*grant"],
+    })
+    assert engine.detect("Find a grant and write the grant") == ["grant_writing", "grant_discovery"]
+    assert engine.detect("nothing here") == []
+
+
+@pytest.mark.parametrize("text", ["funding source", "fundraiser", "the fund is raising"])
+def test_overlapping_and_nested_literals_are_all_seen(text):
+    patterns = {"long": [r"funding.*source"], "short": [r"fund"], "overlap": [r"ndr.*ser"]}
+    compiled = compile_intents([
+        IntentDefinition(name=name, patterns=p) for name, p in patterns.items()
+    ])
+    expected = [name for name, p in patterns.items() if re.search(p[0], text)]
+    assert compiled.match(text) == expected
+
+
+# Patterns with quantifiers, and texts re.search matches them in
+QUANTIFIER_PATTERNS = {
+    "ab{0,2}c": ["ac", "abbc"],
+    "help{0,1}me": ["helme", "helpme"],
+    "grants{1,3}": ["grants", "grantss"],
+    "find.?grants?": ["findgrant", "find grants"],
+    "fund+ing.*source": ["funddding a source"],
+}
+
+REQUESTS = [
+    "Find a grant for our elder care program",
+    "search for funding sources in puna",
+    "Can you write a grant application for the food bank",
+    "help me coordinate volunteers for saturday",
+    "we need senior care services near hilo",
+    "organize a community event at the park",
+    "manage resources for the shelter and track inventory",
+    "draft a proposal for the youth garden, urgently",
+    "what is the weather like today",
+    "schedule a meeting with the board next week",
+    "thank you so much for your help",
+]
+
+
+def _search_each(patterns, text):
+    """Reference matcher: one re.search per pattern, intents in order."""
+    return [
+        intent for intent, intent_patterns in patterns.items()
+        if any(re.search(p, text.lower(), re.IGNORECASE) for p in intent_patterns)
+    ]
+
+
+@pytest.mark.parametrize("pattern", sorted(QUANTIFIER_PATTERNS))
+def test_quantified_patterns_are_not_prefiltered_away(pattern):
+    engine = _engine({pattern: [pattern]})
+    for text in QUANTIFIER_PATTERNS[pattern]:
+        assert re.search(pattern, text)
+        assert engine.detect(text) == [pattern]
+
+
+def test_configured_intents_match_per_pattern_search():
+    engine = IntentEngine.from_config(reload_interval=0)
+    patterns = engine.patterns
+    assert patterns
+
+    for text in REQUESTS:
+        assert engine.detect(text) == _search_each(patterns, text), text
+    assert engine.detect_many(REQUESTS) == [engine.detect(text) for text in REQUESTS]
+
+
+def test_reload_keeps_previous_patterns_on_bad_config(tmp_path):
+    config = tmp_path / "intents.json"
+    config.write_text('{"greeting": {"patterns": ["hello.*there"]}}')
+    engine = IntentEngine(config_path=config, reload_interval=0)
+    assert engine.detect("hello over there") == ["greeting"]
+
+    config.write_text("not json")
+    assert not engine.reload(force=True)
+    assert engine.detect("hello over there") == ["greeting"]
@@ -0,0 +1,20 @@
+"""Tests for vessels.latency."""
+
+import pytest
+
+from vessels.latency import percentile
+
+
+def test_empty_is_zero():
+    assert percentile([], 99) == 0.0
+
+
+@pytest.mark.parametrize("pct, expected", [(0, 1), (50, 50), (95, 95), (99, 99), (100, 100)])
+def test_nearest_rank(pct, expected):
+    assert percentile(range(100, 0, -1), pct) == expected
+
+
+def test_small_samples():
+    assert percentile([3.0, 1.0], 50) == 1.0
+    assert percentile([3.0, 1.0], 51) == 3.0
+    assert percentile([7.0], 99) == 7.0
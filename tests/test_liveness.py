@@ -0,0 +1,50 @@
+"""Tests for vessels.a0.liveness.LivenessTracker."""
+
+from vessels.a0.liveness import LivenessTracker
+
+
+def test_only_agents_past_deadline_are_checked():
+    tracker = LivenessTracker(stall_timeout=10)
+    tracker.touch("a", at=0)
+    tracker.touch("b", at=5)
+    checked = []
+
+    tracker.poll(lambda agent_id: checked.append(agent_id) or True, lambda agent_id: False, now=12)
+    assert checked == ["a"]
+    assert tracker.is_stalled("a") and not tracker.is_stalled("b")
+
+
+def test_touch_pushes_deadline_back_and_clears_stall():
+    tracker = LivenessTracker(stall_timeout=10)
+    tracker.touch("a", at=0)
+    tracker.poll(lambda agent_id: True, lambda agent_id: False, now=11)
+    tracker.touch("a", at=11)
+    assert not tracker.is_stalled("a")
+
+    checked = []
+    tracker.poll(lambda agent_id: checked.append(agent_id), lambda agent_id: False, now=15)
+    assert checked == []
+
+
+def test_errors_are_restarted_once():
+    tracker = LivenessTracker()
+    tracker.touch("a")
+    tracker.mark_error("a")
+    tracker.mark_error("a")
+    restarted = []
+
+    tracker.poll(lambda agent_id: False, lambda agent_id: restarted.append(agent_id) or True)
+    tracker.poll(lambda agent_id: False, lambda agent_id: restarted.append(agent_id) or True)
+    assert restarted == ["a"]
+    assert tracker.get_stats()["restarts"] == 1
+
+
+def test_removed_agents_are_forgotten():
+    tracker = LivenessTracker(stall_timeout=1)
+    tracker.touch("a", at=0)
+    tracker.remove("a")
+    tracker.mark_error("a")
+    checked = []
+    tracker.poll(checked.append, checked.append, now=100)
+    assert checked == []
+    assert tracker.get_stats()["tracked"] == 0
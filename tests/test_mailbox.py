@@ -0,0 +1,81 @@
+"""Tests for vessels.a0.mailbox.Mailbox."""
+
+import queue
+import threading
+
+import pytest
+
+from vessels.a0.mailbox import Mailbox, MailboxFullError, OverflowPolicy, message_lane
+
+
+def _msg(kind, n=0):
+    return {"type": kind, "n": n}
+
+
+def test_delivers_by_lane_then_fifo():
+    mailbox = Mailbox()
+    for message in [_msg("task", 1), _msg("query", 2), _msg("system", 3), _msg("task", 4)]:
+        mailbox.put(message)
+
+    assert [m["n"] for m in mailbox.drain(10)] == [3, 2, 1, 4]
+    assert mailbox.empty()
+
+
+def test_unknown_and_non_dict_messages_go_to_task_lane():
+    assert message_lane(_msg("bench")) == message_lane(_msg("task"))
+    assert message_lane("plain text") == message_lane(_msg("task"))
+
+
+def test_reject_policy_raises_when_full():
+    mailbox = Mailbox(maxsize=1, policy=OverflowPolicy.REJECT)
+    mailbox.put(_msg("task"))
+    with pytest.raises(MailboxFullError):
+        mailbox.put(_msg("system"))
+    assert mailbox.get_stats()["rejected"] == 1
+
+
+def test_drop_oldest_evicts_lowest_priority_lane():
+    mailbox = Mailbox(maxsize=3, policy="drop_oldest")
+    mailbox.put(_msg("system", 1))
+    mailbox.put(_msg("task", 2))
+    mailbox.put(_msg("task", 3))
+
+    mailbox.put(_msg("query", 4))
+    assert [m["n"] for m in mailbox.snapshot()] == [1, 4, 3]
+
+
+def test_drop_oldest_drops_incoming_message_outranked_by_all_pending():
+    mailbox = Mailbox(maxsize=2, policy="drop_oldest")
+    mailbox.put(_msg("system", 1))
+    mailbox.put(_msg("query", 2))
+
+    with pytest.raises(MailboxFullError):
+        mailbox.put(_msg("task", 3))
+    assert [m["n"] for m in mailbox.snapshot()] == [1, 2]
+    assert mailbox.get_stats()["dropped"] == 1
+    assert mailbox.get_stats()["rejected"] == 0
+
+    # Same lane: the oldest message of that lane makes room
+    mailbox.put(_msg("query", 4))
+    assert [m["n"] for m in mailbox.snapshot()] == [1, 4]
+
+
+def test_block_policy_waits_for_space():
+    mailbox = Mailbox(maxsize=1, policy="block", block_timeout=5)
+    mailbox.put(_msg("task", 1))
+
+    threading.Timer(0.05, mailbox.get).start()
+    mailbox.put(_msg("task", 2))
+    assert [m["n"] for m in mailbox.snapshot()] == [2]
+
+
+def test_block_policy_rejects_after_timeout():
+    mailbox = Mailbox(maxsize=1, policy="block", block_timeout=0.01)
+    mailbox.put(_msg("task"))
+    with pytest.raises(MailboxFullError):
+        mailbox.put(_msg("task"))
+
+
+def test_get_nowait_on_empty_raises_queue_empty():
+    with pytest.raises(queue.Empty):
+        Mailbox().get_nowait()
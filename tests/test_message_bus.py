@@ -0,0 +1,70 @@
+"""Tests for vessels.a0.message_bus."""
+
+from types import MappingProxyType
+
+import pytest
+
+from vessels.a0.message_bus import MessageBus, freeze, topic
+
+
+def test_topic_names():
+    assert topic("all") == "all"
+    assert topic("vessel", "v1") == "vessel:v1"
+    with pytest.raises(ValueError):
+        topic("planet", "x")
+
+
+def test_freeze_makes_messages_read_only():
+    frozen = freeze({"a": [1, {"b": 2}], "c": {3}})
+    assert isinstance(frozen, MappingProxyType)
+    assert frozen["a"] == (1, {"b": 2})
+    assert isinstance(frozen["a"][1], MappingProxyType)
+    assert frozen["c"] == frozenset({3})
+
+
+def test_subscribers_only_see_messages_after_subscribing():
+    bus = MessageBus()
+    bus.subscribe("a", ["all"])
+    bus.publish("all", {"n": 1})
+    bus.subscribe("b", ["all"])
+    bus.publish("all", {"n": 2})
+
+    assert [m["n"] for m in bus.poll("a", 10)] == [1, 2]
+    assert [m["n"] for m in bus.poll("b", 10)] == [2]
+    assert not bus.has_pending("a")
+
+
+def test_publish_without_subscribers_is_dropped():
+    bus = MessageBus()
+    assert bus.publish("all", {"n": 1}) is None
+
+
+def test_slow_reader_skips_ahead_and_counts_drops():
+    bus = MessageBus(capacity=2)
+    bus.subscribe("a", ["all"])
+    for n in range(5):
+        bus.publish("all", {"n": n})
+
+    assert bus.lag("a") == 2
+    assert [m["n"] for m in bus.poll("a", 10)] == [3, 4]
+    assert bus.get_stats()["dropped"] == 3
+
+
+def test_listeners_hear_each_publish():
+    bus = MessageBus()
+    heard = []
+    bus.add_listener(lambda name, seq: heard.append((name, seq)))
+    bus.subscribe("a", ["vessel:v1"])
+    bus.publish("vessel:v1", {})
+    bus.publish("vessel:v1", {})
+    assert heard == [("vessel:v1", 0), ("vessel:v1", 1)]
+
+
+def test_unsubscribe_releases_topic():
+    bus = MessageBus()
+    bus.subscribe("a", ["all", "vessel:v1"])
+    bus.unsubscribe("a", ["vessel:v1"])
+    assert bus.topics_of("a") == ["all"]
+    assert bus.subscribers("vessel:v1") == []
+    bus.unsubscribe("a")
+    assert bus.get_stats()["topics"] == 0
@@ -0,0 +1,72 @@
+"""Tests for vessels.ssf.plan and SSFRuntime plan compilation."""
+
+import asyncio
+
+from vessels.ssf.plan import compile_patterns
+from vessels.ssf.runtime import SSFRuntime
+from vessels.ssf.schema import ConstraintBindingConfig, ConstraintBindingMode, SSFDefinition
+
+
+class _Manifold:
+    def __init__(self):
+        self.version = 1
+
+    def get_all_constraints(self):
+        return []
+
+
+def _ssf(**binding):
+    return SSFDefinition(
+        name="send_sms",
+        input_schema={"type": "object", "properties": {"to": {"type": "string"}}},
+        constraint_binding=ConstraintBindingConfig(**binding),
+    )
+
+
+def test_compile_patterns_keeps_valid_patterns_and_first_error():
+    pairs, error = compile_patterns(["secret", "(unclosed", "ok+", "[bad"])
+    assert [source for source, _ in pairs] == ["secret", "ok+"]
+    assert pairs[0][1].search("SECRET")
+    assert "missing )" in str(error)
+
+
+def test_plan_binds_patterns_and_records_errors():
+    runtime = SSFRuntime()
+    plan = runtime.compile_plan(_ssf(
+        mode=ConstraintBindingMode.EXPLICIT,
+        explicit_constraints=["privacy"],
+        forbidden_input_patterns=["password", "(bad"],
+        forbidden_output_patterns=["ssn"],
+    ))
+
+    assert plan.pattern_error is not None
+    assert [p.pattern for p in plan.forbidden_patterns()["input"]] == ["password"]
+    assert plan.forbidden_output.search({"field": "SSN"}) == "ssn"
+    assert plan.constraint_names == ["privacy"]
+    assert plan.input_contract.first_error({"to": 5}) == "Field to has wrong type, expected string"
+
+
+def test_plan_goes_stale_with_manifold_version():
+    manifold = _Manifold()
+    runtime = SSFRuntime(manifold=manifold)
+    plan = runtime.compile_plan(_ssf())
+
+    assert plan.is_current(manifold)
+    manifold.version = 2
+    assert not plan.is_current(manifold)
+    assert not plan.is_current(_Manifold())
+
+
+def test_get_plan_recompiles_stale_plans():
+    manifold = _Manifold()
+    runtime = SSFRuntime(manifold=manifold)
+    ssf = _ssf()
+    runtime._plans[ssf.id] = first = runtime.compile_plan(ssf)
+
+    assert asyncio.run(runtime.get_plan(ssf.id)) is first
+    manifold.version = 2
+    second = asyncio.run(runtime.get_plan(ssf.id))
+    assert second is not first and second.is_current(manifold)
+
+    runtime.invalidate_plans(ssf.id)
+    assert ssf.id not in runtime._plans
@@ -0,0 +1,110 @@
+"""Tests for vessels.a0.pool.AgentPool."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from vessels.a0.pool import AgentPool
+
+KEY = (None, "grant_discovery")
+
+
+def _busy(agent_id):
+    return False
+
+
+def _idle(agent_id):
+    return True
+
+
+def test_miss_reserves_then_add_hits():
+    pool = AgentPool()
+    assert pool.acquire(KEY, _idle) == (None, None)
+    assert pool.add(KEY, "a1")
+    assert pool.acquire(KEY, _idle) == ("a1", None)
+
+    stats = pool.get_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["spawning"] == 0
+
+
+def test_concurrent_miss_joins_inflight_spawn():
+    pool = AgentPool()
+    assert pool.acquire(KEY, _busy) == (None, None)
+
+    agent_id, pending = pool.acquire(KEY, _busy)
+    assert agent_id is None and pending is not None
+    assert not pending.done()
+
+    pool.add(KEY, "a1")
+    assert pending.result(timeout=1) == "a1"
+    assert pool.get_stats()["shared"] == 1
+
+
+def test_abandon_propagates_error_to_waiters():
+    pool = AgentPool()
+    pool.acquire(KEY, _busy)
+    _, pending = pool.acquire(KEY, _busy)
+
+    pool.abandon(KEY, ValueError("boom"))
+    with pytest.raises(ValueError):
+        pending.result(timeout=1)
+    # The reservation is released: the next miss reserves again
+    assert pool.acquire(KEY, _busy) == (None, None)
+
+
+def test_add_refuses_past_max_per_key():
+    pool = AgentPool(max_per_key=2)
+    assert pool.add(KEY, "a1")
+    assert pool.add(KEY, "a2")
+    assert not pool.add(KEY, "a3")
+    assert pool.key_of("a3") is None
+    assert pool.get_stats()["occupancy"] == 2
+
+
+def test_busy_key_at_capacity_shares_lru_member():
+    pool = AgentPool(max_per_key=2)
+    pool.add(KEY, "a1")
+    pool.add(KEY, "a2")
+    assert pool.acquire(KEY, _busy) == ("a1", None)
+    assert pool.acquire(KEY, _busy) == ("a2", None)
+
+
+def test_cap_holds_under_concurrent_acquire():
+    pool = AgentPool(max_per_key=4)
+    spawned = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(32)
+
+    def request():
+        barrier.wait()
+        agent_id, pending = pool.acquire(KEY, _busy)
+        if pending is not None:
+            return pending.result(timeout=5)
+        if agent_id is not None:
+            return agent_id
+        with lock:
+            agent_id = f"a{len(spawned)}"
+            spawned.append(agent_id)
+        pool.add(KEY, agent_id)
+        return agent_id
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = list(executor.map(lambda _: request(), range(32)))
+
+    assert len(spawned) <= 4
+    assert set(results) <= set(spawned)
+    assert pool.get_stats()["occupancy"] <= 4
+
+
+def test_collect_expired_and_over_capacity():
+    pool = AgentPool(idle_ttl_seconds=10, max_total=1)
+    pool.add(KEY, "a1")
+    pool.add((None, "general"), "a2")
+
+    assert pool.collect_over_capacity(_idle) == ["a1"]
+    assert pool.collect_expired(lambda agent_id: 0.0, now=time.time() + 100) == ["a2"]
+    assert pool.get_stats()["occupancy"] == 0
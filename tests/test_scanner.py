@@ -0,0 +1,77 @@
+"""Tests for vessels.ssf.scanner.PatternScanner."""
+
+import re
+
+import pytest
+
+from vessels.ssf.plan import compile_patterns
+from vessels.ssf.scanner import COMBINED_MAX_LENGTH, PatternScanner
+
+PATTERNS = [
+    r"password",
+    r"\bssn\b",
+    r"\d{3}-\d{2}-\d{4}",
+    r"(?i)drop\s+table",
+    r"rm\s+-rf",
+    r"(ab)\1",
+]
+
+PAYLOADS = [
+    {"message": "hello there", "recipients": ["+18085550100"]},
+    {"user": {"name": "Ana", "PASSWORD": "hunter2"}},
+    {"query": "select 1; DROP   TABLE users"},
+    {"notes": ["fine", "also fine", {"ssn": None}]},
+    {"id": 123456789, "ref": "123-45-6789"},
+    {"command": "x" * (COMBINED_MAX_LENGTH * 4) + " rm -rf /"},
+    {"tags": ("a", "b"), "flags": {"abab"}},
+    {"count": 3, "ratio": 0.5, "ok": True, "missing": None},
+    ["plain", "list", "of", "words"],
+    "bare string mentioning a password",
+]
+
+
+def _old_match(patterns, data):
+    """The matching the scanner replaced: each pattern over str(data)."""
+    return any(re.search(pattern, str(data), re.IGNORECASE) for pattern in patterns)
+
+
+@pytest.mark.parametrize("data", PAYLOADS)
+def test_matches_agree_with_str_matching(data):
+    pairs, error = compile_patterns(PATTERNS)
+    assert error is None
+    scanner = PatternScanner(pairs)
+    assert (scanner.search(data) is not None) == _old_match(PATTERNS, data)
+
+
+@pytest.mark.parametrize("data", PAYLOADS)
+def test_each_pattern_agrees_with_str_matching(data):
+    for pattern in PATTERNS:
+        scanner = PatternScanner(compile_patterns([pattern])[0])
+        found = scanner.search(data)
+        assert (found is not None) == _old_match([pattern], data), pattern
+        assert found in (None, pattern)
+
+
+def test_reports_the_matching_pattern():
+    scanner = PatternScanner(compile_patterns(PATTERNS)[0])
+    assert scanner.search({"field": "my SSN"}) == r"\bssn\b"
+    assert scanner.search({"key": "555-12-3456"}) == r"\d{3}-\d{2}-\d{4}"
+    assert scanner.search({"key": "xabab"}) == r"(ab)\1"
+
+
+def test_keys_are_searched():
+    scanner = PatternScanner(compile_patterns(["password"])[0])
+    assert scanner.search({"password": 1}) == "password"
+
+
+def test_long_and_short_text_agree():
+    scanner = PatternScanner(compile_patterns(PATTERNS)[0])
+    short = "drop table x"
+    long = "." * (COMBINED_MAX_LENGTH + 1) + short
+    assert scanner.search_text(short) == scanner.search_text(long) == r"(?i)drop\s+table"
+
+
+def test_empty_scanner_matches_nothing():
+    scanner = PatternScanner([])
+    assert not scanner
+    assert scanner.search({"password": "x"}) is None
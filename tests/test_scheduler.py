@@ -0,0 +1,80 @@
+"""Tests for vessels.a0.scheduler.AgentScheduler."""
+
+import functools
+import threading
+import time
+
+import pytest
+
+from vessels.a0.scheduler import AgentScheduler
+
+
+@pytest.fixture
+def make_scheduler(started):
+    return functools.partial(started, AgentScheduler)
+
+
+def test_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        AgentScheduler(lambda agent_id: False, max_workers=0)
+
+
+def test_reruns_agent_while_it_reports_more_work(make_scheduler, wait_for):
+    remaining = {"a": 5}
+
+    def run_cycle(agent_id):
+        remaining[agent_id] -= 1
+        return remaining[agent_id] > 0
+
+    scheduler = make_scheduler(run_cycle, max_workers=2)
+    scheduler.notify("a")
+    wait_for(lambda: remaining["a"] == 0)
+    wait_for(lambda: scheduler.get_stats()["cycles"] == 5)
+
+
+def test_agent_never_runs_on_two_workers_at_once(make_scheduler, wait_for):
+    active = set()
+    overlaps = []
+    lock = threading.Lock()
+    cycles = {"n": 0}
+
+    def run_cycle(agent_id):
+        with lock:
+            if agent_id in active:
+                overlaps.append(agent_id)
+            active.add(agent_id)
+            cycles["n"] += 1
+        time.sleep(0.001)
+        with lock:
+            active.discard(agent_id)
+        return False
+
+    scheduler = make_scheduler(run_cycle, max_workers=4)
+    for _ in range(200):
+        scheduler.notify("a")
+    wait_for(lambda: scheduler.get_stats()["ready"] == 0 and not scheduler.get_stats()["in_flight"])
+    assert not overlaps
+    assert cycles["n"] >= 1
+
+
+def test_notify_group_wakes_resolved_members(make_scheduler, wait_for):
+    seen = set()
+    lock = threading.Lock()
+
+    def run_cycle(agent_id):
+        with lock:
+            seen.add(agent_id)
+        return False
+
+    scheduler = make_scheduler(run_cycle, resolve_group=lambda group: [f"{group}-1", f"{group}-2"])
+    scheduler.notify_group("topic")
+    wait_for(lambda: seen == {"topic-1", "topic-2"})
+
+
+def test_cycle_errors_are_counted(make_scheduler, wait_for):
+    def run_cycle(agent_id):
+        raise RuntimeError("boom")
+
+    scheduler = make_scheduler(run_cycle)
+    scheduler.notify("a")
+    wait_for(lambda: scheduler.get_stats()["errors"] == 1)
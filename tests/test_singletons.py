@@ -0,0 +1,70 @@
+"""Tests for the lazy module-level singletons."""
+
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+import agent_zero_core
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (module, accessor, backward-compatible attribute, private cache)
+SINGLETONS = [
+    ("agent_zero_core", "get_agent_zero", "agent_zero", "_agent_zero"),
+    ("community_memory", "get_community_memory", "community_memory", "_community_memory"),
+    ("vessels_interface", "get_vessels_interface", "vessels_interface", "_vessels_interface"),
+]
+
+
+def _import(name):
+    if name != "agent_zero_core":
+        pytest.importorskip("numpy")  # community_memory needs it at import
+    return importlib.import_module(name)
+
+
+@pytest.mark.parametrize("name, accessor, attribute, cache", SINGLETONS)
+def test_created_on_first_access_only(monkeypatch, name, accessor, attribute, cache):
+    module = _import(name)
+    monkeypatch.setattr(module, cache, None)
+
+    instance = getattr(module, accessor)()
+    assert getattr(module, cache) is instance
+    assert getattr(module, accessor)() is instance
+
+
+@pytest.mark.parametrize("name, accessor, attribute, cache", SINGLETONS)
+def test_old_module_attribute_resolves_to_singleton(monkeypatch, name, accessor, attribute, cache):
+    module = _import(name)
+    monkeypatch.setattr(module, cache, None)
+
+    assert getattr(module, attribute) is getattr(module, accessor)()
+    namespace = {}
+    exec(f"from {name} import {attribute}", namespace)
+    assert namespace[attribute] is getattr(module, cache)
+
+
+def test_importing_creates_nothing():
+    # A fresh interpreter, so other tests' instances do not count
+    code = (
+        "import agent_zero_core\n"
+        "assert agent_zero_core._agent_zero is None\n"
+        "try:\n"
+        "    agent_zero_core.not_a_singleton\n"
+        "except AttributeError:\n"
+        "    pass\n"
+        "else:\n"
+        "    raise SystemExit('unknown attribute resolved')\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True)
+
+
+def test_concurrent_first_access_builds_one(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(agent_zero_core, "_agent_zero", None)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        instances = list(pool.map(lambda _: agent_zero_core.get_agent_zero(), range(8)))
+    assert all(instance is instances[0] for instance in instances)
@@ -0,0 +1,101 @@
+"""Tests for vessels.a0.snapshot and AgentZeroCore warm restarts."""
+
+import pickle
+
+import pytest
+
+from agent_zero_core import AgentRuntime, AgentZeroCore
+from vessels.a0.message_bus import freeze
+from vessels.a0.snapshot import SnapshotError, read_snapshot, thaw, write_snapshot
+
+
+def test_thaw_reverses_freeze():
+    message = {"a": [1, {"b": 2}], "c": {3}}
+    assert thaw(freeze(message)) == {"a": [1, {"b": 2}], "c": {3}}
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "state" / "snapshot.pkl"
+    size = write_snapshot(str(path), {"agents": [{"id": "a"}]})
+
+    snapshot = read_snapshot(str(path))
+    assert size == path.stat().st_size
+    assert snapshot["state"] == {"agents": [{"id": "a"}]}
+    assert list(path.parent.iterdir()) == [path]  # No temp files left behind
+
+
+def test_unreadable_or_foreign_snapshots_raise(tmp_path):
+    corrupt = tmp_path / "corrupt.pkl"
+    corrupt.write_bytes(b"not a pickle")
+    with pytest.raises(SnapshotError):
+        read_snapshot(str(corrupt))
+
+    foreign = tmp_path / "foreign.pkl"
+    foreign.write_bytes(pickle.dumps({"version": 999, "state": {}}))
+    with pytest.raises(SnapshotError):
+        read_snapshot(str(foreign))
+
+    with pytest.raises(SnapshotError):
+        read_snapshot(str(tmp_path / "missing.pkl"))
+
+
+def test_core_restores_agents_tasks_and_pool(tmp_path):
+    path = str(tmp_path / "snapshot.pkl")
+    core = AgentZeroCore()
+    agent_id = core.process_request("find grants for us")["agents"][0]
+    core.agents[agent_id].memory["active_tasks"].submit({"type": "grant_search"}, task_id="t1")
+    core.save_snapshot(path)
+
+    restored = AgentZeroCore()
+    assert restored.restore_snapshot(path) == 1
+    agent = restored.agents[agent_id]
+    assert [task.task_id for task in agent.memory["active_tasks"].pending()] == ["t1"]
+    assert restored.agent_pool.key_of(agent_id) == core.agent_pool.key_of(agent_id)
+
+
+def test_restored_idle_agents_are_reused(tmp_path):
+    path = str(tmp_path / "snapshot.pkl")
+    core = AgentZeroCore()
+    agent_id = core.process_request("find grants for us")["agents"][0]
+    core.save_snapshot(path)
+
+    restored = AgentZeroCore()
+    restored.restore_snapshot(path)
+    assert restored.process_request("find grants for us")["agents"] == [agent_id]
+
+
+def _snapshot_with_truncated_record(path):
+    core = AgentZeroCore()
+    core.process_request("find grants for us")
+    core.process_request("coordinate volunteers")
+    core.save_snapshot(path)
+    records = read_snapshot(path)["state"]["agents"]
+    del records[1]["tasks"]
+    write_snapshot(path, {"agents": records})
+    return records
+
+
+def test_malformed_record_restores_nothing(tmp_path):
+    path = str(tmp_path / "snapshot.pkl")
+    records = _snapshot_with_truncated_record(path)
+
+    restored = AgentZeroCore()
+    with pytest.raises(SnapshotError):
+        restored.restore_snapshot(path)
+    assert len(restored.agents) == 0
+    assert restored.agent_pool.key_of(records[0]["id"]) is None
+
+
+def test_initialize_starts_cold_on_malformed_record(tmp_path):
+    path = str(tmp_path / "snapshot.pkl")
+    _snapshot_with_truncated_record(path)
+
+    # ASYNCIO: no coordination thread to wait out on shutdown
+    core = AgentZeroCore(snapshot_path=path, agent_runtime=AgentRuntime.ASYNCIO)
+    core.initialize()
+    try:
+        assert len(core.agents) == 0
+        assert core.running
+    finally:
+        core.snapshot_path = None  # Keep the fixture file as written
+        core.shutdown()
@@ -0,0 +1,98 @@
+"""Tests for vessels.ssf.metrics."""
+
+import math
+import random
+
+from vessels.ssf.metrics import LatencyHistogram, SSFMetrics, Stage, StageTimer
+
+# Each power of two is split into 16 buckets, so a bucket midpoint is
+# within 1/32 of any value in it
+RELATIVE_ERROR = 1 / 32
+
+
+def _nearest_rank(values, q):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def test_bounds_cover_recorded_values():
+    rng = random.Random(7)
+    values = list(range(200)) + [rng.randrange(1, 10 ** 12) for _ in range(2000)]
+    for value in values:
+        histogram = LatencyHistogram()
+        histogram.record_many_ns([value])
+        (index,) = histogram.counts
+        low, high = LatencyHistogram._bounds(index)
+        assert low <= value < high
+        if value >= 32:
+            assert (high - low) / low <= 1 / 16
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    histogram.record_many_ns(list(range(1, 33)))
+    assert [value * 1e9 for value in histogram.quantiles((0.25, 0.5, 1.0))] == [8, 16, 32]
+
+
+def test_quantiles_match_known_inputs():
+    rng = random.Random(11)
+    values = [rng.randrange(1_000, 50_000_000) for _ in range(10_000)]
+    histogram = LatencyHistogram()
+    histogram.record_many_ns(values)
+
+    quantiles = (0.5, 0.9, 0.95, 0.99, 0.999)
+    for q, value in zip(quantiles, histogram.quantiles(quantiles)):
+        expected = _nearest_rank(values, q)
+        assert abs(value * 1e9 - expected) <= expected * RELATIVE_ERROR, q
+
+
+def test_quantiles_keep_request_order_and_clamp_to_seen_values():
+    histogram = LatencyHistogram()
+    histogram.record(0.0123)
+    p99, p50 = histogram.quantiles((0.99, 0.5))
+    assert p99 == p50 == 0.0123
+
+
+def test_summary_in_milliseconds():
+    histogram = LatencyHistogram()
+    assert histogram.summary()["p50_ms"] == 0.0
+    histogram.record_many_ns([1_000_000, 3_000_000])
+    summary = histogram.summary()
+    assert summary["count"] == 2
+    assert summary["mean_ms"] == 2.0
+    assert summary["max_ms"] == 3.0
+
+
+def test_overhead_excludes_handler_time():
+    timer = StageTimer()
+    timer.lap(Stage.RESOLVE)
+    timer.lap(Stage.EXECUTE)
+    timer.lap(Stage.LOG)
+    handler_ns = timer.laps[1][1]
+
+    assert [stage for stage, _ in timer.laps] == [Stage.RESOLVE, Stage.EXECUTE, Stage.LOG]
+    assert timer.handler_ns == handler_ns
+    assert timer.overhead_ns == timer.last - timer.started - handler_ns
+
+
+def test_record_flags_over_budget():
+    metrics = SSFMetrics()
+    timer = StageTimer()
+    timer.lap(Stage.RESOLVE)
+    assert metrics.record("echo", "computation", timer, budget_seconds=0)
+    assert not metrics.record("echo", "computation", timer, budget_seconds=60)
+    assert metrics.over_budget_total() == 1
+    assert metrics.summary()["echo"]["stages"]["resolve"]["count"] == 2
+
+
+def test_prometheus_escapes_labels():
+    metrics = SSFMetrics()
+    timer = StageTimer()
+    timer.lap(Stage.RESOLVE)
+    metrics.record('say "hi"\\\n', "computation", timer, budget_seconds=0)
+
+    text = metrics.to_prometheus()
+    labels = 'ssf="say \\"hi\\"\\\\\\n",category="computation"'
+    assert f'vessels_ssf_stage_seconds_count{{{labels},stage="resolve"}} 1' in text
+    assert f"vessels_ssf_over_budget_total{{{labels}}} 1" in text
+    assert "\n\n" not in text
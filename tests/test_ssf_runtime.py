@@ -0,0 +1,139 @@
+"""Tests for SSFRuntime.invoke."""
+
+import asyncio
+import logging
+from uuid import uuid4
+
+import pytest
+
+from vessels.ssf import SSFDefinition, SSFHandler, SSFRegistry, SSFRuntime, SSFStatus
+from vessels.ssf.runtime import A0AgentInstance, Persona
+
+OUTPUT_SCHEMA = {
+    "type": "object",
+    "required": ["count"],
+    "properties": {
+        "count": {"type": "integer"},
+        "name": {"type": "string"},
+        "rows": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+def echo(**inputs):
+    """Module handler: return whatever output the test passed in."""
+    return inputs["output"]
+
+
+class _Unprintable(list):
+    """A list that fails the test if anything turns it into a string."""
+
+    def __repr__(self):
+        raise AssertionError("output was serialized")
+
+    __str__ = __repr__
+
+
+@pytest.fixture
+def invoke():
+    """Invoke an "echo" SSF returning output; it is registered on the first call."""
+    registry = SSFRegistry()
+    runtime = SSFRuntime(registry=registry)
+    persona = Persona(id=uuid4(), name="tester", community_id="test")
+    agent = A0AgentInstance(agent_id="agent", persona_id=persona.id)
+
+    def call(output, output_schema=OUTPUT_SCHEMA, **definition):
+        ssf = asyncio.run(registry.get_by_name("echo"))
+        if ssf is None:
+            ssf = SSFDefinition(
+                name="echo",
+                handler=SSFHandler.module(__name__, "echo"),
+                output_schema=output_schema,
+                **definition,
+            )
+            asyncio.run(registry.register(ssf))
+        return asyncio.run(runtime.invoke(ssf.id, {"output": output}, persona, agent))
+
+    call.runtime = runtime
+    return call
+
+
+def test_output_matching_schema_succeeds(invoke):
+    output = {"count": 2, "name": "grants"}
+    result = invoke(output)
+    assert result.status == SSFStatus.SUCCESS
+    assert result.output is output
+    assert invoke.runtime.get_stats()["blocked_invocations"] == 0
+
+
+def test_output_breaking_schema_is_blocked(invoke):
+    result = invoke({"count": "two", "name": 5})
+
+    assert result.status == SSFStatus.OUTPUT_BLOCKED
+    # Stops at the first error rather than reporting every field
+    assert result.error == "Output schema validation failed: Field count has wrong type, expected integer"
+    assert result.output is None
+    assert invoke.runtime.get_stats()["blocked_invocations"] == 1
+
+
+def test_missing_required_output_field_is_blocked(invoke):
+    result = invoke({"name": "grants"})
+    assert result.status == SSFStatus.OUTPUT_BLOCKED
+    assert result.error.endswith("Missing required field: count")
+
+
+def test_none_output_skips_schema_check(invoke):
+    assert invoke(None).status == SSFStatus.SUCCESS
+
+
+def test_large_output_is_validated_in_place(invoke):
+    rows = _Unprintable(f"row {i}" for i in range(100_000))
+    result = invoke({"count": len(rows), "rows": rows})
+    assert result.status == SSFStatus.SUCCESS
+    assert result.output["rows"] is rows
+
+
+def test_large_output_with_bad_item_reports_its_path(invoke):
+    rows = _Unprintable(f"row {i}" for i in range(1000))
+    rows[700] = 700
+    result = invoke({"count": 1, "rows": rows})
+    assert result.status == SSFStatus.OUTPUT_BLOCKED
+    assert result.error.endswith("Field rows[700] has wrong type, expected string")
+
+
+def test_stage_latencies_recorded_after_one_invoke(invoke):
+    invoke({"count": 1})
+
+    stats = invoke.runtime.get_stats()
+    echo_stats = stats["stages"]["echo"]
+    assert echo_stats["category"] == "computation"
+    assert echo_stats["overhead"]["count"] == 1
+    assert set(echo_stats["stages"]) == {
+        "resolve", "permissions", "input_schema", "input_manifold", "bind",
+        "execute", "output_schema", "output_manifold", "log",
+    }
+    assert all(stage["count"] == 1 for stage in echo_stats["stages"].values())
+
+
+def test_early_return_records_stages_reached(invoke):
+    result = invoke({"count": 1}, input_schema={"type": "object", "required": ["query"]})
+
+    assert result.status == SSFStatus.BLOCKED
+    stages = invoke.runtime.get_stats()["stages"]["echo"]["stages"]
+    assert set(stages) == {"resolve", "permissions", "input_schema"}
+
+
+def test_over_budget_invocations_are_counted_and_warned(invoke, caplog):
+    invoke.runtime.latency_budget_ms = 0
+    with caplog.at_level(logging.WARNING, logger="vessels.ssf.runtime"):
+        invoke({"count": 1})
+    assert invoke.runtime.get_stats()["over_budget_invocations"] == 1
+    assert not any("latency budget" in record.message for record in caplog.records)
+
+    invoke.runtime.warn_over_budget = True
+    with caplog.at_level(logging.WARNING, logger="vessels.ssf.runtime"):
+        invoke({"count": 1})
+    warnings = [record.message for record in caplog.records if "latency budget" in record.message]
+    assert len(warnings) == 1
+    assert warnings[0].startswith("SSF echo overhead ")
+    assert "resolve=" in warnings[0] and "execute=" not in warnings[0]
@@ -0,0 +1,86 @@
+"""Tests for vessels.startup_profile and --profile-startup."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from agent_zero_core import AgentZeroCore
+from vessels.startup_profile import PROFILE_VERSION, StartupProfiler, _TimingLoader
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def modules(tmp_path, monkeypatch):
+    """A module that imports a slow one, importable as profiled_outer/profiled_inner."""
+    (tmp_path / "profiled_inner.py").write_text("import time\ntime.sleep(0.05)\n")
+    (tmp_path / "profiled_outer.py").write_text("import profiled_inner\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    for name in ("profiled_outer", "profiled_inner"):
+        sys.modules.pop(name, None)
+
+
+def test_self_time_excludes_nested_imports(modules):
+    profiler = StartupProfiler().start()
+    try:
+        import profiled_outer
+    finally:
+        profiler.stop()
+
+    imports = {record["module"]: record for record in profiler.imports()}
+    inner, outer = imports["profiled_inner"], imports["profiled_outer"]
+    assert inner["self_ms"] >= 50
+    assert outer["cumulative_ms"] >= inner["cumulative_ms"]
+    assert outer["self_ms"] < inner["self_ms"]
+    assert profiler.imports()[0]["module"] == "profiled_inner"  # Ranked by self time
+    # The real loader is put back once the module has run
+    assert not isinstance(profiled_outer.__loader__, _TimingLoader)
+    assert not isinstance(profiled_outer.__spec__.loader, _TimingLoader)
+
+
+def test_stop_removes_the_finder(modules):
+    profiler = StartupProfiler().start()
+    assert profiler.running
+    profiler.stop()
+    assert not profiler.running
+
+    import profiled_outer  # noqa: F401
+    assert profiler.imports() == []
+
+
+def test_phases_subsystems_and_artifact(tmp_path):
+    profiler = StartupProfiler().start()
+    with profiler.phase("construct"):
+        time.sleep(0.01)
+    profiler.record_subsystems({"ssf": 0.002, "gardener": 0.004})
+
+    path = tmp_path / "profile.json"
+    stream = io.StringIO()
+    profile = profiler.finish(str(path), stream=stream)
+
+    assert json.loads(path.read_text()) == json.loads(json.dumps(profile))
+    assert profile["version"] == PROFILE_VERSION
+    assert profile["phases_ms"]["construct"] >= 10
+    assert list(profile["subsystems_ms"]) == ["gardener", "ssf"]  # Slowest first
+    report = stream.getvalue()
+    assert "construct" in report and "gardener" in report
+    assert f"Startup profile written to {path}" in report
+
+
+def test_cli_writes_profile(tmp_path):
+    path = tmp_path / "startup.json"
+    subprocess.run(
+        [sys.executable, "vessels_cli.py", "--profile-startup", str(path), "--status"],
+        cwd=REPO_ROOT, check=True, capture_output=True, timeout=60,
+    )
+
+    profile = json.loads(path.read_text())
+    assert "AgentZeroCore.initialize()" in profile["phases_ms"]
+    assert set(profile["subsystems_ms"]) == set(AgentZeroCore.SUBSYSTEMS)
+    assert "agent_zero_core" in {record["module"] for record in profile["imports"]}
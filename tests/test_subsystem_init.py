@@ -0,0 +1,99 @@
+"""Tests for AgentZeroCore's lazy, eager and parallel subsystem initialization."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agent_zero_core import AgentRuntime, AgentZeroCore, _LazySubsystem
+
+# Subsystem name -> the core attributes its initializer sets
+ATTRIBUTES = {}
+for _attribute, _value in vars(AgentZeroCore).items():
+    if isinstance(_value, _LazySubsystem):
+        ATTRIBUTES.setdefault(_value.subsystem, []).append(_attribute)
+
+
+class _FakeSubsystemsCore(AgentZeroCore):
+    """AgentZeroCore whose subsystem initializers only record that they ran."""
+
+    def __init__(self, barrier=None, **kwargs):
+        self.built = []
+        self.barrier = barrier
+        kwargs.setdefault("agent_runtime", AgentRuntime.ASYNCIO)
+        super().__init__(**kwargs)
+
+    def _build(self, name):
+        self.built.append((name, threading.current_thread()))
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        for attribute in ATTRIBUTES[name]:
+            setattr(self, attribute, f"{name} instance")
+
+
+for _name, _method in AgentZeroCore.SUBSYSTEMS.items():
+    setattr(_FakeSubsystemsCore, _method, lambda self, name=_name: self._build(name))
+
+
+def test_lazy_subsystem_built_on_first_access():
+    core = _FakeSubsystemsCore(subsystem_init="lazy")
+    assert core.built == []
+    assert core.get_subsystem_stats()["initialized"] == []
+
+    assert core.gardener == "gardener instance"
+    assert core.gardener == "gardener instance"
+    assert [name for name, _ in core.built] == ["gardener"]
+    assert core.get_subsystem_stats()["initialized"] == ["gardener"]
+
+
+def test_attributes_of_one_subsystem_share_one_build():
+    core = _FakeSubsystemsCore(subsystem_init="lazy")
+    assert core.a2a_registry == core.a2a_service == "a2a instance"
+    assert [name for name, _ in core.built] == ["a2a"]
+
+
+def test_warm_up_builds_requested_subsystems():
+    core = _FakeSubsystemsCore(subsystem_init="lazy")
+    times = core.warm_up(parallel=False, subsystems=["ssf", "gardener"])
+
+    assert set(times) == {"ssf", "gardener"}
+    assert sorted(name for name, _ in core.built) == ["gardener", "ssf"]
+    assert "ssf_integration" in vars(core)  # Now a plain attribute
+
+    with pytest.raises(ValueError):
+        core.warm_up(subsystems=["nope"])
+
+
+def test_parallel_warm_up_builds_concurrently():
+    # Every initializer waits for all the others: only passes if they overlap
+    barrier = threading.Barrier(len(AgentZeroCore.SUBSYSTEMS))
+    core = _FakeSubsystemsCore(barrier=barrier, subsystem_init="lazy")
+    core.warm_up(parallel=True)
+
+    assert not barrier.broken
+    assert len({thread for _, thread in core.built}) == len(AgentZeroCore.SUBSYSTEMS)
+
+
+def test_concurrent_first_access_builds_once():
+    core = _FakeSubsystemsCore(subsystem_init="lazy")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        values = list(pool.map(lambda _: core.conversation_store, range(8)))
+    assert values == ["conversation_store instance"] * 8
+    assert [name for name, _ in core.built] == ["conversation_store"]
+
+
+@pytest.mark.parametrize("mode, built", [
+    ("lazy", []),
+    ("eager", list(AgentZeroCore.SUBSYSTEMS)),
+    ("parallel", list(AgentZeroCore.SUBSYSTEMS)),
+])
+def test_initialize_builds_by_mode(mode, built):
+    core = _FakeSubsystemsCore(subsystem_init=mode)
+    core.initialize()
+    try:
+        assert sorted(name for name, _ in core.built) == sorted(built)
+        assert core.get_subsystem_stats()["pending"] == [
+            name for name in AgentZeroCore.SUBSYSTEMS if name not in built
+        ]
+    finally:
+        core.shutdown()
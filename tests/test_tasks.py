@@ -0,0 +1,122 @@
+"""Tests for vessels.a0.tasks."""
+
+import json
+import time
+
+import pytest
+
+from vessels.a0.tasks import AgentTask, InteractionHistory, TaskQueue, TaskState
+
+
+def test_fifo_order_and_state():
+    queue = TaskQueue()
+    queue.submit("a", task_id="t1")
+    queue.submit("b", task_id="t2")
+
+    first = queue.next()
+    assert (first.task_id, first.payload, first.state) == ("t1", "a", TaskState.RUNNING)
+    assert queue.next().task_id == "t2"
+    assert queue.next() is None
+    assert not queue
+
+
+def test_duplicate_pending_id_is_rejected():
+    queue = TaskQueue()
+    queue.submit("a", task_id="t1")
+    with pytest.raises(ValueError):
+        queue.submit("b", task_id="t1")
+
+    task = queue.next()
+    assert task.payload == "a"
+    assert queue.next() is None
+    assert queue.get_stats()["submitted"] == 1
+
+
+def test_id_can_be_reused_once_dequeued():
+    queue = TaskQueue()
+    queue.submit("a", task_id="t1")
+    queue.next()
+    queue.submit("b", task_id="t1")
+    assert queue.next().payload == "b"
+
+
+def test_restore_skips_duplicates_without_losing_tasks():
+    queue = TaskQueue()
+    queue.submit("a", task_id="t1")
+    queue.restore([AgentTask(task_id="t1", payload="b"), AgentTask(task_id="t2", payload="c")])
+
+    assert [queue.next().payload for _ in range(2)] == ["a", "c"]
+    assert queue.next() is None
+
+
+def test_cancel_skips_task():
+    queue = TaskQueue()
+    queue.submit("a", task_id="t1")
+    queue.submit("b", task_id="t2")
+
+    assert queue.cancel("t1")
+    assert not queue.cancel("t1")
+    assert len(queue) == 1
+    assert queue.next().task_id == "t2"
+
+
+def test_expired_task_is_dropped():
+    queue = TaskQueue()
+    queue.submit("a", deadline=time.time() - 1)
+    assert queue.next() is None
+    assert queue.get_stats()["expired"] == 1
+
+
+def test_failed_task_retried_then_failed():
+    queue = TaskQueue(max_retries=1)
+    queue.submit("a", task_id="t1")
+
+    task = queue.next()
+    assert queue.complete(task, success=False)
+    task = queue.next()
+    assert task.attempts == 2
+    assert not queue.complete(task, success=False)
+    assert task.state == TaskState.FAILED
+
+
+def test_retry_yields_to_resubmitted_id():
+    queue = TaskQueue(max_retries=1)
+    queue.submit("a", task_id="t1")
+    task = queue.next()
+    queue.submit("b", task_id="t1")
+
+    assert not queue.complete(task, success=False)
+    assert queue.next().payload == "b"
+    assert queue.next() is None
+
+
+def test_history_caps_and_spills(tmp_path):
+    spill = tmp_path / "history.jsonl"
+    history = InteractionHistory(capacity=2, spill_path=str(spill), spill_batch=1)
+    for i in range(4):
+        history.append({"i": i})
+
+    assert [record["i"] for record in history] == [2, 3]
+    lines = spill.read_text().splitlines()
+    assert [json.loads(line)["i"] for line in lines] == [0, 1]
+
+
+def test_requeue_puts_unstarted_task_back_at_head():
+    queue = TaskQueue()
+    queue.submit("a", task_id="a")
+    queue.submit("b", task_id="b")
+    task = queue.next()
+
+    queue.requeue(task)
+    assert [t.task_id for t in queue.pending()] == ["a", "b"]
+    assert queue.next() is task and task.attempts == 1
+
+
+def test_requeue_yields_to_resubmitted_id():
+    queue = TaskQueue()
+    queue.submit("old", task_id="a")
+    task = queue.next()
+    queue.submit("new", task_id="a")
+
+    queue.requeue(task)
+    assert [t.payload for t in queue.pending()] == ["new"]
@@ -0,0 +1,93 @@
+"""Tests for the vessels_cli batch pipeline and concurrent REPL."""
+
+import asyncio
+import io
+import json
+import os
+import subprocess
+import sys
+
+from vessels_cli import VesselsCLI
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _StubCore:
+    """AgentZeroCore stand-in tracking how many requests run at once."""
+
+    def __init__(self):
+        self.agents = {}
+        self.running = True
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def process_request_async(self, user_input, user_id="default"):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(10 if user_input == "slow" else 0.01)
+            if user_input == "boom":
+                raise RuntimeError("boom")
+            return {"message": f"done: {user_input}", "agents": ["a"]}
+        finally:
+            self.in_flight -= 1
+
+
+def _cli():
+    # Skip __init__: no banner and no real core
+    cli = VesselsCLI.__new__(VesselsCLI)
+    cli.agent_zero = _StubCore()
+    return cli
+
+
+def test_batch_writes_one_result_per_request(tmp_path):
+    path = tmp_path / "requests.txt"
+    lines = [f"request {i}" for i in range(10)]
+    path.write_text("# comment\n\n" + "\n".join(lines[:5]) + "\nboom\n" + "\n".join(lines[5:]) + "\n")
+    cli = _cli()
+    output = io.StringIO()
+
+    summary = cli.run_batch(str(path), concurrency=3, output=output)
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert len(records) == 11
+    assert sorted(r["request"] for r in records if r["status"] == "ok") == sorted(lines)
+    assert [r["line"] for r in records if r["status"] == "error"] == [8]
+    assert summary["requests"] == 11 and summary["errors"] == 1
+    assert 1 < cli.agent_zero.max_in_flight <= 3
+
+
+def test_batch_with_missing_file_returns_none(tmp_path):
+    assert _cli().run_batch(str(tmp_path / "missing.txt")) is None
+
+
+def test_concurrent_repl_lists_and_cancels_jobs(capsys):
+    cli = _cli()
+    script = ["slow", "fast", "jobs", "cancel 1", "cancel 9", None]
+    cli._start_input_reader = lambda loop, lines: [lines.put_nowait(line) for line in script]
+
+    asyncio.run(cli._concurrent_repl(max_workers=2))
+
+    out = capsys.readouterr().out
+    assert "[#1] submitted" in out and "[#2] submitted" in out
+    assert "#1" in out.split("[#2] submitted")[1]  # Listed by 'jobs'
+    assert "[#1] cancelled" in out
+    assert "No in-flight request '9'" in out
+    assert "Vessels: done: fast" in out
+    assert "done: slow" not in out
+
+
+def test_batch_command_line(tmp_path):
+    path = tmp_path / "requests.txt"
+    path.write_text("find grants for us\ncoordinate volunteers\nhelp elders\n")
+
+    completed = subprocess.run(
+        [sys.executable, "vessels_cli.py", "--batch", str(path), "--concurrency", "2"],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=60,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    records = [json.loads(line) for line in completed.stdout.splitlines()]
+    assert sorted(r["line"] for r in records) == [1, 2, 3]
+    assert all(r["status"] == "ok" for r in records)
+    assert "3 requests, 0 errors" in completed.stderr
@@ -0,0 +1,159 @@
+"""Tests for vessels_server."""
+
+import asyncio
+import json
+
+import pytest
+
+import vessels_server
+from vessels_server import VesselsServer, _valid_id
+
+needs_aiohttp = pytest.mark.skipif(vessels_server.web is None, reason="aiohttp not installed")
+
+
+class _StubCore:
+    """Minimal AgentZeroCore stand-in for the server."""
+
+    def __init__(self):
+        self.agents = {}
+
+    async def process_request_async(self, user_input, user_id="default"):
+        await asyncio.sleep(0.05)
+        return {"status": "success", "input": user_input, "user_id": user_id}
+
+
+def test_valid_id():
+    assert _valid_id(None)
+    assert _valid_id(1)
+    assert _valid_id("abc")
+    assert not _valid_id([1])
+    assert not _valid_id({"a": 1})
+
+
+@needs_aiohttp
+def test_bad_websocket_id_keeps_connection_open():
+    from aiohttp.test_utils import TestClient, TestServer
+
+    async def scenario():
+        server = VesselsServer(_StubCore())
+        async with TestClient(TestServer(server.create_app())) as client:
+            ws = await client.ws_connect("/ws")
+            await ws.send_json({"id": 1, "type": "request", "input": "hello"})
+            await ws.send_json({"id": [1], "type": "request", "input": "x"})
+            await ws.send_json({"id": 2, "type": "cancel", "target": {"a": 1}})
+
+            replies = [await ws.receive_json(timeout=5) for _ in range(3)]
+            await ws.close()
+        return replies
+
+    replies = asyncio.run(scenario())
+    errors = [r for r in replies if not r["ok"]]
+    assert len(errors) == 2 and all(r["id"] is None for r in errors)
+    assert [r["result"]["input"] for r in replies if r["ok"]] == ["hello"]
+
+
+PERSONA_ID = "8c8f3f2e-3f57-4f1b-9a55-0f6c1a1f7b21"
+
+
+def _ssf_server():
+    return VesselsServer(_StubCore(), ssf_sessions={
+        "s3cret": {"persona_id": PERSONA_ID, "name": "kupuna", "community_id": "ohana"},
+    })
+
+
+@needs_aiohttp
+def test_ssf_session_resolves_bearer_token():
+    session = _ssf_server().ssf_session("Bearer s3cret")
+    assert str(session["persona_id"]) == PERSONA_ID
+    assert session["community_id"] == "ohana"
+    assert session["agent_id"] == "http"
+
+
+@needs_aiohttp
+@pytest.mark.parametrize("authorization", [None, "", "s3cret", "Bearer", "Bearer wrong", "Basic s3cret"])
+def test_ssf_session_rejects_missing_or_unknown_token(authorization):
+    with pytest.raises(PermissionError):
+        _ssf_server().ssf_session(authorization)
+
+
+@needs_aiohttp
+def test_ssf_disabled_without_sessions():
+    with pytest.raises(PermissionError):
+        VesselsServer(_StubCore()).ssf_session("Bearer s3cret")
+
+
+@needs_aiohttp
+def test_ssf_identity_ignores_request_body():
+    server = _ssf_server()
+    seen = {}
+
+    async def handle_ssf_tool_call(tool, arguments, persona, agent):
+        seen.update(persona=persona, agent=agent)
+        return {"ok": True}
+
+    server.agent_zero.handle_ssf_tool_call = handle_ssf_tool_call
+    server._slots = asyncio.Semaphore(1)
+    body = {"tool": "find_ssf", "persona": {"id": "00000000-0000-0000-0000-000000000000",
+                                            "community_id": "other"}}
+    asyncio.run(server.invoke_ssf(body, server.ssf_session("Bearer s3cret")))
+
+    assert str(seen["persona"].id) == PERSONA_ID
+    assert seen["persona"].community_id == "ohana"
+
+
+def test_load_ssf_sessions_validates_records(tmp_path):
+    path = tmp_path / "sessions.json"
+    path.write_text('{"t": {"name": "no persona"}}')
+    with pytest.raises(ValueError):
+        vessels_server.load_ssf_sessions(str(path))
+
+
+
+@needs_aiohttp
+def test_ssf_invoke_route_requires_session():
+    from aiohttp.test_utils import TestClient, TestServer
+
+    async def scenario():
+        async with TestClient(TestServer(_ssf_server().create_app())) as client:
+            response = await client.post("/ssf/invoke", json={
+                "tool": "find_ssf", "persona": {"id": PERSONA_ID},
+            })
+            return response.status
+
+    assert asyncio.run(scenario()) == 401
+
+
+@needs_aiohttp
+def test_request_input_must_be_a_string():
+    from aiohttp.test_utils import TestClient, TestServer
+
+    async def scenario():
+        server = VesselsServer(_StubCore())
+        async with TestClient(TestServer(server.create_app())) as client:
+            responses = [await client.post("/requests", json={"input": value})
+                         for value in [["x"], {"a": 1}, 5, "", None]]
+            return [(r.status, await r.json()) for r in responses]
+
+    for status, body in asyncio.run(scenario()):
+        assert status == 400
+        assert body["error"] == "'input' must be a non-empty string"
+
+
+@needs_aiohttp
+def test_batch_over_limit_is_rejected_and_bad_items_get_error_lines():
+    from aiohttp.test_utils import TestClient, TestServer
+
+    async def scenario():
+        server = VesselsServer(_StubCore(), max_batch=3)
+        async with TestClient(TestServer(server.create_app())) as client:
+            too_many = await client.post("/requests", json={"requests": ["a", "b", "c", "d"]})
+            batch = await client.post("/requests", json={"requests": ["a", {"input": 7}, 3]})
+            return too_many.status, await too_many.json(), await batch.text()
+
+    status, body, stream = asyncio.run(scenario())
+    assert status == 413
+    assert body["error"] == "At most 3 requests per batch, got 4"
+
+    lines = sorted((json.loads(line) for line in stream.splitlines()), key=lambda r: r["index"])
+    assert [line["ok"] for line in lines] == [True, False, False]
+    assert lines[1]["error"] == "'input' must be a non-empty string"
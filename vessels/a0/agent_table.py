@@ -0,0 +1,150 @@
+"""
+Concurrent agent table for AgentZeroCore.
+
+AgentZeroCore.agents is written by spawning threads and read by the
+coordination loop, scheduler workers and status queries at the same time.
+A plain dict raises "dictionary changed size during iteration" under that
+load. AgentTable shards entries by agent ID, each shard behind its own
+lock, iterates over snapshots, and keeps a per-vessel secondary index.
+"""
+
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+
+class AgentTable(MutableMapping):
+    """
+    Sharded, lock-protected mapping of agent_id -> AgentInstance.
+
+    Behaves like a dict for lookups and mutation. keys(), values() and
+    items() return list snapshots, so callers may mutate the table while
+    iterating over them.
+    """
+
+    def __init__(self, shards: int = 16):
+        """
+        Initialize the table.
+
+        Args:
+            shards: Number of shards (rounded up to a power of two)
+        """
+        size = 1
+        while size < max(shards, 1):
+            size <<= 1
+        self._mask = size - 1
+        self._locks = [threading.Lock() for _ in range(size)]
+        self._shards: List[Dict[str, Any]] = [{} for _ in range(size)]
+
+        self._index_lock = threading.Lock()
+        self._by_vessel: Dict[Optional[str], Set[str]] = {}
+
+    def _shard(self, agent_id: str) -> int:
+        return hash(agent_id) & self._mask
+
+    def __getitem__(self, agent_id: str) -> Any:
+        return self._shards[self._shard(agent_id)][agent_id]
+
+    def get(self, agent_id: str, default: Any = None) -> Any:
+        return self._shards[self._shard(agent_id)].get(agent_id, default)
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._shards[self._shard(agent_id)]
+
+    def __setitem__(self, agent_id: str, agent: Any) -> None:
+        i = self._shard(agent_id)
+        with self._locks[i]:
+            previous = self._shards[i].get(agent_id)
+            self._shards[i][agent_id] = agent
+            self._reindex(agent_id, previous, agent)
+
+    def __delitem__(self, agent_id: str) -> None:
+        i = self._shard(agent_id)
+        with self._locks[i]:
+            agent = self._shards[i].pop(agent_id)
+            self._reindex(agent_id, agent, None)
+
+    def pop(self, agent_id: str, *default: Any) -> Any:
+        i = self._shard(agent_id)
+        with self._locks[i]:
+            if agent_id not in self._shards[i]:
+                if default:
+                    return default[0]
+                raise KeyError(agent_id)
+            agent = self._shards[i].pop(agent_id)
+            self._reindex(agent_id, agent, None)
+        return agent
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def keys(self) -> List[str]:  # type: ignore[override]
+        """Snapshot of agent IDs."""
+        keys: List[str] = []
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                keys.extend(shard)
+        return keys
+
+    def values(self) -> List[Any]:  # type: ignore[override]
+        """Snapshot of agents."""
+        values: List[Any] = []
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                values.extend(shard.values())
+        return values
+
+    def items(self) -> List[Tuple[str, Any]]:  # type: ignore[override]
+        """Snapshot of (agent_id, agent) pairs."""
+        items: List[Tuple[str, Any]] = []
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                items.extend(shard.items())
+        return items
+
+    def clear(self) -> None:
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+        with self._index_lock:
+            self._by_vessel.clear()
+
+    # ------------------------------------------------------------------
+    # Per-vessel secondary index
+    # ------------------------------------------------------------------
+
+    def _reindex(self, agent_id: str, previous: Any, current: Any) -> None:
+        # Called with the agent's shard lock held (lock order: shard, index)
+        old_vessel = getattr(previous, "vessel_id", None)
+        new_vessel = getattr(current, "vessel_id", None)
+        with self._index_lock:
+            if previous is not None:
+                members = self._by_vessel.get(old_vessel)
+                if members is not None:
+                    members.discard(agent_id)
+                    if not members:
+                        del self._by_vessel[old_vessel]
+            if current is not None:
+                self._by_vessel.setdefault(new_vessel, set()).add(agent_id)
+
+    def ids_in_vessel(self, vessel_id: Optional[str]) -> List[str]:
+        """Snapshot of agent IDs in a vessel (None for agents outside any vessel)."""
+        with self._index_lock:
+            return list(self._by_vessel.get(vessel_id, ()))
+
+    def in_vessel(self, vessel_id: Optional[str]) -> List[Any]:
+        """Snapshot of agents in a vessel."""
+        agents = []
+        for agent_id in self.ids_in_vessel(vessel_id):
+            agent = self.get(agent_id)
+            if agent is not None:
+                agents.append(agent)
+        return agents
+
+    def vessel_ids(self) -> List[Optional[str]]:
+        """Vessels that currently have agents."""
+        with self._index_lock:
+            return list(self._by_vessel)
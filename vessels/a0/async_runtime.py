@@ -0,0 +1,274 @@
+"""
+asyncio runtime for AgentZeroCore.
+
+Runs every agent loop, the coordination loop and SSF invocations as tasks
+on a single event loop owned by a dedicated thread. Agents are parked on
+an asyncio.Event and only run a cycle when woken, so thousands of agents
+cost thousands of suspended tasks instead of thousands of OS threads.
+
+Callers on other threads use the thread-safe facade (notify, call,
+run_sync); SSF coroutines run natively on the loop without bridging. The
+coordination callback blocks (health checks, snapshot writes), so it runs
+in the loop's default executor rather than on the loop itself.
+notify_group() wakes a group of agents lazily, as AgentScheduler does:
+the caller marks the group and the loop resolves its members.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAgentRuntime:
+    """
+    Single event loop hosting agent tasks and the coordination loop.
+
+    Exposes the same start/stop/notify/discard/get_stats surface as
+    AgentScheduler so AgentZeroCore can drive either one.
+    """
+
+    def __init__(
+        self,
+        run_cycle: Callable[[str], bool],
+        coordinate: Optional[Callable[[], None]] = None,
+        coordination_interval: float = 5.0,
+        name: str = "a0-asyncio",
+        resolve_group: Optional[Callable[[str], Iterable[str]]] = None,
+    ):
+        """
+        Initialize the runtime.
+
+        Args:
+            run_cycle: Callback running one agent cycle; returns True if more work remains
+            coordinate: Callback run every coordination_interval seconds, off the loop
+            coordination_interval: Seconds between coordination steps
+            name: Name of the loop thread
+            resolve_group: Callback returning the agent IDs of a group, for notify_group()
+        """
+        self.run_cycle = run_cycle
+        self.coordinate = coordinate
+        self.coordination_interval = coordination_interval
+        self.name = name
+        self.resolve_group = resolve_group
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = False
+
+        # agent_id -> (wake event, task); only touched on the loop thread
+        self._events: Dict[str, asyncio.Event] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._coordination_task: Optional[asyncio.Task] = None
+
+        # Groups marked by notify_group() and not yet resolved on the loop
+        self._dirty_groups: Set[str] = set()
+        self._groups_lock = threading.Lock()
+
+        # Statistics
+        self._wakeups = 0
+        self._cycles = 0
+        self._errors = 0
+        self._busy_seconds = 0.0
+
+    def start(self) -> None:
+        """Start the event loop thread."""
+        if self._started:
+            return
+        self._started = True
+
+        ready = threading.Event()
+        self.loop = asyncio.new_event_loop()
+
+        def _run_loop():
+            asyncio.set_event_loop(self.loop)
+            if self.coordinate:
+                self._coordination_task = self.loop.create_task(self._coordination_loop())
+            self.loop.call_soon(ready.set)
+            self.loop.run_forever()
+
+        self._thread = threading.Thread(target=_run_loop, name=self.name, daemon=True)
+        self._thread.start()
+        ready.wait()
+        logger.info("Agent asyncio runtime started")
+
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """Cancel all tasks and stop the event loop."""
+        if not self._started or not self.loop:
+            return
+        self._started = False
+        with self._groups_lock:
+            self._dirty_groups.clear()
+
+        async def _shutdown():
+            tasks = list(self._tasks.values())
+            if self._coordination_task:
+                tasks.append(self._coordination_task)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._tasks.clear()
+            self._events.clear()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_shutdown(), self.loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Error cancelling runtime tasks: {e}")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        self.loop.close()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the event loop thread is active."""
+        return self._started
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is running on the runtime's loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    # ------------------------------------------------------------------
+    # Thread-safe facade
+    # ------------------------------------------------------------------
+
+    def notify(self, agent_id: str) -> None:
+        """Wake an agent's task (creating it on first wake)."""
+        self._call_soon(self._wake, agent_id)
+
+    def notify_many(self, agent_ids: Iterable[str]) -> None:
+        """Wake several agents with a single loop callback."""
+        ids = list(agent_ids)
+        self._call_soon(self._wake_many, ids)
+
+    def notify_group(self, group: str) -> None:
+        """Wake every agent of a group; the loop resolves the members."""
+        if self.resolve_group is None:
+            raise RuntimeError("notify_group() requires a resolve_group callback")
+        if not self._started:
+            return
+        with self._groups_lock:
+            if group in self._dirty_groups:
+                return
+            # One loop callback per batch of dirty groups
+            schedule = not self._dirty_groups
+            self._dirty_groups.add(group)
+        if schedule:
+            self._call_soon(self._wake_groups)
+
+    def discard(self, agent_id: str) -> None:
+        """Cancel an agent's task."""
+        self._call_soon(self._discard, agent_id)
+
+    def submit(self, coro: Awaitable[Any]) -> Future:
+        """Schedule a coroutine on the loop from any thread."""
+        if not self._started or not self.loop:
+            raise RuntimeError("Async runtime is not running")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run_sync(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and block until it completes."""
+        if self.in_loop_thread():
+            raise RuntimeError("run_sync() would deadlock when called on the runtime loop")
+        return self.submit(coro).result(timeout)
+
+    def call(self, func: Callable[..., Any], *args: Any,
+             timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """
+        Run a plain function on the loop thread and return its result.
+
+        Runs inline if called from the loop thread or before start(), so
+        callers never deadlock on themselves.
+        """
+        if not self._started or self.in_loop_thread():
+            return func(*args, **kwargs)
+
+        async def _call():
+            return func(*args, **kwargs)
+
+        return self.run_sync(_call(), timeout)
+
+    def _call_soon(self, callback: Callable[..., None], *args: Any) -> None:
+        if not self._started or not self.loop:
+            return
+        if self.in_loop_thread():
+            callback(*args)
+        else:
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    # ------------------------------------------------------------------
+    # Loop-side implementation
+    # ------------------------------------------------------------------
+
+    def _wake(self, agent_id: str) -> None:
+        self._wakeups += 1
+        event = self._events.get(agent_id)
+        if event is None:
+            event = asyncio.Event()
+            self._events[agent_id] = event
+            self._tasks[agent_id] = self.loop.create_task(self._agent_loop(agent_id, event))
+        event.set()
+
+    def _wake_many(self, agent_ids: Iterable[str]) -> None:
+        for agent_id in agent_ids:
+            self._wake(agent_id)
+
+    def _wake_groups(self) -> None:
+        with self._groups_lock:
+            groups = list(self._dirty_groups)
+            self._dirty_groups.clear()
+        for group in groups:
+            try:
+                self._wake_many(self.resolve_group(group))
+            except Exception as e:
+                logger.error(f"Runtime could not resolve group {group}: {e}")
+
+    def _discard(self, agent_id: str) -> None:
+        self._events.pop(agent_id, None)
+        task = self._tasks.pop(agent_id, None)
+        if task:
+            task.cancel()
+
+    async def _agent_loop(self, agent_id: str, event: asyncio.Event) -> None:
+        while self._started:
+            await event.wait()
+            event.clear()
+
+            more_work = True
+            while more_work and self._started:
+                cycle_start = time.perf_counter()
+                try:
+                    more_work = bool(self.run_cycle(agent_id))
+                except Exception as e:
+                    logger.error(f"Runtime cycle error for agent {agent_id}: {e}")
+                    self._errors += 1
+                    more_work = False
+                self._cycles += 1
+                self._busy_seconds += time.perf_counter() - cycle_start
+                # Yield between cycles so agents are served round-robin
+                await asyncio.sleep(0)
+
+    async def _coordination_loop(self) -> None:
+        while self._started:
+            try:
+                await self.loop.run_in_executor(None, self.coordinate)
+            except Exception as e:
+                logger.error(f"Coordination loop error: {e}")
+            await asyncio.sleep(self.coordination_interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get runtime statistics."""
+        return {
+            "running": self._started,
+            "agent_tasks": len(self._tasks),
+            "wakeups": self._wakeups,
+            "cycles": self._cycles,
+            "errors": self._errors,
+            "busy_seconds": self._busy_seconds,
+        }
@@ -0,0 +1,175 @@
+"""
+Specialization graph for agent connections.
+
+Agents are connected to every agent with a different (complementary)
+specialization. Instead of rebuilding that graph with a nested loop over
+all agents every coordination cycle, the graph keeps an index from
+specialization to agent set and updates connection sets incrementally
+when an agent is added or removed.
+"""
+
+import threading
+from collections.abc import Set as AbstractSet
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class ConnectionSet(AbstractSet):
+    """
+    Read-only live view of one agent's connections.
+
+    The graph keeps updating the underlying set as agents join or leave;
+    every read takes the graph's lock, and iteration walks a snapshot, so
+    callers can iterate without racing those updates.
+    """
+
+    __slots__ = ("_graph", "_agent_id")
+
+    def __init__(self, graph: "SpecializationGraph", agent_id: str):
+        self._graph = graph
+        self._agent_id = agent_id
+
+    def __contains__(self, other_id: object) -> bool:
+        with self._graph._lock:
+            return other_id in self._graph._connections.get(self._agent_id, ())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph.connections(self._agent_id))
+
+    def __len__(self) -> int:
+        with self._graph._lock:
+            return len(self._graph._connections.get(self._agent_id, ()))
+
+    def __repr__(self) -> str:
+        return f"ConnectionSet({set(self)!r})"
+
+
+class SpecializationGraph:
+    """
+    Index of agents by specialization with incrementally maintained connections.
+
+    Connection sets are private to the graph and only changed under its
+    lock; callers get snapshots (connections()) or read-only live views
+    (connections_of(), add()).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_specialization: Dict[str, Set[str]] = {}
+        self._specialization: Dict[str, str] = {}
+        self._connections: Dict[str, Set[str]] = {}
+
+    def add(self, agent_id: str, specialization: str) -> ConnectionSet:
+        """
+        Add an agent and connect it to agents of other specializations.
+
+        Cost is O(agents with other specializations) for this agent only.
+
+        Returns:
+            Live read-only view of the agent's connections
+        """
+        with self._lock:
+            if agent_id in self._connections:
+                return ConnectionSet(self, agent_id)
+
+            connections: Set[str] = set()
+            for other_spec, members in self._by_specialization.items():
+                if other_spec == specialization:
+                    continue
+                connections.update(members)
+                for other_id in members:
+                    self._connections[other_id].add(agent_id)
+
+            self._by_specialization.setdefault(specialization, set()).add(agent_id)
+            self._specialization[agent_id] = specialization
+            self._connections[agent_id] = connections
+            return ConnectionSet(self, agent_id)
+
+    def add_many(self, agents: Iterable[Tuple[str, str]]) -> Dict[str, ConnectionSet]:
+        """
+        Add many agents at once (e.g. when restoring a snapshot).
+
+        Produces the same graph as calling add() for each agent, but builds
+        connection sets with set unions per specialization instead of
+        per-agent updates of every peer.
+
+        Args:
+            agents: (agent_id, specialization) pairs
+
+        Returns:
+            agent_id -> live read-only connection view, for every given agent
+        """
+        agents = list(agents)
+        with self._lock:
+            new_by_spec: Dict[str, Set[str]] = {}
+            for agent_id, specialization in agents:
+                if agent_id not in self._connections:
+                    new_by_spec.setdefault(specialization, set()).add(agent_id)
+
+            # Existing agents gain every new agent of another specialization
+            all_new = set().union(*new_by_spec.values())
+            for specialization, members in self._by_specialization.items():
+                joining = all_new - new_by_spec.get(specialization, set())
+                if joining:
+                    for agent_id in members:
+                        self._connections[agent_id].update(joining)
+
+            for specialization, members in new_by_spec.items():
+                self._by_specialization.setdefault(specialization, set()).update(members)
+                for agent_id in members:
+                    self._specialization[agent_id] = specialization
+
+            # New agents connect to everyone outside their specialization
+            everyone = set().union(*self._by_specialization.values())
+            for specialization, members in new_by_spec.items():
+                others = everyone - self._by_specialization[specialization]
+                for agent_id in members:
+                    self._connections[agent_id] = set(others)
+
+            return {agent_id: ConnectionSet(self, agent_id) for agent_id, _ in agents}
+
+    def remove(self, agent_id: str) -> bool:
+        """Remove an agent and drop it from its peers' connection sets."""
+        with self._lock:
+            specialization = self._specialization.pop(agent_id, None)
+            if specialization is None:
+                return False
+
+            members = self._by_specialization[specialization]
+            members.discard(agent_id)
+            if not members:
+                del self._by_specialization[specialization]
+
+            for other_id in self._connections.pop(agent_id):
+                peers = self._connections.get(other_id)
+                if peers is not None:
+                    peers.discard(agent_id)
+            return True
+
+    def connections(self, agent_id: str) -> Set[str]:
+        """Snapshot of an agent's connections."""
+        with self._lock:
+            return set(self._connections.get(agent_id, ()))
+
+    def connections_of(self, agent_id: str) -> ConnectionSet:
+        """Live read-only view of an agent's connections."""
+        return ConnectionSet(self, agent_id)
+
+    def agents_with(self, specialization: str) -> Set[str]:
+        """Snapshot of agents with a specialization."""
+        with self._lock:
+            return set(self._by_specialization.get(specialization, ()))
+
+    def specialization_of(self, agent_id: str) -> Optional[str]:
+        """Specialization an agent was indexed under."""
+        return self._specialization.get(agent_id)
+
+    def specializations(self) -> List[str]:
+        """All indexed specializations."""
+        with self._lock:
+            return list(self._by_specialization)
+
+    def __len__(self) -> int:
+        return len(self._specialization)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._specialization
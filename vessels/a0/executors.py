@@ -0,0 +1,181 @@
+"""
+Task executor registry for AgentZeroCore.
+
+Maps an agent specialization to the executor that runs its tasks, replacing
+the if/elif chain in _execute_agent_task with a dict lookup. Executors are
+registered in code under a name and routed to specializations either in
+code or from the `executor:` section of the agent definitions in agents/:
+
+    executor:
+      handler: grant_discovery   # registered executor name, or "module:function"
+      kind: sync                 # sync | async | cpu
+
+Each executor declares its kind so the core can place its tasks on the
+right pool: sync handlers on the shared thread pool (or inline), async
+handlers on an event loop, CPU-bound handlers on a dedicated CPU pool.
+"""
+
+import importlib
+import logging
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AGENT_DEFINITIONS = Path(__file__).resolve().parents[2] / "agents"
+
+
+class ExecutorKind(Enum):
+    """How an executor's handler should be run."""
+    SYNC = "sync"  # Plain function, cheap or I/O-bound
+    ASYNC = "async"  # Coroutine function, run on an event loop
+    CPU = "cpu"  # CPU-bound function, run on the CPU pool
+
+
+@dataclass
+class TaskExecutor:
+    """A named task handler: handler(task) -> result dict (or awaitable)."""
+    name: str
+    handler: Callable[[Dict[str, Any]], Any]
+    kind: ExecutorKind = ExecutorKind.SYNC
+
+
+class ExecutorRegistry:
+    """
+    Specialization -> TaskExecutor dispatch table.
+
+    Unknown specializations resolve to the default executor in O(1).
+    """
+
+    def __init__(self, default: str = "general"):
+        """
+        Initialize the registry.
+
+        Args:
+            default: Name of the executor used for unrouted specializations
+        """
+        self.default = default
+
+        self._lock = threading.Lock()
+        self._executors: Dict[str, TaskExecutor] = {}
+        self._routes: Dict[str, TaskExecutor] = {}
+
+    def register_executor(
+        self,
+        name: str,
+        handler: Callable[[Dict[str, Any]], Any],
+        kind: Any = ExecutorKind.SYNC,
+    ) -> TaskExecutor:
+        """Register (or replace) a named executor."""
+        executor = TaskExecutor(name=name, handler=handler, kind=ExecutorKind(kind))
+        with self._lock:
+            self._executors[name] = executor
+            # Re-point routes that referenced a replaced executor
+            for specialization, routed in list(self._routes.items()):
+                if routed.name == name:
+                    self._routes[specialization] = executor
+        return executor
+
+    def route(self, specialization: str, executor_name: str) -> None:
+        """Route a specialization to a registered executor."""
+        with self._lock:
+            executor = self._executors.get(executor_name)
+            if executor is None:
+                raise KeyError(f"Unknown executor: {executor_name}")
+            self._routes[specialization] = executor
+
+    def register(
+        self,
+        specialization: str,
+        handler: Callable[[Dict[str, Any]], Any],
+        kind: Any = ExecutorKind.SYNC,
+    ) -> TaskExecutor:
+        """Register an executor named after a specialization and route it."""
+        executor = self.register_executor(specialization, handler, kind)
+        self.route(specialization, specialization)
+        return executor
+
+    def resolve(self, specialization: str) -> TaskExecutor:
+        """Executor for a specialization (the default executor if unrouted)."""
+        executor = self._routes.get(specialization)
+        if executor is not None:
+            return executor
+        executor = self._executors.get(specialization) or self._executors.get(self.default)
+        if executor is None:
+            raise KeyError(f"No executor for '{specialization}' and no default executor")
+        return executor
+
+    def load_agent_definitions(self, directory: Optional[Path] = None) -> int:
+        """
+        Route specializations from the `executor:` sections of agents/*.yml.
+
+        The specialization is the definition's `specialization` key, or the
+        file name without extension. Handlers are registered executor names
+        or "package.module:function" paths (registered on first use).
+
+        Returns:
+            Number of specializations routed
+        """
+        directory = Path(directory or DEFAULT_AGENT_DEFINITIONS)
+        try:
+            import yaml
+        except ImportError:
+            logger.warning("PyYAML not installed; agent definitions not loaded, using built-in routes")
+            return 0
+
+        routed = 0
+        for path in sorted(directory.glob("*.yml")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    definition = yaml.safe_load(f) or {}
+            except (OSError, yaml.YAMLError) as e:
+                logger.warning(f"Could not load agent definition {path}: {e}")
+                continue
+
+            section = definition.get("executor")
+            if not isinstance(section, dict) or not section.get("handler"):
+                continue
+            specialization = definition.get("specialization") or path.stem
+            try:
+                self._route_definition(specialization, section)
+            except (KeyError, ValueError, ImportError, AttributeError) as e:
+                logger.warning(f"Invalid executor in {path.name}: {e}")
+                continue
+            routed += 1
+
+        logger.info(f"Routed {routed} specializations from agent definitions in {directory}")
+        return routed
+
+    def _route_definition(self, specialization: str, section: Dict[str, Any]) -> None:
+        handler_name = section["handler"]
+        kind = ExecutorKind(section.get("kind", ExecutorKind.SYNC.value))
+
+        if ":" in handler_name:
+            module_name, _, attribute = handler_name.partition(":")
+            handler = getattr(importlib.import_module(module_name), attribute)
+            self.register_executor(handler_name, handler, kind)
+        else:
+            executor = self._executors.get(handler_name)
+            if executor is None:
+                raise KeyError(f"Unknown executor: {handler_name}")
+            if executor.kind != kind:
+                # Same handler, placed differently for this specialization
+                handler_name = f"{handler_name}[{kind.value}]"
+                self.register_executor(handler_name, executor.handler, kind)
+        self.route(specialization, handler_name)
+
+    def describe(self) -> Dict[str, Dict[str, str]]:
+        """Routes as {specialization: {"executor": name, "kind": kind}}."""
+        with self._lock:
+            return {
+                specialization: {"executor": executor.name, "kind": executor.kind.value}
+                for specialization, executor in self._routes.items()
+            }
+
+    def executors(self) -> List[str]:
+        """Names of registered executors."""
+        with self._lock:
+            return list(self._executors)
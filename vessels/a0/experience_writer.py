@@ -0,0 +1,183 @@
+"""
+Write-behind aggregation of agent learned patterns.
+
+Agent cycles used to call memory_backend.store_experience() once per agent
+per cycle. With CommunityMemory each call computes an embedding and takes
+the memory's global lock, so busy agents contended on that lock.
+ExperienceWriter buffers learned patterns per backend and flushes them
+when a batch fills up or a flush interval elapses. Patterns from the same
+agent within a batch are coalesced into one experience.
+
+Backends that implement store_experiences(items) get one call per batch.
+Other backends fall back to one store_experience() call per experience.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _Buffer:
+    """Patterns waiting to be written to one backend."""
+
+    __slots__ = ("backend", "by_agent", "count", "since")
+
+    def __init__(self, backend: Any):
+        self.backend = backend
+        self.by_agent: Dict[str, List[Any]] = {}
+        self.count = 0
+        self.since = time.monotonic()
+
+
+class ExperienceWriter:
+    """
+    Buffers learned patterns and writes them to memory backends in batches.
+
+    Flushes happen on a background thread once started. Before start(), or
+    after stop(), a full batch is flushed inline by the caller.
+    """
+
+    def __init__(self, max_batch: int = 256, flush_interval: float = 1.0,
+                 name: str = "a0-experience-writer"):
+        """
+        Initialize the writer.
+
+        Args:
+            max_batch: Buffered patterns per backend that trigger a flush
+            flush_interval: Max seconds a pattern waits before being flushed
+            name: Name of the flush thread
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.name = name
+
+        self._cond = threading.Condition()
+        self._buffers: Dict[int, _Buffer] = {}
+        self._full = False
+        self._thread: Optional[threading.Thread] = None
+        self._started = False
+
+        # Cumulative counters
+        self._patterns = 0
+        self._experiences = 0
+        self._batches = 0
+        self._batch_calls = 0
+        self._fallback_calls = 0
+        self._errors = 0
+
+    def start(self) -> None:
+        """Start the background flush thread."""
+        with self._cond:
+            if self._started:
+                return
+            self._started = True
+        self._thread = threading.Thread(target=self._flush_loop, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """Stop the flush thread and write everything still buffered."""
+        with self._cond:
+            self._started = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+
+    @property
+    def running(self) -> bool:
+        return self._started
+
+    def add(self, backend: Any, agent_id: str, patterns: List[Any]) -> None:
+        """Queue an agent's learned patterns for its memory backend."""
+        if not patterns:
+            return
+        with self._cond:
+            buffer = self._buffers.get(id(backend))
+            if buffer is None:
+                buffer = self._buffers[id(backend)] = _Buffer(backend)
+            buffer.by_agent.setdefault(agent_id, []).extend(patterns)
+            buffer.count += len(patterns)
+            self._patterns += len(patterns)
+            full = buffer.count >= self.max_batch
+            if full and self._started:
+                self._full = True
+                self._cond.notify()
+        if full and not self._started:
+            self.flush()
+
+    def flush(self, force: bool = True) -> int:
+        """
+        Write buffered patterns.
+
+        Args:
+            force: Flush every buffer; otherwise only full or expired ones
+
+        Returns:
+            Number of experiences written
+        """
+        now = time.monotonic()
+        with self._cond:
+            ready = [
+                key for key, buffer in self._buffers.items()
+                if force or buffer.count >= self.max_batch
+                or now - buffer.since >= self.flush_interval
+            ]
+            buffers = [self._buffers.pop(key) for key in ready]
+            self._full = False
+
+        written = 0
+        for buffer in buffers:
+            items = [
+                (agent_id, {"learned_patterns": patterns})
+                for agent_id, patterns in buffer.by_agent.items()
+            ]
+            written += self._write(buffer.backend, items)
+        return written
+
+    def _write(self, backend: Any, items: List[Tuple[str, Dict[str, Any]]]) -> int:
+        try:
+            if hasattr(backend, "store_experiences"):
+                backend.store_experiences(items)
+                self._batch_calls += 1
+            else:
+                for agent_id, experience in items:
+                    backend.store_experience(agent_id, experience)
+                self._fallback_calls += len(items)
+        except Exception as e:
+            self._errors += 1
+            logger.error(f"Failed to write {len(items)} experiences to memory backend: {e}")
+            return 0
+        self._batches += 1
+        self._experiences += len(items)
+        return len(items)
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                if self._started and not self._full:
+                    self._cond.wait(self.flush_interval)
+                if not self._started:
+                    return
+            self.flush(force=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer depth and write counters."""
+        with self._cond:
+            return {
+                "running": self._started,
+                "buffered_patterns": sum(b.count for b in self._buffers.values()),
+                "max_batch": self.max_batch,
+                "flush_interval_seconds": self.flush_interval,
+                "patterns": self._patterns,
+                "experiences": self._experiences,
+                "batches": self._batches,
+                "batch_calls": self._batch_calls,
+                "fallback_calls": self._fallback_calls,
+                "errors": self._errors,
+            }
@@ -0,0 +1,315 @@
+"""
+Config-driven intent matcher for AgentZeroCore.
+
+Intent patterns are loaded once from config/intent_config.json and
+compiled. The literal anchors of every pattern ("find", "grant", ...) act
+as a prefilter: one combined scan finds every anchor present in the input,
+and only patterns whose anchors all appear are verified, so a request
+costs a single pass plus a handful of targeted searches instead of one
+``re.search`` per pattern.
+
+The config file is watched by mtime and recompiled when it changes; a bad
+edit is logged and the previous patterns stay in effect.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTENT_CONFIG = Path(__file__).resolve().parents[2] / "config" / "intent_config.json"
+
+
+@dataclass
+class IntentDefinition:
+    """An intent and the regex patterns that trigger it."""
+    name: str
+    patterns: List[str] = field(default_factory=list)
+    description: str = ""
+
+
+# Characters that end a literal run when extracting prefilter anchors
+_META = set(".^$*+?{}")
+# Constructs that make a pattern's literals conditional; such patterns are
+# always verified with a full search instead of being prefiltered
+_UNSAFE = set("|()[]\\")
+
+
+def _required_literals(pattern: str) -> Optional[FrozenSet[str]]:
+    """
+    Extract literal substrings that every match of ``pattern`` must contain.
+
+    Handles the simple ``word.*word`` style used by intent configs. Returns
+    None if the pattern has alternation, groups, classes or escapes.
+    """
+    if any(ch in _UNSAFE for ch in pattern):
+        return None
+
+    literals = []
+    run: List[str] = []
+    in_braces = False
+    for ch in pattern:
+        if in_braces:
+            # Skip "{m,n}" bounds; they are not text the match contains
+            in_braces = ch != "}"
+        elif ch in _META:
+            if ch in "?*{" and run:
+                run.pop()  # Preceding char is optional or repeated
+            if run:
+                literals.append("".join(run).lower())
+            run = []
+            in_braces = ch == "{"
+        else:
+            run.append(ch)
+    if run:
+        literals.append("".join(run).lower())
+
+    literals = [lit for lit in literals if lit.strip()]
+    return frozenset(literals) if literals else None
+
+
+@dataclass
+class CompiledIntents:
+    """
+    Intents compiled for matching.
+
+    ``literals`` holds every anchor literal across all patterns and
+    ``scanner`` finds them all in one left-to-right pass over the lowercased
+    text: an alternation of the literals, longest first, resumed one
+    character past each hit. A hit also implies every literal contained in
+    it (``implied``), which covers shorter literals at the same position. Only patterns
+    whose literals were all seen are verified with their own compiled regex.
+    """
+    literals: Tuple[str, ...]
+    table: List[Tuple[str, List[Tuple[re.Pattern, Optional[FrozenSet[str]]]]]]
+    names: List[str]
+    scanner: Optional[re.Pattern] = None
+    implied: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+
+    def match(self, text: str) -> List[str]:
+        lowered = text.lower()
+        present: set = set()
+        if self.scanner is not None:
+            # Resume one character past each hit so overlapping literals are seen
+            search = self.scanner.search
+            hit = search(lowered)
+            while hit is not None:
+                present.update(self.implied[hit.group()])
+                hit = search(lowered, hit.start() + 1)
+
+        detected = []
+        for name, entries in self.table:
+            for regex, required in entries:
+                if required is not None and not required <= present:
+                    continue
+                if regex.search(lowered):
+                    detected.append(name)
+                    break
+        return detected
+
+
+def compile_intents(intents: List[IntentDefinition]) -> CompiledIntents:
+    """
+    Compile intents into a prefiltered matcher.
+
+    Invalid patterns are skipped with a warning.
+    """
+    table = []
+    literals: set = set()
+    for intent in intents:
+        entries = []
+        for pattern in intent.patterns:
+            try:
+                regex = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                logger.warning(f"Skipping invalid pattern for intent {intent.name}: {pattern} ({e})")
+                continue
+            required = _required_literals(pattern)
+            if required:
+                literals.update(required)
+            entries.append((regex, required))
+        if entries:
+            table.append((intent.name, entries))
+
+    return CompiledIntents(
+        literals=tuple(sorted(literals)),
+        table=table,
+        names=[name for name, _ in table],
+        scanner=_literal_scanner(literals),
+        implied={lit: frozenset(other for other in literals if other in lit) for lit in literals},
+    )
+
+
+def _literal_scanner(literals: Iterable[str]) -> Optional[re.Pattern]:
+    """Alternation of the literals that matches the longest one at a position."""
+    ordered = sorted(literals, key=lambda lit: (-len(lit), lit))
+    if not ordered:
+        return None
+    return re.compile("|".join(map(re.escape, ordered)))
+
+
+def load_intent_config(path: Path) -> List[IntentDefinition]:
+    """Load intent definitions from a JSON config file."""
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    intents = []
+    for name, entry in data.items():
+        if isinstance(entry, list):
+            intents.append(IntentDefinition(name=name, patterns=list(entry)))
+        else:
+            intents.append(IntentDefinition(
+                name=name,
+                patterns=list(entry.get("patterns", [])),
+                description=entry.get("description", ""),
+            ))
+    return intents
+
+
+class IntentEngine:
+    """
+    Precompiled intent matcher with optional hot reload.
+
+    Intents are reported in definition order, matching the order of the
+    config file.
+    """
+
+    def __init__(
+        self,
+        intents: Optional[Iterable[IntentDefinition]] = None,
+        config_path: Optional[os.PathLike] = None,
+        reload_interval: float = 2.0,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            intents: Intent definitions to use (and fall back to if the config is unusable)
+            config_path: Optional JSON config file to load and watch
+            reload_interval: Minimum seconds between config mtime checks (0 disables watching)
+        """
+        self.config_path = Path(config_path) if config_path else None
+        self.reload_interval = reload_interval
+
+        self._lock = threading.Lock()
+        self._intents: List[IntentDefinition] = list(intents or [])
+        self._compiled = compile_intents(self._intents)
+        self._mtime: Optional[float] = None
+        self._last_check = 0.0
+        self._reloads = 0
+
+        if self.config_path:
+            self.reload(force=True)
+
+    @classmethod
+    def from_config(
+        cls,
+        config_path: os.PathLike = DEFAULT_INTENT_CONFIG,
+        fallback_patterns: Optional[Dict[str, List[str]]] = None,
+        reload_interval: float = 2.0,
+    ) -> "IntentEngine":
+        """
+        Create an engine from a config file, falling back to inline patterns.
+
+        Args:
+            config_path: JSON file mapping intent -> {"patterns": [...], "description": ...}
+            fallback_patterns: Patterns used if the config file is missing or invalid
+            reload_interval: Minimum seconds between config mtime checks
+        """
+        fallback = [
+            IntentDefinition(name=name, patterns=list(patterns))
+            for name, patterns in (fallback_patterns or {}).items()
+        ]
+        return cls(intents=fallback, config_path=config_path, reload_interval=reload_interval)
+
+    @property
+    def intents(self) -> List[IntentDefinition]:
+        """Currently active intent definitions."""
+        return list(self._intents)
+
+    @property
+    def patterns(self) -> Dict[str, List[str]]:
+        """Currently active patterns as {intent: [pattern, ...]}."""
+        return {intent.name: list(intent.patterns) for intent in self._intents}
+
+    def detect(self, text: str) -> List[str]:
+        """
+        Detect all intents matching the text in a single pass.
+
+        Args:
+            text: User input text
+
+        Returns:
+            List of matching intent names in definition order
+        """
+        self._maybe_reload()
+        return self._compiled.match(text)
+
+    def detect_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """Detect intents for several texts with one config check."""
+        self._maybe_reload()
+        compiled = self._compiled
+        return [compiled.match(text) for text in texts]
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Reload the config file if it changed.
+
+        Args:
+            force: Reload even if the mtime is unchanged
+
+        Returns:
+            True if new patterns were loaded
+        """
+        if not self.config_path:
+            return False
+
+        with self._lock:
+            self._last_check = time.monotonic()
+            try:
+                mtime = self.config_path.stat().st_mtime
+            except OSError:
+                if force:
+                    logger.warning(f"Intent config {self.config_path} not found, using built-in patterns")
+                return False
+
+            if not force and mtime == self._mtime:
+                return False
+
+            try:
+                intents = load_intent_config(self.config_path)
+                compiled = compile_intents(intents)
+            except (OSError, ValueError, AttributeError, re.error) as e:
+                logger.warning(f"Failed to load intent config {self.config_path}: {e}")
+                self._mtime = mtime  # Don't retry until the file changes again
+                return False
+
+            self._intents = intents
+            self._compiled = compiled
+            self._mtime = mtime
+            self._reloads += 1
+
+        logger.info(f"Loaded {len(compiled.names)} intents from {self.config_path}")
+        return True
+
+    def _maybe_reload(self) -> None:
+        if not self.config_path or self.reload_interval <= 0:
+            return
+        if time.monotonic() - self._last_check >= self.reload_interval:
+            self.reload()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get engine statistics."""
+        return {
+            "intents": len(self._compiled.names),
+            "patterns": sum(len(i.patterns) for i in self._intents),
+            "config_path": str(self.config_path) if self.config_path else None,
+            "reloads": self._reloads,
+        }
@@ -0,0 +1,135 @@
+"""
+Incremental agent liveness tracking.
+
+Replaces the per-cycle walk over every agent in _monitor_agents with a
+min-heap of liveness deadlines. Recording activity only overwrites the
+agent's deadline in a dict; the heap holds at most one entry per agent and
+an entry whose deadline was pushed back is re-queued lazily when it
+surfaces. A monitor pass therefore only touches agents whose deadlines have
+actually passed, plus agents that reported an error since the last pass.
+"""
+
+import heapq
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+class LivenessTracker:
+    """
+    Heap-based stall detector and error-restart queue.
+
+    Times are monotonic seconds (time.monotonic()).
+    """
+
+    def __init__(self, stall_timeout: float = 300.0):
+        """
+        Initialize the tracker.
+
+        Args:
+            stall_timeout: Seconds without activity before an agent is checked for a stall
+        """
+        self.stall_timeout = stall_timeout
+
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
+        self._queued: Set[str] = set()
+        self._errored: Set[str] = set()
+        self._stalled: Set[str] = set()
+
+        # Cumulative counters
+        self._stall_events = 0
+        self._error_events = 0
+        self._restarts = 0
+
+    def touch(self, agent_id: str, at: Optional[float] = None) -> None:
+        """Record activity for an agent, pushing its stall deadline back."""
+        deadline = (time.monotonic() if at is None else at) + self.stall_timeout
+        with self._lock:
+            self._deadlines[agent_id] = deadline
+            self._stalled.discard(agent_id)
+            if agent_id not in self._queued:
+                self._queued.add(agent_id)
+                heapq.heappush(self._heap, (deadline, agent_id))
+
+    def mark_error(self, agent_id: str) -> None:
+        """Queue an agent for an error restart on the next poll."""
+        with self._lock:
+            if agent_id in self._deadlines and agent_id not in self._errored:
+                self._errored.add(agent_id)
+                self._error_events += 1
+
+    def remove(self, agent_id: str) -> None:
+        """Stop tracking an agent. Its heap entry is discarded when it surfaces."""
+        with self._lock:
+            self._deadlines.pop(agent_id, None)
+            self._errored.discard(agent_id)
+            self._stalled.discard(agent_id)
+
+    def poll(
+        self,
+        on_stall: Callable[[str], bool],
+        on_error: Callable[[str], bool],
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Fire callbacks for agents whose deadlines passed or that errored.
+
+        Args:
+            on_stall: Called for an agent past its deadline; returns True if it
+                is really stalled (e.g. not idle). Stalled agents are re-checked
+                after another stall_timeout; others after the next touch or timeout.
+            on_error: Called for an errored agent; returns True if it was restarted
+            now: Current monotonic time (defaults to time.monotonic())
+        """
+        now = time.monotonic() if now is None else now
+
+        with self._lock:
+            errored = list(self._errored)
+            self._errored.clear()
+
+            due = []
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                _, agent_id = heapq.heappop(heap)
+                current = self._deadlines.get(agent_id)
+                if current is None:
+                    self._queued.discard(agent_id)
+                elif current > now:
+                    heapq.heappush(heap, (current, agent_id))
+                else:
+                    due.append(agent_id)
+                    # Re-check after another timeout unless touched sooner
+                    self._deadlines[agent_id] = now + self.stall_timeout
+                    heapq.heappush(heap, (now + self.stall_timeout, agent_id))
+
+        # Callbacks run outside the lock so they may call touch()/mark_error()
+        for agent_id in due:
+            if on_stall(agent_id):
+                with self._lock:
+                    if agent_id in self._deadlines:
+                        self._stalled.add(agent_id)
+                        self._stall_events += 1
+
+        for agent_id in errored:
+            if on_error(agent_id):
+                with self._lock:
+                    self._restarts += 1
+
+    def is_stalled(self, agent_id: str) -> bool:
+        """Whether an agent is currently flagged as stalled."""
+        return agent_id in self._stalled
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get liveness counters."""
+        with self._lock:
+            return {
+                "tracked": len(self._deadlines),
+                "stalled": len(self._stalled),
+                "pending_restarts": len(self._errored),
+                "stall_events": self._stall_events,
+                "error_events": self._error_events,
+                "restarts": self._restarts,
+                "stall_timeout_seconds": self.stall_timeout,
+            }
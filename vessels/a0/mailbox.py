@@ -0,0 +1,238 @@
+"""
+Bounded, prioritized agent mailboxes.
+
+Each agent used to receive messages on an unbounded queue.Queue, so a hot
+agent could accumulate messages without limit. A Mailbox caps the number
+of pending messages and applies an overflow policy when full:
+
+- BLOCK: the sender waits for space (up to block_timeout), then is rejected
+- DROP_OLDEST: the oldest message in the lowest-priority non-empty lane is
+  dropped; if every pending message outranks the new one, the new one is
+  dropped instead and the send fails with MailboxFullError
+- REJECT: the send fails with MailboxFullError
+
+Messages are kept in priority lanes so system messages and consultation
+responses are delivered before queries, and queries before tasks.
+The class keeps the queue.Queue methods used by existing callers.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional
+
+
+class OverflowPolicy(Enum):
+    """What a full mailbox does with a new message."""
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    REJECT = "reject"
+
+
+class MailboxFullError(Exception):
+    """Raised when a message cannot be delivered to a full mailbox."""
+
+
+# Lane per message type; lower lanes are delivered first
+LANE_SYSTEM = 0
+LANE_QUERY = 1
+LANE_TASK = 2
+
+_LANES = {
+    "system": LANE_SYSTEM,
+    "error": LANE_SYSTEM,
+    "response": LANE_SYSTEM,
+    "consultation": LANE_SYSTEM,
+    "consultation_response": LANE_SYSTEM,
+    "query": LANE_QUERY,
+    "task": LANE_TASK,
+}
+
+
+def message_lane(message: Any) -> int:
+    """Priority lane for a message; unknown types go with tasks."""
+    try:
+        message_type = message.get("type")
+    except AttributeError:
+        return LANE_TASK
+    return _LANES.get(message_type, LANE_TASK)
+
+
+class Mailbox:
+    """
+    Bounded multi-lane mailbox for one agent.
+
+    Thread-safe. put()/get() follow queue.Queue semantics except that a
+    full mailbox applies its overflow policy instead of blocking forever.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.REJECT,
+        block_timeout: Optional[float] = 1.0,
+    ):
+        """
+        Initialize the mailbox.
+
+        Args:
+            maxsize: Max pending messages across all lanes
+            policy: OverflowPolicy (or its value) applied when full
+            block_timeout: Seconds a BLOCK sender waits before rejection (None: forever)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.policy = OverflowPolicy(policy)
+        self.block_timeout = block_timeout
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._lanes: List[Deque[Any]] = [deque() for _ in range(LANE_TASK + 1)]
+        self._size = 0
+
+        # Cumulative counters
+        self._received = 0
+        self._dropped = 0
+        self._rejected = 0
+        self._high_water = 0
+
+    # ------------------------------------------------------------------
+    # Sending
+    # ------------------------------------------------------------------
+
+    def put(self, message: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Deliver a message, applying the overflow policy if the mailbox is full.
+
+        Args:
+            message: Message dict
+            block: For the BLOCK policy, whether to wait for space
+            timeout: Seconds to wait (defaults to block_timeout)
+
+        Raises:
+            MailboxFullError: The message was not delivered
+        """
+        lane = message_lane(message)
+        with self._lock:
+            if self._size >= self.maxsize:
+                if self.policy == OverflowPolicy.DROP_OLDEST:
+                    if not self._drop_oldest_locked(lane):
+                        raise MailboxFullError(
+                            f"Mailbox full ({self.maxsize} messages), all of higher priority"
+                        )
+                elif self.policy == OverflowPolicy.BLOCK and block:
+                    self._wait_for_space_locked(
+                        self.block_timeout if timeout is None else timeout
+                    )
+                else:
+                    self._rejected += 1
+                    raise MailboxFullError(f"Mailbox full ({self.maxsize} messages)")
+
+            self._lanes[lane].append(message)
+            self._size += 1
+            self._received += 1
+            if self._size > self._high_water:
+                self._high_water = self._size
+            self._not_empty.notify()
+
+    def put_nowait(self, message: Any) -> None:
+        """Deliver a message without waiting for space."""
+        self.put(message, block=False)
+
+    def _wait_for_space_locked(self, timeout: Optional[float]) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._size >= self.maxsize:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                self._rejected += 1
+                raise MailboxFullError(
+                    f"Mailbox full ({self.maxsize} messages) after waiting {timeout}s"
+                )
+            self._not_full.wait(remaining)
+
+    def _drop_oldest_locked(self, incoming_lane: int) -> bool:
+        """Drop to make room for a message; False if the message itself is dropped."""
+        self._dropped += 1
+        for index in range(LANE_TASK, incoming_lane - 1, -1):
+            lane = self._lanes[index]
+            if lane:
+                lane.popleft()
+                self._size -= 1
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Receiving
+    # ------------------------------------------------------------------
+
+    def _pop_locked(self) -> Any:
+        for lane in self._lanes:
+            if lane:
+                self._size -= 1
+                self._not_full.notify()
+                return lane.popleft()
+        raise queue.Empty
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return the highest-priority message (queue.Queue semantics)."""
+        with self._lock:
+            if block:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while not self._size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise queue.Empty
+                    self._not_empty.wait(remaining)
+            return self._pop_locked()
+
+    def get_nowait(self) -> Any:
+        """Remove and return the highest-priority message without waiting."""
+        return self.get(block=False)
+
+    def drain(self, max_messages: int) -> List[Any]:
+        """Remove and return up to max_messages messages in priority order."""
+        messages: List[Any] = []
+        with self._lock:
+            while self._size and len(messages) < max_messages:
+                messages.append(self._pop_locked())
+        return messages
+
+    # ------------------------------------------------------------------
+    # Inspection
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> List[Any]:
+        """Pending messages in delivery order, without removing them."""
+        with self._lock:
+            return [message for lane in self._lanes for message in lane]
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return not self._size
+
+    def full(self) -> bool:
+        return self._size >= self.maxsize
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get depth per lane and overflow counters."""
+        with self._lock:
+            return {
+                "depth": self._size,
+                "maxsize": self.maxsize,
+                "policy": self.policy.value,
+                "lanes": {
+                    "system": len(self._lanes[LANE_SYSTEM]),
+                    "query": len(self._lanes[LANE_QUERY]),
+                    "task": len(self._lanes[LANE_TASK]),
+                },
+                "received": self._received,
+                "dropped": self._dropped,
+                "rejected": self._rejected,
+                "high_water": self._high_water,
+            }
@@ -0,0 +1,254 @@
+"""
+Topic pub/sub message bus for AgentZeroCore.
+
+Broadcasting used to push the same message onto every agent's queue, one
+put per agent. The bus instead appends each published message once to a
+per-topic ring buffer; subscribers keep a sequence-number cursor per topic
+and read forward from it. Messages are frozen on publish (dicts become
+read-only mappings, lists become tuples) so a single object can be shared
+by every reader.
+
+Topics are plain strings; topic() builds the conventional ones:
+"all", "vessel:<id>", "specialization:<name>" and "community:<id>".
+
+A reader that falls more than `capacity` messages behind skips ahead to the
+oldest retained message; the skipped messages are counted as dropped.
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+ALL_TOPIC = "all"
+
+
+def topic(kind: str, name: Optional[str] = None) -> str:
+    """Build a topic name, e.g. topic("vessel", vessel_id) -> "vessel:<id>"."""
+    if kind == ALL_TOPIC:
+        return ALL_TOPIC
+    if kind not in ("vessel", "specialization", "community"):
+        raise ValueError(f"Unknown topic kind: {kind}")
+    return f"{kind}:{name}"
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists/sets into read-only equivalents."""
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+class _Topic:
+    """Fixed-size ring buffer of (sequence, message) for one topic."""
+
+    __slots__ = ("lock", "slots", "next_seq", "subscribers")
+
+    def __init__(self, capacity: int):
+        self.lock = threading.Lock()
+        self.slots: List[Optional[Mapping[str, Any]]] = [None] * capacity
+        self.next_seq = 0
+        self.subscribers: Set[str] = set()
+
+
+class MessageBus:
+    """
+    Publish/subscribe bus with per-topic ring buffers and reader cursors.
+
+    publish() is O(1) regardless of subscriber count. Listeners registered
+    with add_listener() are told about each publish so event-driven
+    runtimes can wake the topic's subscribers.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize the bus.
+
+        Args:
+            capacity: Messages retained per topic
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+
+        self._lock = threading.Lock()
+        self._topics: Dict[str, _Topic] = {}
+        # agent_id -> topic -> next sequence number to read
+        self._cursors: Dict[str, Dict[str, int]] = {}
+        self._listeners: List[Callable[[str, int], None]] = []
+
+        # Cumulative counters
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def subscribe(self, agent_id: str, topics: Iterable[str]) -> None:
+        """Subscribe an agent to topics. It only sees messages published afterwards."""
+        with self._lock:
+            cursors = self._cursors.setdefault(agent_id, {})
+            for name in topics:
+                if name in cursors:
+                    continue
+                entry = self._topics.get(name)
+                if entry is None:
+                    entry = self._topics[name] = _Topic(self.capacity)
+                with entry.lock:
+                    entry.subscribers.add(agent_id)
+                    cursors[name] = entry.next_seq
+
+    def unsubscribe(self, agent_id: str, topics: Optional[Iterable[str]] = None) -> None:
+        """Unsubscribe an agent from topics (default: all of them)."""
+        with self._lock:
+            cursors = self._cursors.get(agent_id)
+            if cursors is None:
+                return
+            for name in list(cursors if topics is None else topics):
+                if cursors.pop(name, None) is None:
+                    continue
+                entry = self._topics.get(name)
+                if entry is None:
+                    continue
+                with entry.lock:
+                    entry.subscribers.discard(agent_id)
+                    if not entry.subscribers:
+                        # Nobody left to read it: release the buffer
+                        del self._topics[name]
+            if not cursors:
+                del self._cursors[agent_id]
+
+    def subscribers(self, topic_name: str) -> List[str]:
+        """Snapshot of a topic's subscribers."""
+        entry = self._topics.get(topic_name)
+        if entry is None:
+            return []
+        with entry.lock:
+            return list(entry.subscribers)
+
+    def topics_of(self, agent_id: str) -> List[str]:
+        """Topics an agent is subscribed to."""
+        with self._lock:
+            return list(self._cursors.get(agent_id, ()))
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def add_listener(self, listener: Callable[[str, int], None]) -> None:
+        """Register a callback(topic, sequence) invoked after each publish."""
+        self._listeners.append(listener)
+
+    def publish(self, topic_name: str, message: Mapping[str, Any]) -> Optional[int]:
+        """
+        Publish a message to a topic.
+
+        Returns:
+            The message's sequence number, or None if the topic has no subscribers
+        """
+        entry = self._topics.get(topic_name)
+        if entry is None:
+            return None
+        frozen = freeze(message)
+        with entry.lock:
+            if not entry.subscribers:
+                return None
+            seq = entry.next_seq
+            entry.slots[seq % self.capacity] = frozen
+            entry.next_seq = seq + 1
+            self._published += 1
+
+        for listener in self._listeners:
+            listener(topic_name, seq)
+        return seq
+
+    # ------------------------------------------------------------------
+    # Consuming
+    # ------------------------------------------------------------------
+
+    def poll(self, agent_id: str, max_messages: int = 1) -> List[Mapping[str, Any]]:
+        """
+        Read up to max_messages unread messages for an agent, advancing its cursors.
+
+        Topics are read in subscription order; within a topic messages are
+        returned in publish order.
+        """
+        messages: List[Mapping[str, Any]] = []
+        cursors = self._cursors.get(agent_id)
+        if not cursors:
+            return messages
+
+        for name, cursor in list(cursors.items()):
+            if len(messages) >= max_messages:
+                break
+            entry = self._topics.get(name)
+            if entry is None:
+                continue
+            with entry.lock:
+                head = entry.next_seq
+                if cursor >= head:
+                    continue
+                oldest = max(0, head - self.capacity)
+                if cursor < oldest:
+                    self._dropped += oldest - cursor
+                    cursor = oldest
+                while cursor < head and len(messages) < max_messages:
+                    messages.append(entry.slots[cursor % self.capacity])
+                    cursor += 1
+            if name in cursors:
+                cursors[name] = cursor
+
+        self._delivered += len(messages)
+        return messages
+
+    def has_pending(self, agent_id: str) -> bool:
+        """Whether an agent has unread messages on any topic."""
+        cursors = self._cursors.get(agent_id)
+        if not cursors:
+            return False
+        for name, cursor in list(cursors.items()):
+            entry = self._topics.get(name)
+            if entry is not None and entry.next_seq > cursor:
+                return True
+        return False
+
+    def lag(self, agent_id: str) -> int:
+        """Number of unread messages for an agent (capped at capacity per topic)."""
+        cursors = self._cursors.get(agent_id)
+        if not cursors:
+            return 0
+        total = 0
+        for name, cursor in list(cursors.items()):
+            entry = self._topics.get(name)
+            if entry is not None:
+                total += min(max(entry.next_seq - cursor, 0), self.capacity)
+        return total
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bus counters and per-topic depth."""
+        with self._lock:
+            topics: List[Tuple[str, _Topic]] = list(self._topics.items())
+            subscribers = len(self._cursors)
+        return {
+            "topics": len(topics),
+            "subscribers": subscribers,
+            "capacity_per_topic": self.capacity,
+            "published": self._published,
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "by_topic": {
+                name: {
+                    "subscribers": len(entry.subscribers),
+                    "retained": min(entry.next_seq, self.capacity),
+                    "next_seq": entry.next_seq,
+                }
+                for name, entry in topics
+            },
+        }
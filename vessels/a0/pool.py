@@ -0,0 +1,273 @@
+"""
+Warm agent pool for AgentZeroCore.
+
+Agents spawned to serve requests are kept warm per (vessel_id,
+specialization) and reused by later requests instead of spawning a new
+AgentInstance each time. Idle agents are evicted after a configurable TTL,
+and per-key and total caps bound how many agents the pool holds.
+
+Spawning is serialized per key: a miss reserves the key's spawn slot, and
+concurrent misses on the same key wait for that spawn instead of starting
+their own, so a burst of identical requests spawns one agent, not one each.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[Optional[str], str]  # (vessel_id, specialization)
+
+
+@dataclass
+class PoolKeyStats:
+    """Counters for one pool key."""
+    hits: int = 0
+    misses: int = 0
+    shared: int = 0  # Busy agent shared, or in-flight spawn joined, instead of spawning
+    evicted_ttl: int = 0
+    evicted_capacity: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.shared + self.misses
+        return (self.hits + self.shared) / requests if requests else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "evicted_ttl": self.evicted_ttl,
+            "evicted_capacity": self.evicted_capacity,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class AgentPool:
+    """
+    Pool of warm agents keyed by (vessel_id, specialization).
+
+    The pool only tracks agent IDs and usage times; AgentZeroCore owns the
+    agents and tells the pool which are available via callbacks.
+    """
+
+    def __init__(
+        self,
+        idle_ttl_seconds: float = 600.0,
+        max_per_key: int = 4,
+        max_total: int = 1000,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            idle_ttl_seconds: Evict agents idle for longer than this
+            max_per_key: Max agents per (vessel_id, specialization); beyond it busy agents are shared
+            max_total: Max pooled agents overall; beyond it least recently used idle agents are evicted
+        """
+        if max_per_key < 1 or max_total < 1:
+            raise ValueError("Pool caps must be >= 1")
+
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_per_key = max_per_key
+        self.max_total = max_total
+
+        self._lock = threading.Lock()
+        # key -> agent_id -> last used (time.time()), least recently used first
+        self._members: Dict[PoolKey, "OrderedDict[str, float]"] = {}
+        self._keys: Dict[str, PoolKey] = {}
+        self._stats: Dict[PoolKey, PoolKeyStats] = {}
+        # key -> future of the spawn in flight for it (at most one per key)
+        self._spawning: Dict[PoolKey, Future] = {}
+
+    def acquire(
+        self,
+        key: PoolKey,
+        is_available: Callable[[str], bool],
+    ) -> Tuple[Optional[str], Optional[Future]]:
+        """
+        Get a warm agent for a key, or reserve the key's spawn slot.
+
+        Prefers the most recently used available agent. If none is available
+        and another caller is already spawning for the key, that spawn is
+        joined. Otherwise, if the key is at max_per_key, the least recently
+        used member is shared.
+
+        Returns:
+            (agent_id, None) for a pooled agent; (None, future) while another
+            caller spawns for the key, the future resolving to that agent's
+            ID; (None, None) on a miss, in which case the caller holds the
+            key's spawn reservation and must add() the agent it spawns or
+            abandon() the reservation
+        """
+        with self._lock:
+            stats = self._stats.setdefault(key, PoolKeyStats())
+            members = self._members.get(key)
+            if members:
+                for agent_id in reversed(members):
+                    if is_available(agent_id):
+                        stats.hits += 1
+                        self._touch_locked(key, agent_id)
+                        return agent_id, None
+            pending = self._spawning.get(key)
+            if pending is not None:
+                stats.shared += 1
+                return None, pending
+            if members and len(members) >= self.max_per_key:
+                agent_id = next(iter(members))
+                stats.shared += 1
+                self._touch_locked(key, agent_id)
+                return agent_id, None
+            stats.misses += 1
+            self._spawning[key] = Future()
+            return None, None
+
+    def add(self, key: PoolKey, agent_id: str) -> bool:
+        """
+        Add a newly spawned agent to the pool.
+
+        Fulfils the key's spawn reservation, if any. The agent is refused
+        (and not pooled) if the key already holds max_per_key agents.
+
+        Returns:
+            True if the agent was pooled
+        """
+        with self._lock:
+            members = self._members.setdefault(key, OrderedDict())
+            self._stats.setdefault(key, PoolKeyStats())
+            pooled = agent_id in members or len(members) < self.max_per_key
+            if pooled:
+                members[agent_id] = time.time()
+                self._keys[agent_id] = key
+            elif not members:
+                del self._members[key]
+            pending = self._spawning.pop(key, None)
+        if not pooled:
+            logger.warning(f"Pool key {key} is full; agent {agent_id} not pooled")
+        if pending is not None:
+            pending.set_result(agent_id)
+        return pooled
+
+    def abandon(self, key: PoolKey, error: Optional[BaseException] = None) -> None:
+        """Release a key's spawn reservation after a failed spawn; waiters get the error."""
+        with self._lock:
+            pending = self._spawning.pop(key, None)
+        if pending is not None:
+            pending.set_exception(error or RuntimeError(f"Spawn for {key} abandoned"))
+
+    def remove(self, agent_id: str) -> bool:
+        """Forget an agent (e.g. removed from the core). Returns True if it was pooled."""
+        with self._lock:
+            return self._remove_locked(agent_id)
+
+    def key_of(self, agent_id: str) -> Optional[PoolKey]:
+        """Pool key of an agent, or None if it is not pooled."""
+        return self._keys.get(agent_id)
+
+    def collect_expired(
+        self,
+        idle_since: Callable[[str], Optional[float]],
+        now: Optional[float] = None,
+    ) -> List[str]:
+        """
+        Remove and return agents idle for longer than the TTL.
+
+        Args:
+            idle_since: Returns when an agent became idle (time.time()), or None if busy
+            now: Current time (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+        expired = []
+        with self._lock:
+            for key, members in list(self._members.items()):
+                for agent_id, last_used in list(members.items()):
+                    since = idle_since(agent_id)
+                    if since is None:
+                        continue
+                    if now - max(since, last_used) > self.idle_ttl_seconds:
+                        self._remove_locked(agent_id)
+                        self._stats[key].evicted_ttl += 1
+                        expired.append(agent_id)
+        return expired
+
+    def collect_over_capacity(self, is_available: Callable[[str], bool]) -> List[str]:
+        """Remove and return least recently used available agents above max_total."""
+        evicted = []
+        with self._lock:
+            excess = len(self._keys) - self.max_total
+            if excess <= 0:
+                return evicted
+            candidates = sorted(
+                (last_used, agent_id, key)
+                for key, members in self._members.items()
+                for agent_id, last_used in members.items()
+            )
+            for _, agent_id, key in candidates:
+                if len(evicted) >= excess:
+                    break
+                if is_available(agent_id):
+                    self._remove_locked(agent_id)
+                    self._stats[key].evicted_capacity += 1
+                    evicted.append(agent_id)
+        return evicted
+
+    def _touch_locked(self, key: PoolKey, agent_id: str) -> None:
+        members = self._members[key]
+        members[agent_id] = time.time()
+        members.move_to_end(agent_id)
+
+    def _remove_locked(self, agent_id: str) -> bool:
+        key = self._keys.pop(agent_id, None)
+        if key is None:
+            return False
+        members = self._members.get(key)
+        if members is not None:
+            members.pop(agent_id, None)
+            if not members:
+                del self._members[key]
+        return True
+
+    def describe(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Pool occupancy and hit rate for the key an agent belongs to."""
+        with self._lock:
+            key = self._keys.get(agent_id)
+            if key is None:
+                return None
+            return {
+                "vessel_id": key[0],
+                "specialization": key[1],
+                "occupancy": len(self._members.get(key, ())),
+                "max_per_key": self.max_per_key,
+                "hit_rate": self._stats[key].hit_rate,
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool occupancy and eviction metrics."""
+        with self._lock:
+            totals = PoolKeyStats()
+            by_key = {}
+            for key, stats in self._stats.items():
+                totals.hits += stats.hits
+                totals.misses += stats.misses
+                totals.shared += stats.shared
+                totals.evicted_ttl += stats.evicted_ttl
+                totals.evicted_capacity += stats.evicted_capacity
+                by_key[f"{key[0] or '-'}/{key[1]}"] = {
+                    "occupancy": len(self._members.get(key, ())),
+                    **stats.to_dict(),
+                }
+            return {
+                "occupancy": len(self._keys),
+                "spawning": len(self._spawning),
+                "max_total": self.max_total,
+                "max_per_key": self.max_per_key,
+                "idle_ttl_seconds": self.idle_ttl_seconds,
+                **totals.to_dict(),
+                "by_key": by_key,
+            }
@@ -0,0 +1,233 @@
+"""
+Event-driven agent scheduler for AgentZeroCore.
+
+The legacy runtime gives every agent its own daemon thread that polls its
+message queue once per second. This scheduler instead keeps a bounded pool
+of worker threads and a ready queue of agent IDs. An agent is only queued
+when something wakes it (a message, a task, a consultation response), and
+it is only re-queued while its cycle reports that work remains.
+
+Agents are served round-robin: an agent that still has work after a cycle
+goes to the back of the ready queue, so one busy agent cannot starve the
+others.
+
+Groups of agents (e.g. a bus topic's subscribers) are woken lazily:
+notify_group() only marks the group dirty, and a worker resolves it to
+agent IDs and queues them. A publisher pays O(1) whatever the group size,
+and repeated notifications before a worker gets to the group coalesce.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class AgentScheduler:
+    """
+    Bounded worker pool that runs agent cycles on demand.
+
+    The scheduler knows nothing about agents beyond their IDs. It calls
+    ``run_cycle(agent_id)`` on a worker thread; the callback performs one
+    unit of agent work and returns True if the agent has more work pending.
+    """
+
+    def __init__(
+        self,
+        run_cycle: Callable[[str], bool],
+        max_workers: int = 8,
+        name: str = "a0-scheduler",
+        resolve_group: Optional[Callable[[str], Iterable[str]]] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            run_cycle: Callback running one agent cycle; returns True if more work remains
+            max_workers: Number of worker threads
+            name: Thread name prefix for workers
+            resolve_group: Callback returning the agent IDs of a group, for notify_group()
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self.run_cycle = run_cycle
+        self.max_workers = max_workers
+        self.name = name
+        self.resolve_group = resolve_group
+
+        self._ready: Deque[str] = deque()
+        self._queued: Set[str] = set()
+        self._running: Set[str] = set()
+        self._rerun: Set[str] = set()
+        self._dirty_groups: Set[str] = set()
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._started = False
+
+        # Statistics
+        self._wakeups = 0
+        self._cycles = 0
+        self._errors = 0
+        self._busy_seconds = 0.0
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        with self._cond:
+            if self._started:
+                return
+            self._started = True
+
+        for i in range(self.max_workers):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"{self.name}-{i}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        logger.info(f"Agent scheduler started with {self.max_workers} workers")
+
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """Stop the worker threads and drop any queued wakeups."""
+        with self._cond:
+            if not self._started:
+                return
+            self._started = False
+            self._ready.clear()
+            self._queued.clear()
+            self._rerun.clear()
+            self._dirty_groups.clear()
+            self._cond.notify_all()
+
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._workers = []
+
+    @property
+    def running(self) -> bool:
+        """Whether worker threads are active."""
+        return self._started
+
+    def notify(self, agent_id: str) -> None:
+        """
+        Wake an agent.
+
+        If the agent is already queued this is a no-op. If it is currently
+        running, it is re-queued once its cycle finishes.
+        """
+        with self._cond:
+            self._wakeups += 1
+            self._enqueue_locked(agent_id)
+
+    def notify_many(self, agent_ids: Iterable[str]) -> None:
+        """Wake several agents under a single lock acquisition."""
+        with self._cond:
+            for agent_id in agent_ids:
+                self._wakeups += 1
+                self._enqueue_locked(agent_id)
+
+    def notify_group(self, group: str) -> None:
+        """
+        Wake every agent of a group, resolved later by a worker.
+
+        Marks the group dirty and returns; the caller never touches the
+        group's members.
+        """
+        if self.resolve_group is None:
+            raise RuntimeError("notify_group() requires a resolve_group callback")
+        with self._cond:
+            if group not in self._dirty_groups:
+                self._dirty_groups.add(group)
+                self._cond.notify()
+
+    def discard(self, agent_id: str) -> None:
+        """Forget an agent (e.g. after removal). Running cycles finish normally."""
+        with self._cond:
+            self._rerun.discard(agent_id)
+            if agent_id in self._queued:
+                self._queued.discard(agent_id)
+                try:
+                    self._ready.remove(agent_id)
+                except ValueError:
+                    pass
+
+    def _enqueue_locked(self, agent_id: str) -> None:
+        if agent_id in self._running:
+            self._rerun.add(agent_id)
+        elif agent_id not in self._queued:
+            self._queued.add(agent_id)
+            self._ready.append(agent_id)
+            self._cond.notify()
+
+    def _wake_groups(self, groups: List[str]) -> None:
+        """Queue the members of dirty groups. Runs on a worker, without the lock."""
+        members: List[str] = []
+        for group in groups:
+            try:
+                members.extend(self.resolve_group(group))
+            except Exception as e:
+                logger.error(f"Scheduler could not resolve group {group}: {e}")
+        with self._cond:
+            if not self._started:
+                return
+            for agent_id in members:
+                self._wakeups += 1
+                self._enqueue_locked(agent_id)
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._started and not self._ready and not self._dirty_groups:
+                    self._cond.wait()
+                if not self._started:
+                    return
+                groups = None
+                if self._dirty_groups:
+                    # Cleared before resolving: a later notify marks it again
+                    groups = list(self._dirty_groups)
+                    self._dirty_groups.clear()
+                else:
+                    agent_id = self._ready.popleft()
+                    self._queued.discard(agent_id)
+                    self._running.add(agent_id)
+
+            if groups is not None:
+                self._wake_groups(groups)
+                continue
+
+            more_work = False
+            cycle_start = time.perf_counter()
+            try:
+                more_work = bool(self.run_cycle(agent_id))
+            except Exception as e:
+                logger.error(f"Scheduler cycle error for agent {agent_id}: {e}")
+                self._errors += 1
+
+            with self._cond:
+                self._cycles += 1
+                self._busy_seconds += time.perf_counter() - cycle_start
+                self._running.discard(agent_id)
+                rerun = agent_id in self._rerun
+                self._rerun.discard(agent_id)
+                if self._started and (more_work or rerun):
+                    self._enqueue_locked(agent_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        with self._cond:
+            return {
+                "workers": self.max_workers,
+                "running": self._started,
+                "ready": len(self._ready),
+                "in_flight": len(self._running),
+                "dirty_groups": len(self._dirty_groups),
+                "wakeups": self._wakeups,
+                "cycles": self._cycles,
+                "errors": self._errors,
+                "busy_seconds": self._busy_seconds,
+            }
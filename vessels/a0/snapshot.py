@@ -0,0 +1,97 @@
+"""
+Agent state snapshots for AgentZeroCore warm restarts.
+
+A snapshot is a single pickle (protocol 5) of plain data: agent records
+with specifications, status, pending mailbox messages, queued tasks,
+recent interaction history and pool membership. AgentZeroCore builds and
+consumes the records (save_snapshot / restore_snapshot); this module only
+handles the file format: atomic writes, versioning and converting
+read-only shared messages back into picklable dicts and lists.
+
+Snapshots are trusted local files. Never load one from an untrusted source:
+unpickling can execute arbitrary code.
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+import time
+from collections.abc import Mapping
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+PICKLE_PROTOCOL = 5
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot cannot be read or has an unsupported version."""
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert read-only mappings and tuples into dicts and lists."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    if isinstance(value, frozenset):
+        return set(value)
+    return value
+
+
+def write_snapshot(path: str, state: Dict[str, Any]) -> int:
+    """
+    Atomically write a snapshot.
+
+    The state is pickled to a temporary file in the target directory,
+    fsynced and renamed over the target, so readers see either the old or
+    the new snapshot and never a partial one.
+
+    Returns:
+        Size of the snapshot in bytes
+    """
+    payload = pickle.dumps(
+        {"version": SNAPSHOT_VERSION, "created_at": time.time(), "state": state},
+        protocol=PICKLE_PROTOCOL,
+    )
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(prefix=".snapshot-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return len(payload)
+
+
+def read_snapshot(path: str) -> Dict[str, Any]:
+    """
+    Read a snapshot written by write_snapshot.
+
+    Returns:
+        {"version": int, "created_at": float, "state": {...}}
+
+    Raises:
+        SnapshotError: The file is unreadable, corrupt or from another version
+    """
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        raise SnapshotError(f"Could not read snapshot {path}: {e}") from e
+
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        version = snapshot.get("version") if isinstance(snapshot, dict) else None
+        raise SnapshotError(f"Unsupported snapshot version {version} in {path}")
+    return snapshot
@@ -0,0 +1,340 @@
+"""
+Per-agent task queue and bounded interaction history.
+
+Agent tasks used to live in agent.memory["active_tasks"] as a list consumed
+with pop(0), and every finished task was appended to an ever-growing
+interaction_history list. TaskQueue is a deque of AgentTask records with
+IDs, optional deadlines, retries and O(1) cancellation; InteractionHistory
+is a capped ring buffer that can spill evicted records to a JSONL file.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+Deadline = Union[float, datetime, None]
+
+
+class TaskState(Enum):
+    """Lifecycle of an agent task."""
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    EXPIRED = "expired"
+
+
+@dataclass
+class AgentTask:
+    """A queued unit of work for an agent."""
+    task_id: str
+    payload: Any
+    created_at: float = field(default_factory=time.time)
+    deadline: Optional[float] = None  # time.time() after which the task is dropped
+    max_retries: int = 0
+    attempts: int = 0
+    state: TaskState = TaskState.PENDING
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        if self.deadline is None:
+            return False
+        return (time.time() if now is None else now) > self.deadline
+
+
+def _to_timestamp(deadline: Deadline) -> Optional[float]:
+    if isinstance(deadline, datetime):
+        return deadline.timestamp()
+    return deadline
+
+
+class TaskQueue:
+    """
+    FIFO task queue for one agent.
+
+    Cancelled tasks are removed from the index immediately and skipped
+    lazily when they reach the head, so cancel() is O(1). Expired tasks are
+    dropped when dequeued. len() counts only live pending tasks.
+    """
+
+    def __init__(self, max_retries: int = 0):
+        """
+        Initialize the queue.
+
+        Args:
+            max_retries: Default retries for tasks submitted without one
+        """
+        self.max_retries = max_retries
+
+        self._lock = threading.Lock()
+        self._queue: Deque[AgentTask] = deque()
+        self._pending: Dict[str, AgentTask] = {}
+
+        # Cumulative counters
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._retried = 0
+        self._cancelled = 0
+        self._expired = 0
+
+    def submit(
+        self,
+        payload: Any,
+        task_id: Optional[str] = None,
+        deadline: Deadline = None,
+        max_retries: Optional[int] = None,
+    ) -> str:
+        """
+        Queue a task.
+
+        Args:
+            payload: Task content handed to the executor
+            task_id: Caller-chosen ID (default: a new UUID)
+            deadline: time.time() timestamp or datetime after which the task is dropped
+            max_retries: Retries after a failed attempt (default: queue default)
+
+        Returns:
+            The task ID
+
+        Raises:
+            ValueError: A task with this ID is already pending
+        """
+        task = AgentTask(
+            task_id=task_id or str(uuid.uuid4()),
+            payload=payload,
+            deadline=_to_timestamp(deadline),
+            max_retries=self.max_retries if max_retries is None else max_retries,
+        )
+        with self._lock:
+            if task.task_id in self._pending:
+                raise ValueError(f"Task {task.task_id} is already pending")
+            self._queue.append(task)
+            self._pending[task.task_id] = task
+            self._submitted += 1
+        return task.task_id
+
+    def restore(self, tasks: Iterable[AgentTask]) -> None:
+        """Re-queue task records (e.g. from a snapshot), keeping their IDs and attempts."""
+        with self._lock:
+            for task in tasks:
+                if task.task_id in self._pending:
+                    logger.warning(f"Task {task.task_id} is already pending; duplicate not restored")
+                    continue
+                task.state = TaskState.PENDING
+                self._queue.append(task)
+                self._pending[task.task_id] = task
+
+    def append(self, payload: Any) -> None:
+        """List-style alias for submit() with default options."""
+        self.submit(payload)
+
+    def next(self, now: Optional[float] = None) -> Optional[AgentTask]:
+        """Dequeue the next live task and mark it RUNNING, or return None."""
+        now = time.time() if now is None else now
+        with self._lock:
+            while self._queue:
+                task = self._queue.popleft()
+                if task.state != TaskState.PENDING:
+                    continue  # Cancelled while queued
+                if self._pending.get(task.task_id) is not task:
+                    continue  # Stale entry; the ID belongs to another task
+                self._pending.pop(task.task_id, None)
+                if task.expired(now):
+                    task.state = TaskState.EXPIRED
+                    self._expired += 1
+                    logger.debug(f"Task {task.task_id} expired before it ran")
+                    continue
+                task.state = TaskState.RUNNING
+                task.attempts += 1
+                return task
+        return None
+
+    def requeue(self, task: AgentTask) -> None:
+        """
+        Put a dequeued task that never started back at the head of the queue.
+
+        The attempt taken by next() is undone. If a new task with the same ID
+        was submitted in the meantime, the old one is dropped instead.
+        """
+        with self._lock:
+            if task.task_id in self._pending:
+                logger.warning(f"Task {task.task_id} was resubmitted; not re-queued")
+                return
+            task.state = TaskState.PENDING
+            task.attempts -= 1
+            self._queue.appendleft(task)
+            self._pending[task.task_id] = task
+
+    def complete(self, task: AgentTask, success: bool) -> bool:
+        """
+        Record the outcome of a dequeued task.
+
+        A failed task with retries left is re-queued at the back, unless a
+        new task with the same ID was submitted while it ran.
+
+        Returns:
+            True if the task was re-queued for another attempt
+        """
+        with self._lock:
+            if success:
+                task.state = TaskState.DONE
+                self._completed += 1
+                return False
+            if (task.attempts <= task.max_retries and not task.expired()
+                    and task.task_id not in self._pending):
+                task.state = TaskState.PENDING
+                self._queue.append(task)
+                self._pending[task.task_id] = task
+                self._retried += 1
+                return True
+            task.state = TaskState.FAILED
+            self._failed += 1
+            return False
+
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a pending task. Returns False if it is not pending."""
+        with self._lock:
+            task = self._pending.pop(task_id, None)
+            if task is None:
+                return False
+            task.state = TaskState.CANCELLED
+            self._cancelled += 1
+            return True
+
+    def pending(self) -> List[AgentTask]:
+        """Snapshot of live pending tasks in queue order."""
+        with self._lock:
+            return [task for task in self._queue if task.state == TaskState.PENDING]
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and outcome counters."""
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "retried": self._retried,
+                "cancelled": self._cancelled,
+                "expired": self._expired,
+            }
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (tuple, set, frozenset)):
+        return list(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+class InteractionHistory:
+    """
+    Capped ring buffer of interaction records.
+
+    When full, appending evicts the oldest record. If spill_path is set,
+    evicted records are appended to that JSONL file in batches so history
+    is kept on disk without growing memory.
+    """
+
+    def __init__(self, capacity: int = 256, spill_path: Optional[str] = None,
+                 spill_batch: int = 64):
+        """
+        Initialize the history.
+
+        Args:
+            capacity: Records kept in memory
+            spill_path: Optional JSONL file receiving evicted records
+            spill_batch: Evicted records buffered before a write
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.spill_batch = max(1, spill_batch)
+
+        self._lock = threading.Lock()
+        self._records: Deque[Any] = deque()
+        self._spill: List[Any] = []
+        self._total = 0
+        self._spilled = 0
+
+    def append(self, record: Any) -> None:
+        with self._lock:
+            self._records.append(record)
+            self._total += 1
+            if len(self._records) > self.capacity:
+                evicted = self._records.popleft()
+                if self.spill_path:
+                    self._spill.append(evicted)
+                    if len(self._spill) >= self.spill_batch:
+                        self._flush_locked()
+
+    def flush(self) -> None:
+        """Write buffered evicted records to the spill file."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._spill or not self.spill_path:
+            return
+        records, self._spill = self._spill, []
+        try:
+            directory = os.path.dirname(self.spill_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record, default=_json_default) + "\n")
+            self._spilled += len(records)
+        except OSError as e:
+            logger.warning(f"Could not spill interaction history to {self.spill_path}: {e}")
+
+    def recent(self, n: Optional[int] = None) -> List[Any]:
+        """Most recent records in memory, oldest first."""
+        with self._lock:
+            records = list(self._records)
+        return records if n is None else records[-n:]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.recent())
+
+    def __getitem__(self, index: int) -> Any:
+        with self._lock:
+            return self._records[index]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_memory": len(self._records),
+                "capacity": self.capacity,
+                "total": self._total,
+                "spilled": self._spilled,
+                "spill_pending": len(self._spill),
+                "spill_path": self.spill_path,
+            }
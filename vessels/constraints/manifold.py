@@ -5,6 +5,10 @@ A manifold defines:
 - The set of virtue dimensions
 - Constraints that couple those dimensions
 - Parent manifolds (for composition)
+
+Manifolds carry a version that changes whenever their constraints or
+parent change, so callers that cache work derived from a manifold (the
+SSF runtime's invocation plans) can tell when to rebuild it.
 """
 
 from typing import List, Callable, Optional, Dict
@@ -57,8 +61,58 @@ class Manifold:
         """
         self.name = name
         self.virtues = virtues
-        self.constraints = constraints
-        self.parent = parent
+        self._version = 0
+        self._constraints = constraints
+        self._parent = parent
+
+    @property
+    def constraints(self) -> List[Constraint]:
+        return self._constraints
+
+    @constraints.setter
+    def constraints(self, constraints: List[Constraint]) -> None:
+        self._constraints = constraints
+        self.mark_changed()
+
+    @property
+    def parent(self) -> Optional['Manifold']:
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Optional['Manifold']) -> None:
+        self._parent = parent
+        self.mark_changed()
+
+    @property
+    def version(self) -> tuple:
+        """
+        Version of this manifold and its parents.
+
+        Changes whenever constraints are added, removed or replaced here or
+        in a parent. Code that mutates the constraints list in place must
+        call mark_changed() itself.
+        """
+        if self._parent:
+            return (self._version, self._parent.version)
+        return (self._version,)
+
+    def mark_changed(self) -> None:
+        """Bump the version so cached constraint resolutions are rebuilt."""
+        self._version += 1
+
+    def add_constraint(self, constraint: Constraint) -> None:
+        """Add a constraint to this manifold."""
+        self._constraints.append(constraint)
+        self.mark_changed()
+
+    def remove_constraint(self, name: str) -> bool:
+        """Remove a constraint by name. Returns True if one was removed."""
+        remaining = [c for c in self._constraints if c.name != name]
+        if len(remaining) == len(self._constraints):
+            return False
+        self._constraints[:] = remaining
+        self.mark_changed()
+        return True
 
     def validate(self, state: Dict[str, float]) -> tuple[bool, List[str]]:
         """
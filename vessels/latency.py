@@ -0,0 +1,29 @@
+"""
+Latency summary helpers shared by the CLI and the benchmarks.
+
+Every tool that reports p50/p95/p99 uses percentile() so the same samples
+give the same figures everywhere. Kept dependency-free (like
+startup_profile) so the CLI can import it without loading vessels.a0.
+"""
+
+import math
+from typing import Iterable
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """
+    Nearest-rank percentile: the smallest sample with at least pct% of
+    samples at or below it.
+
+    Args:
+        values: Samples (any order)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        The sample at that rank, or 0.0 if there are no samples
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = math.ceil(pct / 100.0 * len(ordered))
+    return ordered[min(len(ordered), max(rank, 1)) - 1]
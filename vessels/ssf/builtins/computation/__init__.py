@@ -10,6 +10,7 @@ from uuid import uuid4
 import json
 import logging
 
+from ...contracts import compile_schema
 from ...schema import (
     SSFDefinition,
     SSFCategory,
@@ -161,38 +162,9 @@ async def handle_validate_data(
     """
     logger.info("Validating data against schema")
 
-    errors = []
-    valid = True
-
-    # Basic type checking
-    expected_type = schema.get("type")
-    if expected_type:
-        type_valid = _check_type(data, expected_type)
-        if not type_valid:
-            valid = False
-            errors.append(f"Expected type {expected_type}, got {type(data).__name__}")
-
-    # Check required fields for objects
-    if expected_type == "object" and isinstance(data, dict):
-        required = schema.get("required", [])
-        for field in required:
-            if field not in data:
-                valid = False
-                errors.append(f"Missing required field: {field}")
-
-        # Check properties
-        properties = schema.get("properties", {})
-        for key, value in data.items():
-            if key in properties:
-                prop_schema = properties[key]
-                prop_type = prop_schema.get("type")
-                if prop_type and not _check_type(value, prop_type):
-                    valid = False
-                    errors.append(f"Field {key}: expected {prop_type}")
-
-            elif strict and not schema.get("additionalProperties", True):
-                valid = False
-                errors.append(f"Unknown field: {key}")
+    # Compiled once per distinct schema; nested objects and arrays are checked too
+    errors = compile_schema(schema, check_additional=strict).errors(data)
+    valid = not errors
 
     return {
         "valid": valid,
@@ -234,21 +206,6 @@ def _to_markdown(data: Any, depth: int = 0) -> str:
         return str(data)
 
 
-def _check_type(value: Any, expected: str) -> bool:
-    """Check if value matches expected JSON type."""
-    type_map = {
-        "string": str,
-        "number": (int, float),
-        "integer": int,
-        "boolean": bool,
-        "array": list,
-        "object": dict,
-        "null": type(None),
-    }
-    expected_type = type_map.get(expected)
-    return isinstance(value, expected_type) if expected_type else True
-
-
 # ============================================================================
 # SSF DEFINITIONS
 # ============================================================================
@@ -0,0 +1,318 @@
+"""
+SSF Contracts - Compiled JSON-schema validators.
+
+An SSF's input_schema and output_schema are contracts checked on every
+invocation. compile_schema() turns a schema into a SchemaValidator once:
+the schema is walked at compile time into a tree of closures, so
+validation only runs the checks the schema actually declares.
+
+Supported keywords: type (a name or a list of names), enum, properties,
+required, additionalProperties (boolean or schema), items and default.
+Unknown keywords and type names are ignored, as before. Following JSON
+Schema, booleans are not accepted as "integer" or "number".
+
+Error messages name the offending field by path ("address.city",
+"recipients[2]"):
+    Missing required field: <path>
+    Unknown field: <path>
+    Field <path> has wrong type, expected <type>
+    Field <path> must be one of <enum>
+    Expected type <type>, got <python type>   (for the value itself)
+"""
+
+import copy
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# JSON schema type -> Python types accepted for it
+JSON_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,),
+    "array": (list, tuple),
+    "object": (dict,),
+    "null": (type(None),),
+}
+
+# Compiled validators kept by compile_schema(), keyed by canonical schema JSON
+SCHEMA_CACHE_SIZE = 256
+
+# node(value, parent_path, key, errors) appends messages for `value`, found
+# at `key` under `parent_path`. The value's own path is only formatted when
+# an error is reported or the node has children, keeping valid leaves cheap.
+_Node = Callable[[Any, str, Any, List[str]], None]
+
+
+class _Stop(Exception):
+    """Raised by _FirstError to end validation at the first error."""
+
+
+class _FirstError(list):
+    """Error list that stops validation as soon as one error is added."""
+
+    def append(self, message: str) -> None:
+        super().append(message)
+        raise _Stop
+
+
+def _path(parent: str, key: Any) -> str:
+    if key is None:
+        return parent
+    if isinstance(key, int):
+        return f"{parent}[{key}]"
+    return f"{parent}.{key}" if parent else key
+
+
+def _compile_type(expected: Any) -> Tuple[Optional[Tuple[type, ...]], bool]:
+    """(accepted Python types, reject bools) for a schema "type"; None if unchecked."""
+    names = expected if isinstance(expected, list) else [expected]
+    if not names or not all(isinstance(n, str) and n in JSON_TYPES for n in names):
+        return None, False
+    accepted = tuple(t for n in names for t in JSON_TYPES[n])
+    reject_bool = "boolean" not in names and any(n in ("integer", "number") for n in names)
+    return accepted, reject_bool
+
+
+def _compile_node(schema: Any, check_additional: bool) -> Tuple[Optional[_Node], bool]:
+    """Compile one (sub)schema into (node, has_defaults)."""
+    if not isinstance(schema, dict):
+        return None, False
+
+    steps: List[Callable[[Dict[str, Any], str, List[str]], None]] = []
+    has_defaults = False
+
+    expected = schema.get("type")
+    accepted, reject_bool = _compile_type(expected) if expected is not None else (None, False)
+
+    def type_error(parent: str, key: Any, value: Any) -> str:
+        if key is None and not parent:
+            return f"Expected type {expected}, got {type(value).__name__}"
+        return f"Field {_path(parent, key)} has wrong type, expected {expected}"
+
+    enum = schema.get("enum")
+    if not isinstance(enum, list):
+        enum = None
+
+    # Object keywords
+    properties: Dict[str, _Node] = {}
+    raw_properties = schema.get("properties")
+    if isinstance(raw_properties, dict):
+        for key, prop in raw_properties.items():
+            node, prop_defaults = _compile_node(prop, check_additional)
+            if node is not None:
+                properties[key] = node
+            has_defaults = has_defaults or prop_defaults or (isinstance(prop, dict) and "default" in prop)
+    required = tuple(r for r in schema.get("required", ()) if isinstance(r, str))
+    additional = schema.get("additionalProperties", True)
+    closed = check_additional and additional is False
+    additional_node = None
+    if check_additional and isinstance(additional, dict):
+        additional_node, _ = _compile_node(additional, check_additional)
+
+    if required:
+        def check_required(value, path, errors):
+            for key in required:
+                if key not in value:
+                    errors.append(f"Missing required field: {_path(path, key)}")
+        steps.append(check_required)
+
+    if closed or additional_node is not None:
+        known = frozenset(raw_properties) if isinstance(raw_properties, dict) else frozenset()
+
+        def check_additional_properties(value, path, errors):
+            for key, item in value.items():
+                if key in known:
+                    continue
+                if closed:
+                    errors.append(f"Unknown field: {_path(path, key)}")
+                else:
+                    additional_node(item, path, key, errors)
+        steps.append(check_additional_properties)
+
+    if properties:
+        def check_properties(value, path, errors):
+            for key, item in value.items():
+                node = properties.get(key)
+                if node is not None:
+                    node(item, path, key, errors)
+        steps.append(check_properties)
+
+    object_steps = tuple(steps)
+
+    # Array keywords
+    items_node = None
+    items = schema.get("items")
+    if isinstance(items, dict):
+        items_node, items_defaults = _compile_node(items, check_additional)
+        has_defaults = has_defaults or items_defaults
+
+    if not object_steps and items_node is None:
+        # Leaf: at most a type and an enum check
+        if accepted is None and enum is None:
+            return None, has_defaults
+
+        def node(value, parent, key, errors):
+            if accepted is not None and (
+                not isinstance(value, accepted) or (reject_bool and value.__class__ is bool)
+            ):
+                errors.append(type_error(parent, key, value))
+            elif enum is not None and value not in enum:
+                errors.append(_enum_error(_path(parent, key), enum))
+
+        return node, has_defaults
+
+    def node(value, parent, key, errors):
+        if accepted is not None and (
+            not isinstance(value, accepted) or (reject_bool and value.__class__ is bool)
+        ):
+            errors.append(type_error(parent, key, value))
+            return
+        path = _path(parent, key)
+        if enum is not None and value not in enum:
+            errors.append(_enum_error(path, enum))
+            return
+        if object_steps and isinstance(value, dict):
+            for step in object_steps:
+                step(value, path, errors)
+        elif items_node is not None and isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                items_node(item, path, index, errors)
+
+    return node, has_defaults
+
+
+def _enum_error(path: str, enum: List[Any]) -> str:
+    return f"Field {path} must be one of {enum}" if path else f"Value must be one of {enum}"
+
+
+class SchemaValidator:
+    """A JSON schema compiled into validation closures."""
+
+    def __init__(self, schema: Dict[str, Any], check_additional: bool = True):
+        """
+        Args:
+            schema: JSON schema (an SSF's input_schema or output_schema)
+            check_additional: Enforce "additionalProperties"; when False,
+                extra fields are always allowed
+        """
+        # Own copy: later edits to the caller's dict must not leak into a cached validator
+        self.schema = copy.deepcopy(schema or {})
+        self._node, self.has_defaults = _compile_node(self.schema, check_additional)
+        self._check_additional = check_additional
+        self._defaults: Optional[Tuple[Dict[str, Any], Dict[str, "SchemaValidator"], Any]] = None
+
+    def errors(self, value: Any) -> List[str]:
+        """All validation errors, in schema order."""
+        if self._node is None:
+            return []
+        errors: List[str] = []
+        try:
+            self._node(value, "", None, errors)
+        except Exception as e:
+            errors.append(f"Schema validation error: {str(e)}")
+        return errors
+
+    def first_error(self, value: Any) -> Optional[str]:
+        """The first validation error, or None if the value is valid."""
+        if self._node is None:
+            return None
+        errors = _FirstError()
+        try:
+            self._node(value, "", None, errors)
+        except _Stop:
+            return errors[0]
+        except Exception as e:
+            return f"Schema validation error: {str(e)}"
+        return None
+
+    __call__ = first_error
+
+    def apply_defaults(self, value: Any) -> Any:
+        """
+        Fill in "default" values for missing properties, at any depth.
+
+        Returns the value itself when nothing is missing, otherwise a copy;
+        the value passed in is never modified.
+        """
+        if not self.has_defaults:
+            return value
+        if self._defaults is None:
+            self._defaults = self._compile_defaults()
+        defaults, nested, items = self._defaults
+
+        if isinstance(value, dict):
+            result = value
+            for key, default in defaults.items():
+                if key not in value:
+                    if result is value:
+                        result = dict(value)
+                    result[key] = copy.deepcopy(default)
+            for key, validator in nested.items():
+                if key in result:
+                    filled = validator.apply_defaults(result[key])
+                    if filled is not result[key]:
+                        if result is value:
+                            result = dict(value)
+                        result[key] = filled
+            return result
+
+        if items is not None and isinstance(value, list):
+            filled = [items.apply_defaults(item) for item in value]
+            if any(new is not old for new, old in zip(filled, value)):
+                return filled
+        return value
+
+    def _compile_defaults(self):
+        schema = self.schema
+        properties = schema.get("properties")
+        properties = properties if isinstance(properties, dict) else {}
+        defaults = {
+            key: prop["default"]
+            for key, prop in properties.items()
+            if isinstance(prop, dict) and "default" in prop
+        }
+        nested = {}
+        for key, prop in properties.items():
+            validator = SchemaValidator(prop, self._check_additional) if isinstance(prop, dict) else None
+            if validator is not None and validator.has_defaults:
+                nested[key] = validator
+        items = schema.get("items")
+        items_validator = SchemaValidator(items, self._check_additional) if isinstance(items, dict) else None
+        if items_validator is not None and not items_validator.has_defaults:
+            items_validator = None
+        return defaults, nested, items_validator
+
+
+_cache: "OrderedDict[Tuple[str, bool], SchemaValidator]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def compile_schema(schema: Optional[Dict[str, Any]], check_additional: bool = True) -> SchemaValidator:
+    """
+    Compile a JSON schema, reusing the validator for an identical schema.
+
+    Schemas are compared by content, so the validator is shared by SSFs
+    with the same contract and by callers that pass a fresh dict each time
+    (handle_validate_data). Schemas that are not JSON-serializable are
+    compiled without caching.
+    """
+    try:
+        key = (json.dumps(schema or {}, sort_keys=True), check_additional)
+    except (TypeError, ValueError):
+        return SchemaValidator(schema or {}, check_additional)
+
+    with _cache_lock:
+        validator = _cache.get(key)
+        if validator is not None:
+            _cache.move_to_end(key)
+            return validator
+
+    validator = SchemaValidator(schema or {}, check_additional)
+    with _cache_lock:
+        _cache[key] = validator
+        while len(_cache) > SCHEMA_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return validator
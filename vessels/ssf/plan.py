@@ -0,0 +1,84 @@
+"""
+SSF Invocation Plans - per-SSF work done once instead of on every invoke.
+
+An InvocationPlan holds everything SSFRuntime.invoke() can derive from an
+SSF definition and the runtime's manifold without seeing the inputs:
+
+- The input and output schemas compiled into validators (contracts.py)
+- Forbidden input/output patterns, compiled into scanners (scanner.py)
+- The resolved constraint list (and names) for the binding mode
+- The operational state hints for the SSF's category
+- The resolved handler callable
+
+The runtime compiles a plan when the SSF is registered and keeps it until
+the registry entry changes or the manifold's version moves on.
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .contracts import SchemaValidator
+from .scanner import PatternScanner
+from .schema import SSFDefinition
+
+logger = logging.getLogger(__name__)
+
+Executor = Callable[[Dict[str, Any], Any], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def compile_patterns(patterns: List[str]) -> Tuple[List[Tuple[str, re.Pattern]], Optional[re.error]]:
+    """
+    Compile forbidden patterns (case-insensitive).
+
+    Returns the (source, compiled) pairs of the valid patterns and the
+    first compile error, if any.
+    """
+    compiled = []
+    error = None
+    for pattern in patterns:
+        try:
+            compiled.append((pattern, re.compile(pattern, re.IGNORECASE)))
+        except re.error as e:
+            logger.warning(f"Invalid regex pattern: {pattern}")
+            error = error or e
+    return compiled, error
+
+
+@dataclass
+class InvocationPlan:
+    """Precompiled invocation state for one SSF under one manifold version."""
+    ssf: SSFDefinition
+    input_contract: SchemaValidator
+    output_contract: SchemaValidator
+    forbidden_input: PatternScanner
+    forbidden_output: PatternScanner
+    constraints: List[Any]
+    constraint_names: List[str]
+    state_hints: Dict[str, float]
+    execute: Executor
+
+    # What the plan was compiled against
+    manifold: Optional[Any] = None
+    manifold_version: Optional[Any] = None
+
+    # First invalid forbidden pattern; binding fails while it is set
+    pattern_error: Optional[re.error] = None
+
+    compiled_at: float = field(default_factory=time.time)
+
+    def is_current(self, manifold: Optional[Any]) -> bool:
+        """Whether the plan still matches the runtime's manifold."""
+        return (
+            self.manifold is manifold
+            and self.manifold_version == getattr(manifold, "version", None)
+        )
+
+    def forbidden_patterns(self) -> Dict[str, List[re.Pattern]]:
+        """Compiled patterns by direction, as bound into the execution context."""
+        return {
+            "input": [regex for _, regex in self.forbidden_input.patterns],
+            "output": [regex for _, regex in self.forbidden_output.patterns],
+        }
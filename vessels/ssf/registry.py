@@ -119,6 +119,32 @@ class SSFRegistry:
         # Pending approvals
         self._pending_approvals: Dict[UUID, SSFDefinition] = {}
 
+        # Change listeners: called with ("registered" | "unregistered", ssf)
+        self._listeners: List[Callable[[str, SSFDefinition], None]] = []
+
+    def add_listener(self, listener: Callable[[str, SSFDefinition], None]) -> None:
+        """
+        Subscribe to registry changes.
+
+        The listener is called with "registered" whenever an SSF is stored
+        (including re-registration and loads from the graph) and with
+        "unregistered" when it is removed.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, SSFDefinition], None]) -> None:
+        """Unsubscribe a listener added with add_listener()."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event: str, ssf: SSFDefinition) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(event, ssf)
+            except Exception as e:
+                logger.error(f"SSF registry listener failed on {event} {ssf.name}: {e}")
+
     async def get(self, ssf_id: UUID) -> Optional[SSFDefinition]:
         """
         Retrieve SSF definition by ID.
@@ -207,6 +233,7 @@ class SSFRegistry:
             del self._by_name[ssf.name]
         if ssf.category in self._by_category:
             self._by_category[ssf.category].discard(ssf_id)
+        self._notify("unregistered", ssf)
 
         # Remove from graph if available
         if self.graph_client:
@@ -515,6 +542,7 @@ class SSFRegistry:
         self._ssfs[ssf.id] = ssf
         self._by_name[ssf.name] = ssf.id
         self._by_category[ssf.category].add(ssf.id)
+        self._notify("registered", ssf)
 
     async def _load_from_graph(self, ssf_id: UUID) -> Optional[Dict[str, Any]]:
         """Load SSF from graph storage."""
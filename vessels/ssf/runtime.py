@@ -18,6 +18,7 @@ import re
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 from uuid import UUID
 
@@ -35,6 +36,10 @@ from .schema import (
     ExecutionContext,
     SSFPermissions,
 )
+from .contracts import compile_schema
+from .plan import InvocationPlan, Executor, compile_patterns
+from .scanner import PatternScanner
+from .metrics import SSFMetrics, Stage, StageTimer
 
 if TYPE_CHECKING:
     from ..constraints.manifold import Manifold
@@ -127,6 +132,14 @@ class SSFRuntime:
     5. Logging execution to shared memory
 
     There are NO backdoors - this is the only entry point for execution.
+
+    Per-SSF work that does not depend on the inputs (schema validators,
+    forbidden-pattern regexes, constraint resolution, handler lookup) is
+    compiled into an InvocationPlan when the SSF is registered, and
+    recompiled when the registry entry or the manifold version changes.
+
+    Each of the nine steps of invoke() is timed into per-SSF histograms
+    (see metrics.py); get_stats() reports their percentiles.
     """
 
     def __init__(
@@ -136,6 +149,7 @@ class SSFRuntime:
         registry: Optional["SSFRegistry"] = None,
         default_timeout_seconds: int = 30,
         latency_budget_ms: float = 50.0,
+        warn_over_budget: bool = False,
     ):
         """
         Initialize the SSF runtime.
@@ -146,12 +160,16 @@ class SSFRuntime:
             registry: SSF registry for lookups
             default_timeout_seconds: Default execution timeout
             latency_budget_ms: Max overhead for SSF system (target <50ms)
+            warn_over_budget: Log a warning for each invocation whose overhead
+                outside the handler exceeds latency_budget_ms
         """
         self.manifold = manifold
         self.memory_client = memory_client
-        self.registry = registry
+        self._registry: Optional["SSFRegistry"] = None
+        self._plans: Dict[UUID, InvocationPlan] = {}
         self.default_timeout_seconds = default_timeout_seconds
         self.latency_budget_ms = latency_budget_ms
+        self.warn_over_budget = warn_over_budget
 
         # Execution statistics
         self._total_invocations = 0
@@ -159,9 +177,106 @@ class SSFRuntime:
         self._successful_invocations = 0
         self._total_execution_time = 0.0
 
+        # Per-stage latency histograms
+        self.metrics = SSFMetrics()
+
         # Handler cache
         self._handler_cache: Dict[str, Callable] = {}
 
+        # Subscribes to registry changes and compiles plans for its SSFs
+        self.registry = registry
+
+    @property
+    def registry(self) -> Optional["SSFRegistry"]:
+        return self._registry
+
+    @registry.setter
+    def registry(self, registry: Optional["SSFRegistry"]) -> None:
+        """Attach a registry, compiling plans for the SSFs it already holds."""
+        if self._registry is not None:
+            self._registry.remove_listener(self._on_registry_change)
+        self._registry = registry
+        self._plans.clear()
+        if registry is not None:
+            registry.add_listener(self._on_registry_change)
+            for ssf in registry.list_all():
+                self._on_registry_change("registered", ssf)
+
+    def _on_registry_change(self, event: str, ssf: SSFDefinition) -> None:
+        """Registry listener: recompile or drop the SSF's plan."""
+        self._plans.pop(ssf.id, None)
+        if event != "registered":
+            return
+        try:
+            self._plans[ssf.id] = self.compile_plan(ssf)
+        except Exception as e:
+            # Compiled again (and the error surfaced) on first invoke
+            logger.debug(f"Deferred plan compilation for {ssf.name}: {e}")
+
+    def compile_plan(self, ssf: SSFDefinition) -> InvocationPlan:
+        """Compile the invocation plan for an SSF under the current manifold."""
+        binding = ssf.constraint_binding
+
+        forbidden_input, input_error = compile_patterns(binding.forbidden_input_patterns)
+        forbidden_output, output_error = compile_patterns(binding.forbidden_output_patterns)
+
+        if binding.mode == ConstraintBindingMode.FULL:
+            constraints = self.manifold.get_all_constraints() if self.manifold else []
+        elif binding.mode == ConstraintBindingMode.FILTERED:
+            constraints = self._get_category_constraints(ssf.category)
+        else:  # EXPLICIT
+            constraints = self._get_explicit_constraints(binding.explicit_constraints or [])
+
+        # Bound names fall back to the explicit list when there is no manifold
+        if self.manifold or binding.mode == ConstraintBindingMode.FILTERED:
+            constraint_names = [c.name for c in constraints]
+        else:
+            constraint_names = list(binding.explicit_constraints or [])
+
+        # Operational hints based on SSF category
+        if ssf.category == SSFCategory.COMMUNICATION:
+            state_hints = {"coordination": 0.8}
+        elif ssf.category == SSFCategory.DATA_MUTATION:
+            state_hints = {"activity": 0.6}
+        else:
+            state_hints = {}
+
+        return InvocationPlan(
+            ssf=ssf,
+            input_contract=compile_schema(ssf.input_schema),
+            output_contract=compile_schema(ssf.output_schema),
+            forbidden_input=PatternScanner(forbidden_input),
+            forbidden_output=PatternScanner(forbidden_output),
+            constraints=constraints,
+            constraint_names=constraint_names,
+            state_hints=state_hints,
+            execute=self._resolve_executor(ssf.handler),
+            manifold=self.manifold,
+            manifold_version=getattr(self.manifold, "version", None),
+            pattern_error=input_error or output_error,
+        )
+
+    async def get_plan(self, ssf_id: UUID) -> Optional[InvocationPlan]:
+        """Current plan for an SSF, compiling it if missing or stale."""
+        plan = self._plans.get(ssf_id)
+        if plan is not None and plan.is_current(self.manifold):
+            return plan
+
+        ssf = plan.ssf if plan is not None else await self._resolve_ssf(ssf_id)
+        if not ssf:
+            return None
+
+        plan = self.compile_plan(ssf)
+        self._plans[ssf_id] = plan
+        return plan
+
+    def invalidate_plans(self, ssf_id: Optional[UUID] = None) -> None:
+        """Drop one SSF's plan, or all plans; they are recompiled on next invoke."""
+        if ssf_id is None:
+            self._plans.clear()
+        else:
+            self._plans.pop(ssf_id, None)
+
     async def invoke(
         self,
         ssf_id: UUID,
@@ -188,19 +303,24 @@ class SSFRuntime:
         start_time = time.time()
         self._total_invocations += 1
         execution_context = execution_context or ExecutionContext()
+        timer = StageTimer()
+        plan = None
 
         try:
-            # 1. Resolve SSF definition
-            ssf = await self._resolve_ssf(ssf_id)
-            if not ssf:
+            # 1. Resolve SSF definition and its compiled plan
+            plan = await self.get_plan(ssf_id)
+            timer.lap(Stage.RESOLVE)
+            if not plan:
                 return SSFResult(
                     status=SSFStatus.ERROR,
                     error=f"SSF not found: {ssf_id}",
                     ssf_id=ssf_id,
                 )
+            ssf = plan.ssf
 
             # 2. Check persona permissions
             permission_error = await self._check_permissions(ssf, invoking_persona)
+            timer.lap(Stage.PERMISSIONS)
             if permission_error:
                 self._blocked_invocations += 1
                 return SSFResult(
@@ -211,8 +331,9 @@ class SSFRuntime:
                 )
 
             # 3. Validate inputs against schema
-            schema_error = await self._validate_input_schema(ssf, inputs)
+            schema_error = plan.input_contract.first_error(inputs)
             if schema_error:
+                timer.lap(Stage.INPUT_SCHEMA)
                 self._blocked_invocations += 1
                 return SSFResult(
                     status=SSFStatus.BLOCKED,
@@ -220,15 +341,18 @@ class SSFRuntime:
                     ssf_id=ssf_id,
                     ssf_name=ssf.name,
                 )
+            inputs = plan.input_contract.apply_defaults(inputs)
+            timer.lap(Stage.INPUT_SCHEMA)
 
             # 4. Validate inputs against ethical manifold
             if ssf.constraint_binding.validate_inputs:
                 input_validation = await self._validate_against_manifold(
-                    ssf=ssf,
+                    plan=plan,
                     data=inputs,
                     direction="input",
                     persona=invoking_persona,
                 )
+                timer.lap(Stage.INPUT_MANIFOLD)
 
                 if input_validation.blocked:
                     self._blocked_invocations += 1
@@ -236,6 +360,7 @@ class SSFRuntime:
                         ssf, inputs, None, invoking_persona, invoking_agent,
                         input_validation, "input"
                     )
+                    timer.lap(Stage.LOG)
                     return SSFResult(
                         status=SSFStatus.BLOCKED,
                         error=f"Input violates constraint: {input_validation.violation}",
@@ -265,17 +390,19 @@ class SSFRuntime:
 
             # 5. Create execution context with bound constraints
             bound_context = await self._bind_constraints(
-                ssf=ssf,
+                plan=plan,
                 persona=invoking_persona,
                 agent=invoking_agent,
                 execution_context=execution_context,
             )
+            timer.lap(Stage.BIND)
 
             # 6. Execute the SSF
             execution_start = time.time()
             try:
-                raw_output = await self._execute(ssf, inputs, bound_context)
+                raw_output = await self._execute(plan, inputs, bound_context)
             except asyncio.TimeoutError:
+                timer.lap(Stage.EXECUTE)
                 return SSFResult(
                     status=SSFStatus.TIMEOUT,
                     error=f"SSF execution timed out after {ssf.timeout_seconds}s",
@@ -284,6 +411,7 @@ class SSFRuntime:
                     ssf_name=ssf.name,
                 )
             except Exception as e:
+                timer.lap(Stage.EXECUTE)
                 logger.error(f"SSF execution error: {e}", exc_info=True)
                 return SSFResult(
                     status=SSFStatus.ERROR,
@@ -294,15 +422,34 @@ class SSFRuntime:
                 )
 
             execution_duration = time.time() - execution_start
+            timer.lap(Stage.EXECUTE)
+
+            # 7. Validate outputs against schema. The compiled contract walks
+            # the output in place and stops at the first error, so large
+            # results (fetched pages, aggregates) are never serialized for it.
+            if raw_output is not None:
+                schema_error = plan.output_contract.first_error(raw_output)
+                timer.lap(Stage.OUTPUT_SCHEMA)
+                if schema_error:
+                    self._blocked_invocations += 1
+                    logger.warning(f"SSF {ssf.name} output breaks its schema: {schema_error}")
+                    return SSFResult(
+                        status=SSFStatus.OUTPUT_BLOCKED,
+                        error=f"Output schema validation failed: {schema_error}",
+                        execution_time_seconds=execution_duration,
+                        ssf_id=ssf_id,
+                        ssf_name=ssf.name,
+                    )
 
-            # 7. Validate outputs against ethical manifold
+            # 8. Validate outputs against ethical manifold
             if ssf.constraint_binding.validate_outputs:
                 output_validation = await self._validate_against_manifold(
-                    ssf=ssf,
+                    plan=plan,
                     data=raw_output or {},
                     direction="output",
                     persona=invoking_persona,
                 )
+                timer.lap(Stage.OUTPUT_MANIFOLD)
 
                 if output_validation.blocked:
                     self._blocked_invocations += 1
@@ -310,6 +457,7 @@ class SSFRuntime:
                         ssf, inputs, raw_output, invoking_persona, invoking_agent,
                         output_validation, "output"
                     )
+                    timer.lap(Stage.LOG)
                     return SSFResult(
                         status=SSFStatus.OUTPUT_BLOCKED,
                         error=f"Output violates constraint: {output_validation.violation}",
@@ -319,7 +467,7 @@ class SSFRuntime:
                         ssf_name=ssf.name,
                     )
 
-            # 8. Log successful execution
+            # 9. Log successful execution
             await self._log_execution(
                 ssf=ssf,
                 inputs=inputs,
@@ -329,6 +477,7 @@ class SSFRuntime:
                 duration=execution_duration,
                 context=execution_context,
             )
+            timer.lap(Stage.LOG)
 
             self._successful_invocations += 1
             total_time = time.time() - start_time
@@ -350,6 +499,25 @@ class SSFRuntime:
                 ssf_id=ssf_id,
             )
 
+        finally:
+            if plan is not None:
+                self._record_timings(plan.ssf, timer)
+
+    def _record_timings(self, ssf: SSFDefinition, timer: StageTimer) -> None:
+        """Record stage laps and flag overhead beyond the latency budget."""
+        over_budget = self.metrics.record(
+            ssf.name, ssf.category.value, timer, self.latency_budget_ms / 1000
+        )
+        if over_budget and self.warn_over_budget:
+            stages = ", ".join(
+                f"{stage.value}={ns / 1e6:.2f}ms"
+                for stage, ns in timer.laps if stage is not Stage.EXECUTE
+            )
+            logger.warning(
+                f"SSF {ssf.name} overhead {timer.overhead * 1000:.2f}ms exceeds "
+                f"latency budget {self.latency_budget_ms}ms ({stages})"
+            )
+
     async def _resolve_ssf(self, ssf_id: UUID) -> Optional[SSFDefinition]:
         """Resolve SSF definition from registry."""
         if self.registry:
@@ -387,69 +555,9 @@ class SSFRuntime:
 
         return None
 
-    async def _validate_input_schema(
-        self,
-        ssf: SSFDefinition,
-        inputs: Dict[str, Any]
-    ) -> Optional[str]:
-        """
-        Validate inputs against SSF's JSON schema.
-
-        Returns error message if validation fails, None if valid.
-        """
-        if not ssf.input_schema:
-            return None
-
-        try:
-            # Basic schema validation
-            schema = ssf.input_schema
-            properties = schema.get("properties", {})
-            required = schema.get("required", [])
-
-            # Check required fields
-            for field_name in required:
-                if field_name not in inputs:
-                    return f"Missing required field: {field_name}"
-
-            # Check additional properties
-            if not schema.get("additionalProperties", True):
-                for key in inputs:
-                    if key not in properties:
-                        return f"Unknown field: {key}"
-
-            # Type checking for provided values
-            for key, value in inputs.items():
-                if key in properties:
-                    prop_schema = properties[key]
-                    expected_type = prop_schema.get("type")
-                    if expected_type:
-                        if not self._check_type(value, expected_type):
-                            return f"Field {key} has wrong type, expected {expected_type}"
-
-            return None
-
-        except Exception as e:
-            return f"Schema validation error: {str(e)}"
-
-    def _check_type(self, value: Any, expected_type: str) -> bool:
-        """Check if value matches expected JSON schema type."""
-        type_mapping = {
-            "string": str,
-            "number": (int, float),
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-            "null": type(None),
-        }
-        expected = type_mapping.get(expected_type)
-        if expected:
-            return isinstance(value, expected)
-        return True
-
     async def _validate_against_manifold(
         self,
-        ssf: SSFDefinition,
+        plan: InvocationPlan,
         data: Dict[str, Any],
         direction: str,  # "input" or "output"
         persona: Persona,
@@ -461,51 +569,28 @@ class SSFRuntime:
         """
         validation = ManifoldValidation()
 
-        # Get constraint binding config
-        binding = ssf.constraint_binding
-
-        # Check forbidden patterns first (hard-coded safety rails)
-        forbidden_patterns = (
-            binding.forbidden_input_patterns if direction == "input"
-            else binding.forbidden_output_patterns
-        )
+        # Check forbidden patterns first (hard-coded safety rails). The
+        # scanner walks keys and string leaves in place, never str(data).
+        scanner = plan.forbidden_input if direction == "input" else plan.forbidden_output
 
-        for pattern in forbidden_patterns:
-            try:
-                regex = re.compile(pattern, re.IGNORECASE)
-                data_str = str(data)
-                if regex.search(data_str):
-                    validation.blocked = True
-                    validation.violation = f"Data matches forbidden pattern: {pattern}"
-                    validation.violations.append(validation.violation)
-                    return validation
-            except re.error:
-                logger.warning(f"Invalid regex pattern: {pattern}")
+        if scanner:
+            pattern = scanner.search(data)
+            if pattern is not None:
+                validation.blocked = True
+                validation.violation = f"Data matches forbidden pattern: {pattern}"
+                validation.violations.append(validation.violation)
+                return validation
 
         # If we have a manifold, validate against virtue constraints
         if self.manifold:
             virtue_state = persona.virtue_state or {}
 
-            # Get constraints to apply based on binding mode
-            if binding.mode == ConstraintBindingMode.FULL:
-                constraints = self.manifold.get_all_constraints()
-            elif binding.mode == ConstraintBindingMode.FILTERED:
-                constraints = self._get_category_constraints(ssf.category)
-            else:  # EXPLICIT
-                constraints = self._get_explicit_constraints(binding.explicit_constraints or [])
-
             # Check each constraint
-            for constraint in constraints:
+            for constraint in plan.constraints:
                 validation.checked_constraints.append(constraint.name)
 
                 # Create combined state for constraint checking
-                combined_state = {**virtue_state}
-
-                # Add operational hints based on SSF category
-                if ssf.category == SSFCategory.COMMUNICATION:
-                    combined_state["coordination"] = 0.8
-                elif ssf.category == SSFCategory.DATA_MUTATION:
-                    combined_state["activity"] = 0.6
+                combined_state = {**virtue_state, **plan.state_hints}
 
                 try:
                     if not constraint(combined_state):
@@ -553,42 +638,29 @@ class SSFRuntime:
 
     async def _bind_constraints(
         self,
-        ssf: SSFDefinition,
+        plan: InvocationPlan,
         persona: Persona,
         agent: A0AgentInstance,
         execution_context: ExecutionContext,
     ) -> BoundConstraintContext:
         """Create execution context with bound constraints."""
-        binding = ssf.constraint_binding
-
-        # Compile forbidden patterns
-        forbidden_patterns = {
-            "input": [re.compile(p, re.IGNORECASE) for p in binding.forbidden_input_patterns],
-            "output": [re.compile(p, re.IGNORECASE) for p in binding.forbidden_output_patterns],
-        }
-
-        # Get constraint names
-        if binding.mode == ConstraintBindingMode.FULL and self.manifold:
-            constraint_names = [c.name for c in self.manifold.get_all_constraints()]
-        elif binding.mode == ConstraintBindingMode.FILTERED:
-            constraint_names = [c.name for c in self._get_category_constraints(ssf.category)]
-        else:
-            constraint_names = binding.explicit_constraints or []
+        if plan.pattern_error is not None:
+            raise plan.pattern_error
 
         return BoundConstraintContext(
-            ssf=ssf,
+            ssf=plan.ssf,
             persona_id=persona.id,
             agent_id=agent.agent_id,
-            constraints=constraint_names,
+            constraints=list(plan.constraint_names),
             virtue_state=persona.virtue_state or {},
-            forbidden_patterns=forbidden_patterns,
+            forbidden_patterns=plan.forbidden_patterns(),
             execution_context=execution_context,
-            timeout_seconds=execution_context.timeout_override or ssf.timeout_seconds,
+            timeout_seconds=execution_context.timeout_override or plan.ssf.timeout_seconds,
         )
 
     async def _execute(
         self,
-        ssf: SSFDefinition,
+        plan: InvocationPlan,
         inputs: Dict[str, Any],
         context: BoundConstraintContext,
     ) -> Optional[Dict[str, Any]]:
@@ -597,21 +669,38 @@ class SSFRuntime:
 
         This is the actual execution of the SSF logic.
         """
-        if not ssf.handler:
-            raise SSFExecutionError("SSF has no handler defined")
-
-        handler = ssf.handler
-
         # Execute with timeout
         try:
             result = await asyncio.wait_for(
-                self._execute_handler(handler, inputs, context),
+                plan.execute(inputs, context),
                 timeout=context.timeout_seconds,
             )
             return result
         except asyncio.TimeoutError:
             raise SSFTimeoutError(f"Execution timed out after {context.timeout_seconds}s")
 
+    def _resolve_executor(self, handler: Optional[SSFHandler]) -> Executor:
+        """Resolve the callable that runs a handler, loading module handlers now."""
+        if not handler:
+            return self._execute_missing
+
+        if handler.type == HandlerType.MODULE and handler.module_path and handler.function_name:
+            try:
+                func = self._load_module_handler(handler)
+            except SSFExecutionError:
+                # Not importable yet; _execute_module retries on each call
+                return partial(self._execute_handler, handler)
+            return partial(self._call_module_handler, func, asyncio.iscoroutinefunction(func))
+
+        return partial(self._execute_handler, handler)
+
+    async def _execute_missing(
+        self,
+        inputs: Dict[str, Any],
+        context: BoundConstraintContext,
+    ) -> Optional[Dict[str, Any]]:
+        raise SSFExecutionError("SSF has no handler defined")
+
     async def _execute_handler(
         self,
         handler: SSFHandler,
@@ -662,6 +751,11 @@ class SSFRuntime:
         if not handler.module_path or not handler.function_name:
             raise SSFExecutionError("Module handler missing path or function name")
 
+        func = self._load_module_handler(handler)
+        return await self._call_module_handler(func, asyncio.iscoroutinefunction(func), inputs, context)
+
+    def _load_module_handler(self, handler: SSFHandler) -> Callable:
+        """Import a module handler's function, caching it."""
         # Check cache first
         cache_key = f"{handler.module_path}.{handler.function_name}"
         func = self._handler_cache.get(cache_key)
@@ -674,9 +768,18 @@ class SSFRuntime:
             except (ImportError, AttributeError) as e:
                 raise SSFExecutionError(f"Failed to load module handler: {str(e)}")
 
-        # Execute the function
+        return func
+
+    async def _call_module_handler(
+        self,
+        func: Callable,
+        is_async: bool,
+        inputs: Dict[str, Any],
+        context: BoundConstraintContext,
+    ) -> Optional[Dict[str, Any]]:
+        """Call a loaded module handler function."""
         try:
-            if asyncio.iscoroutinefunction(func):
+            if is_async:
                 return await func(**inputs)
             else:
                 return func(**inputs)
@@ -844,8 +947,17 @@ class SSFRuntime:
             "average_execution_time_seconds": avg_time,
             "total_execution_time_seconds": self._total_execution_time,
             "cached_handlers": len(self._handler_cache),
+            "compiled_plans": len(self._plans),
+            "latency_budget_ms": self.latency_budget_ms,
+            "over_budget_invocations": self.metrics.over_budget_total(),
+            "stages": self.metrics.summary(),
         }
 
+    def get_prometheus_metrics(self) -> str:
+        """Stage and overhead latency summaries in Prometheus text format."""
+        return self.metrics.to_prometheus()
+
     def clear_handler_cache(self) -> None:
-        """Clear the handler cache."""
+        """Clear the handler cache (and the plans holding loaded handlers)."""
         self._handler_cache.clear()
+        self._plans.clear()
@@ -0,0 +1,132 @@
+"""
+SSF Pattern Scanner - Forbidden-pattern checks over structured data.
+
+An SSF's forbidden input/output patterns used to be searched one at a
+time in str(data), which builds a repr of the whole payload (a copy of
+every string in it, escaped) on every invocation. PatternScanner walks
+the data in place instead: dict keys and string leaves are searched as
+they are, other scalars as their str(), and the walk stops at the first
+match.
+
+Python's re has no multi-pattern automaton, so how a string is searched
+depends on its length:
+
+- Short strings (keys, typical field values) are searched once with all
+  patterns joined into one alternation, saving a search call per pattern
+- Long strings are searched pattern by pattern, which keeps each
+  pattern's own literal-prefix scan; an alternation walks long text about
+  half as fast
+
+Patterns the alternation cannot hold (numbered backreferences, or one
+that does not compile as part of it) are always searched on their own.
+"""
+
+import logging
+import re
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Strings up to this length are searched with the combined alternation
+COMBINED_MAX_LENGTH = 32
+
+# Leading global flags, e.g. "(?i)", which may not appear mid-pattern
+_GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+# Numbered backreferences and conditionals, which renumbering would break
+_NUMBERED_REFERENCE = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+def _scoped(source: str) -> str:
+    """Wrap a pattern for an alternation, turning leading global flags into scoped ones."""
+    flags = ""
+    position = 0
+    while True:
+        match = _GLOBAL_FLAGS.match(source, position)
+        if match is None:
+            break
+        flags += match.group(1)
+        position = match.end()
+    return f"(?{flags}:{source[position:]})" if flags else f"(?:{source})"
+
+
+class PatternScanner:
+    """Forbidden patterns of one SSF direction, searched over structured data."""
+
+    def __init__(self, patterns: List[Tuple[str, re.Pattern]], flags: int = re.IGNORECASE):
+        """
+        Args:
+            patterns: (source, compiled) pairs, as returned by plan.compile_patterns
+            flags: Flags the patterns were compiled with
+        """
+        self.patterns = list(patterns)
+        self._combined: Optional[re.Pattern] = None
+        self._sources: List[Optional[str]] = []
+
+        branches = []
+        sources: List[Optional[str]] = [None]  # group 0 is the whole match
+        for source, regex in self.patterns:
+            if regex.groups and _NUMBERED_REFERENCE.search(source):
+                continue
+            branches.append(f"({_scoped(source)})")
+            sources.append(source)
+            sources.extend([None] * regex.groups)
+        if len(branches) > 1:
+            try:
+                self._combined = re.compile("|".join(branches), flags)
+                self._sources = sources
+            except re.error as e:
+                logger.debug(f"Forbidden patterns not combinable, searching separately: {e}")
+        combined = set(source for source in self._sources if source is not None)
+        # Searched on their own even in short strings
+        self._separate = [(s, r) for s, r in self.patterns if s not in combined]
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def search_text(self, text: str) -> Optional[str]:
+        """Source of a pattern found in text, or None."""
+        if self._combined is not None and len(text) <= COMBINED_MAX_LENGTH:
+            match = self._combined.search(text)
+            if match is not None:
+                return self._sources[match.lastindex]
+            for source, regex in self._separate:
+                if regex.search(text):
+                    return source
+            return None
+        for source, regex in self.patterns:
+            if regex.search(text):
+                return source
+        return None
+
+    def search(self, data: Any) -> Optional[str]:
+        """
+        Source of the first pattern found in data, or None.
+
+        Dicts, lists, tuples and sets are walked depth-first in order; each
+        key is searched before its value.
+        """
+        if not self.patterns:
+            return None
+        stack = [data]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, str):
+                text = value
+            elif isinstance(value, dict):
+                for key, item in reversed(list(value.items())):
+                    stack.append(item)
+                    stack.append(key)
+                continue
+            elif isinstance(value, (list, tuple)):
+                stack.extend(reversed(value))
+                continue
+            elif isinstance(value, (set, frozenset)):
+                stack.extend(value)
+                continue
+            else:
+                text = str(value)
+            found = self.search_text(text)
+            if found is not None:
+                return found
+        return None
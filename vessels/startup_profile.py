@@ -0,0 +1,236 @@
+"""
+Startup profiler for the Vessels entry points.
+
+`python main.py --profile-startup` and `python vessels_cli.py
+--profile-startup` use StartupProfiler to show where startup time goes:
+
+- Import time per module, measured by a sys.meta_path finder that times
+  each module's loader (self time excludes the modules it imports, as
+  with `python -X importtime`)
+- Startup phases (importing A0, constructing it, initialize())
+- Init time per AgentZeroCore subsystem
+
+The result is a ranked text report and a JSON artifact that a deploy
+pipeline can diff against earlier runs to catch startup regressions.
+
+This module must stay cheap to import: it is loaded before everything it
+measures.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+PROFILE_VERSION = 1
+
+
+def add_profile_startup_argument(parser: argparse.ArgumentParser) -> None:
+    """Add --profile-startup [PATH] to an entry point's arguments."""
+    parser.add_argument(
+        "--profile-startup", nargs="?", const="startup-profile.json", metavar="PATH",
+        help="Report import, phase and subsystem init times and write them "
+             "as JSON (default: startup-profile.json)",
+    )
+
+
+class _TimingLoader:
+    """Loader proxy that times create_module/exec_module for one module."""
+
+    def __init__(self, loader: Any, profiler: "StartupProfiler", find_seconds: float):
+        self._loader = loader
+        self._profiler = profiler
+        self._find_seconds = find_seconds
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create = getattr(self._loader, "create_module", None)
+        if create is None:
+            return None
+        with self._profiler._timing(spec.name, self._find_seconds):
+            self._find_seconds = 0.0
+            return create(spec)
+
+    def exec_module(self, module):
+        name = module.__spec__.name if module.__spec__ else module.__name__
+        try:
+            with self._profiler._timing(name, self._find_seconds):
+                self._find_seconds = 0.0
+                self._loader.exec_module(module)
+        finally:
+            # Leave the module pointing at its real loader
+            if getattr(module, "__loader__", None) is self:
+                module.__loader__ = self._loader
+            spec = getattr(module, "__spec__", None)
+            if spec is not None and spec.loader is self:
+                spec.loader = self._loader
+
+
+class _TimingFinder:
+    """Meta path finder that wraps the loaders found by the other finders."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        start = time.perf_counter()
+        spec = None
+        for finder in list(sys.meta_path):
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimingLoader(spec.loader, self._profiler, time.perf_counter() - start)
+        return spec
+
+
+class StartupProfiler:
+    """
+    Records module import times, startup phases and subsystem init times.
+
+    Only imports that happen between start() and stop() are seen; modules
+    already in sys.modules cost nothing and are not listed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._finder = _TimingFinder(self)
+        self._imports: Dict[str, Dict[str, float]] = {}
+        self._phases: Dict[str, float] = {}
+        self._subsystems: Dict[str, float] = {}
+        self._started_at: Optional[float] = None
+        self._start: Optional[float] = None
+        self._elapsed: Optional[float] = None
+
+    def start(self) -> "StartupProfiler":
+        """Begin timing imports."""
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+        self._started_at = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def stop(self) -> None:
+        """Stop timing imports."""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        if self._start is not None and self._elapsed is None:
+            self._elapsed = time.perf_counter() - self._start
+
+    @property
+    def running(self) -> bool:
+        return self._finder in sys.meta_path
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a named startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = self._phases.get(name, 0.0) + time.perf_counter() - start
+
+    def record_subsystems(self, init_times: Dict[str, float]) -> None:
+        """Record per-subsystem init seconds (AgentZeroCore.subsystem_init_times)."""
+        self._subsystems.update(init_times)
+
+    @contextmanager
+    def _timing(self, module: str, extra_self: float = 0.0) -> Iterator[None]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame = [0.0]  # Time spent importing nested modules
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed + extra_self
+            with self._lock:
+                record = self._imports.setdefault(module, {"self": 0.0, "cumulative": 0.0})
+                record["self"] += elapsed - frame[0] + extra_self
+                record["cumulative"] += elapsed + extra_self
+
+    def imports(self) -> List[Dict[str, Any]]:
+        """Imported modules, slowest self time first."""
+        with self._lock:
+            records = [
+                {"module": name, "self_ms": t["self"] * 1000, "cumulative_ms": t["cumulative"] * 1000}
+                for name, t in self._imports.items()
+            ]
+        records.sort(key=lambda r: r["self_ms"], reverse=True)
+        return records
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable profile."""
+        imports = self.imports()
+        elapsed = self._elapsed
+        if elapsed is None and self._start is not None:
+            elapsed = time.perf_counter() - self._start
+        return {
+            "version": PROFILE_VERSION,
+            "started_at": self._started_at,
+            "python": ".".join(map(str, sys.version_info[:3])),
+            "argv": list(sys.argv),
+            "total_ms": (elapsed or 0.0) * 1000,
+            "import_ms": sum(r["self_ms"] for r in imports),
+            "modules_imported": len(imports),
+            "phases_ms": {name: seconds * 1000 for name, seconds in self._phases.items()},
+            "subsystems_ms": {
+                name: seconds * 1000
+                for name, seconds in sorted(self._subsystems.items(), key=lambda kv: -kv[1])
+            },
+            "imports": imports,
+        }
+
+    def report(self, top: int = 20) -> str:
+        """Ranked plain-text report."""
+        profile = self.to_dict()
+        lines = [
+            f"Startup profile: {profile['total_ms']:.1f} ms total, "
+            f"{profile['import_ms']:.1f} ms importing {profile['modules_imported']} modules",
+            "",
+            f"{'phase':<40} {'ms':>10}",
+            "-" * 51,
+        ]
+        lines += [f"{name:<40} {ms:>10.1f}" for name, ms in profile["phases_ms"].items()]
+        if profile["subsystems_ms"]:
+            lines += ["", f"{'subsystem':<40} {'ms':>10}", "-" * 51]
+            lines += [f"{name:<40} {ms:>10.1f}" for name, ms in profile["subsystems_ms"].items()]
+        lines += ["", f"{'module (top ' + str(top) + ' by self time)':<40} {'self ms':>10} {'cumul. ms':>10}",
+                  "-" * 62]
+        lines += [
+            f"{r['module']:<40} {r['self_ms']:>10.1f} {r['cumulative_ms']:>10.1f}"
+            for r in profile["imports"][:top]
+        ]
+        return "\n".join(lines)
+
+    def write_json(self, path: str) -> None:
+        """Write the profile as a JSON artifact."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def finish(self, json_path: Optional[str] = None, stream: Optional[TextIO] = None,
+               top: int = 20) -> Dict[str, Any]:
+        """Stop, print the report (default: stderr) and write the JSON artifact."""
+        self.stop()
+        print(self.report(top), file=stream or sys.stderr)
+        if json_path:
+            self.write_json(json_path)
+            print(f"\nStartup profile written to {json_path}", file=stream or sys.stderr)
+        return self.to_dict()
@@ -5,9 +5,19 @@ Uses AgentZeroCore as THE main core for all operations.
 """
 
 import argparse
+import asyncio
+import json
 import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, TextIO
 
-from agent_zero_core import agent_zero
+from vessels.latency import percentile
+from vessels.startup_profile import StartupProfiler, add_profile_startup_argument
 
 # Configure logging
 logging.basicConfig(
@@ -17,14 +27,45 @@ logging.basicConfig(
 logger = logging.getLogger("VesselsCLI")
 
 
+@dataclass
+class CLIJob:
+    """A request submitted from the concurrent REPL."""
+    job_id: int
+    text: str
+    started: float
+    task: Optional[asyncio.Task] = None
+
+
 class VesselsCLI:
-    def __init__(self, show_startup_banner=True):
+    def __init__(self, show_startup_banner=True, profiler: StartupProfiler = None):
+        """
+        Connect to Agent Zero Core.
+
+        Args:
+            show_startup_banner: Print the banner before initializing
+            profiler: StartupProfiler timing the startup phases; subsystems
+                are then built during startup so their init times are recorded
+        """
+        def phase(name):
+            return profiler.phase(name) if profiler else nullcontext()
+
+        # Imported here so a startup profile sees the whole A0 stack load
+        with phase("import agent_zero_core"):
+            from agent_zero_core import get_agent_zero
+        with phase("construct AgentZeroCore"):
+            self.agent_zero = get_agent_zero()
+
         if show_startup_banner:
             self._show_startup_banner()
 
         # Initialize Agent Zero
         try:
-            agent_zero.initialize()
+            with phase("AgentZeroCore.initialize()"):
+                self.agent_zero.initialize()
+            if profiler:
+                with phase("AgentZeroCore.warm_up()"):
+                    self.agent_zero.warm_up(parallel=False)
+                profiler.record_subsystems(self.agent_zero.subsystem_init_times)
             logger.info("Connected to Agent Zero Core")
         except Exception as e:
             logger.error(f"Failed to initialize Agent Zero: {e}")
@@ -36,6 +77,7 @@ class VesselsCLI:
         print("   VESSELS PLATFORM")
         print("   Powered by Agent Zero Core")
         print("=" * 60)
+        agent_zero = self.agent_zero
         print(f"   Agents: {len(agent_zero.agents)}")
         print(f"   Status: {'Running' if agent_zero.running else 'Idle'}")
         print("=" * 60)
@@ -64,15 +106,15 @@ class VesselsCLI:
                     continue
 
                 # Process via Agent Zero Core
-                result = agent_zero.process_request(user_input, user_id=user_id)
+                result = self.agent_zero.process_request(user_input, user_id=user_id)
 
                 # Display response
                 message = result.get('message', str(result))
                 print(f"\nVessels: {message}")
 
-                # Show agent info if any were spawned
+                # Show agent info if any were assigned (pooled or newly spawned)
                 if result.get('agents'):
-                    print(f"   [Spawned {len(result['agents'])} agents]")
+                    print(f"   [Assigned {len(result['agents'])} agents]")
 
             except KeyboardInterrupt:
                 print("\nGoodbye!")
@@ -80,8 +122,234 @@ class VesselsCLI:
             except Exception as e:
                 logger.error(f"Error: {e}")
 
+    def concurrent_interactive_mode(self, max_workers: int = 8):
+        """
+        REPL that submits each request without waiting for earlier ones.
+
+        Results print as they finish, tagged with their job number. Commands:
+        'jobs' lists in-flight requests, 'cancel <n>' or 'cancel all' stops
+        waiting for them, 'status' shows system status, 'exit' cancels what
+        is still in flight and quits; at end of input (e.g. piped requests)
+        in-flight requests are allowed to finish.
+        """
+        print("\n" + "=" * 60)
+        print("VESSELS INTERACTIVE CLI (concurrent)")
+        print("=" * 60)
+        print("Requests run concurrently; results appear as they finish.")
+        print("Commands: jobs, cancel <n>|all, status, exit")
+
+        try:
+            asyncio.run(self._concurrent_repl(max_workers))
+        except KeyboardInterrupt:
+            pass
+        print("Goodbye!")
+
+    async def _concurrent_repl(self, max_workers: int) -> None:
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cli-request")
+        )
+        lines: asyncio.Queue = asyncio.Queue()
+        self._start_input_reader(loop, lines)
+
+        jobs: Dict[int, CLIJob] = {}
+        next_id = 1
+        user_id = "cli_user"
+
+        while True:
+            line = await lines.get()
+            if line is None:
+                # End of input: let in-flight requests finish
+                await asyncio.gather(*(job.task for job in jobs.values()), return_exceptions=True)
+                break
+            user_input = line.strip()
+            command = user_input.lower()
+            if not user_input:
+                continue
+
+            if command in ('exit', 'quit'):
+                self._cancel_jobs(jobs, 'all')
+                break
+            if command == 'status':
+                self._show_status()
+            elif command == 'jobs':
+                self._show_jobs(jobs)
+            elif command.startswith('cancel'):
+                self._cancel_jobs(jobs, command[len('cancel'):].strip())
+            else:
+                job = CLIJob(job_id=next_id, text=user_input, started=time.perf_counter())
+                next_id += 1
+                job.task = asyncio.create_task(self._run_job(job, user_id, jobs))
+                jobs[job.job_id] = job
+                print(f"[#{job.job_id}] submitted")
+
+    @staticmethod
+    def _start_input_reader(loop: asyncio.AbstractEventLoop, lines: asyncio.Queue) -> None:
+        """Read stdin on a daemon thread so input() never blocks the event loop."""
+        def read():
+            while True:
+                try:
+                    line = input()
+                except (EOFError, KeyboardInterrupt):
+                    line = None
+                try:
+                    loop.call_soon_threadsafe(lines.put_nowait, line)
+                except RuntimeError:  # Loop closed after exit
+                    return
+                if line is None:
+                    return
+
+        threading.Thread(target=read, name="cli-input", daemon=True).start()
+
+    async def _run_job(self, job: CLIJob, user_id: str, jobs: Dict[int, CLIJob]) -> None:
+        try:
+            result = await self.agent_zero.process_request_async(job.text, user_id=user_id)
+        except Exception as e:
+            print(f"[#{job.job_id}] failed: {e}")
+            return
+        finally:
+            jobs.pop(job.job_id, None)
+
+        elapsed_ms = (time.perf_counter() - job.started) * 1000
+        message = result.get('message', str(result))
+        print(f"\n[#{job.job_id} {elapsed_ms:.0f} ms] Vessels: {message}")
+        if result.get('agents'):
+            print(f"   [Assigned {len(result['agents'])} agents]")
+
+    @staticmethod
+    def _show_jobs(jobs: Dict[int, CLIJob]) -> None:
+        if not jobs:
+            print("No requests in flight")
+            return
+        now = time.perf_counter()
+        for job in jobs.values():
+            text = job.text if len(job.text) <= 50 else job.text[:47] + "..."
+            print(f"  #{job.job_id:<4} {now - job.started:>6.1f}s  {text}")
+
+    @staticmethod
+    def _cancel_jobs(jobs: Dict[int, CLIJob], target: str) -> None:
+        """
+        Cancel in-flight jobs by number, or all of them.
+
+        The CLI stops waiting for the result; work A0 has already started
+        for the request (e.g. spawned agents) is not rolled back.
+        """
+        if target == 'all':
+            selected = list(jobs.values())
+        else:
+            try:
+                selected = [jobs[int(target.lstrip('#'))]]
+            except (ValueError, KeyError):
+                print(f"No in-flight request '{target}' (see 'jobs')")
+                return
+        for job in selected:
+            job.task.cancel()
+            del jobs[job.job_id]
+            print(f"[#{job.job_id}] cancelled")
+
+    def run_batch(self, path: str, concurrency: int = 8, output=None) -> Optional[Dict[str, Any]]:
+        """
+        Run newline-delimited requests from a file with bounded concurrency.
+
+        Blank lines and lines starting with '#' are skipped. One JSON line
+        per request is written to output (default: stdout) as it finishes,
+        and a latency/throughput summary is printed to stderr.
+
+        Args:
+            path: Request file, or '-' for stdin
+            concurrency: Max requests in flight
+            output: Text stream for per-request JSON lines
+
+        Returns:
+            Summary dict (requests, errors, seconds, requests/second, latencies),
+            or None if the request file cannot be read
+        """
+        try:
+            source = sys.stdin if path == '-' else open(path, "r", encoding="utf-8")
+        except OSError as e:
+            logger.error(f"Error: cannot open batch file: {e}")
+            return None
+        try:
+            summary = asyncio.run(self._run_batch(source, max(1, concurrency), output or sys.stdout))
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Error: cannot read batch file {path}: {e}")
+            return None
+        finally:
+            if source is not sys.stdin:
+                source.close()
+        print(
+            f"{summary['requests']} requests, {summary['errors']} errors in "
+            f"{summary['seconds']:.2f}s ({summary['requests_per_second']:.1f} req/s); "
+            f"latency p50 {summary['p50_ms']:.1f} ms, p95 {summary['p95_ms']:.1f} ms, "
+            f"p99 {summary['p99_ms']:.1f} ms",
+            file=sys.stderr,
+        )
+        return summary
+
+    async def _run_batch(self, source: TextIO, concurrency: int, output) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cli-batch")
+        )
+        # Bounded so a large file is read as the pipeline drains it
+        pending: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+        latencies: List[float] = []
+        errors = 0
+
+        async def worker():
+            nonlocal errors
+            while True:
+                item = await pending.get()
+                if item is None:
+                    return
+                line_number, text = item
+                start = time.perf_counter()
+                record = {"line": line_number, "request": text}
+                try:
+                    result = await self.agent_zero.process_request_async(text, user_id="cli_batch")
+                    record.update(status="ok", response=result)
+                except Exception as e:
+                    errors += 1
+                    record.update(status="error", error=str(e))
+                elapsed = time.perf_counter() - start
+                latencies.append(elapsed)
+                record["ms"] = round(elapsed * 1000, 3)
+                output.write(json.dumps(record, default=str) + "\n")
+                output.flush()
+
+        async def produce():
+            for line_number, line in enumerate(source, 1):
+                text = line.strip()
+                if text and not text.startswith('#'):
+                    await pending.put((line_number, text))
+            for _ in range(concurrency):
+                await pending.put(None)
+
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # A failing task (e.g. closed output) must not leave the rest blocked
+            for task in tasks:
+                task.cancel()
+        seconds = time.perf_counter() - start
+
+        return {
+            "requests": len(latencies),
+            "errors": errors,
+            "concurrency": concurrency,
+            "seconds": seconds,
+            "requests_per_second": len(latencies) / seconds if seconds else 0.0,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+        }
+
     def _show_status(self):
         """Display system status."""
+        agent_zero = self.agent_zero
         print("\n--- System Status ---")
         print(f"Agents active: {len(agent_zero.agents)}")
         print(f"Running: {agent_zero.running}")
@@ -93,7 +361,7 @@ class VesselsCLI:
 
     def run_command(self, command: str):
         """Run a single command and exit."""
-        result = agent_zero.process_request(command, user_id="cli_single")
+        result = self.agent_zero.process_request(command, user_id="cli_single")
         print(result)
 
 
@@ -101,15 +369,31 @@ def main():
     parser = argparse.ArgumentParser(description='Vessels CLI')
     parser.add_argument('--command', '-c', help='Execute a single command')
     parser.add_argument('--status', '-s', action='store_true', help='Check system status')
+    parser.add_argument('--concurrent', action='store_true',
+                        help='Interactive mode that runs requests concurrently')
+    parser.add_argument('--batch', metavar='FILE',
+                        help="Run newline-delimited requests from FILE ('-' for stdin)")
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Max requests in flight for --batch and --concurrent (default: 8)')
+    add_profile_startup_argument(parser)
 
     args = parser.parse_args()
 
-    cli = VesselsCLI()
+    profiler = StartupProfiler().start() if args.profile_startup else None
+    # Keep stdout clean for --batch JSON lines
+    cli = VesselsCLI(show_startup_banner=not args.batch, profiler=profiler)
+    if profiler:
+        profiler.finish(args.profile_startup)
 
     if args.status:
         cli._show_status()
+    elif args.batch:
+        summary = cli.run_batch(args.batch, concurrency=args.concurrency)
+        sys.exit(1 if summary is None or summary['errors'] else 0)
     elif args.command:
         cli.run_command(args.command)
+    elif args.concurrent:
+        cli.concurrent_interactive_mode(max_workers=args.concurrency)
     else:
         cli.interactive_mode()
 
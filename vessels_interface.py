@@ -6,12 +6,13 @@ All requests are processed through AgentZeroCore.
 """
 
 import logging
+import threading
 from typing import Dict, Any, Optional
 from datetime import datetime
 import uuid
 
-from agent_zero_core import agent_zero
-from community_memory import community_memory
+from agent_zero_core import get_agent_zero
+from community_memory import get_community_memory
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,7 @@ class VesselsInterface:
     """
     Natural language interface for Vessels platform.
 
-    All processing is delegated to AgentZeroCore (agent_zero).
+    All processing is delegated to the shared AgentZeroCore (get_agent_zero()).
     """
 
     def __init__(self, llm_call: Optional[callable] = None):
@@ -34,7 +35,7 @@ class VesselsInterface:
 
         # Configure Agent Zero with LLM capability
         if self.llm_call:
-            agent_zero.set_llm_call(self.llm_call)
+            get_agent_zero().set_llm_call(self.llm_call)
 
         logger.info("VesselsInterface initialized with AgentZeroCore")
 
@@ -53,10 +54,10 @@ class VesselsInterface:
 
         try:
             # Process through Agent Zero
-            result = agent_zero.process_request(user_input, user_id=user_id)
+            result = get_agent_zero().process_request(user_input, user_id=user_id)
 
             # Store in community memory
-            community_memory.store_experience(
+            get_community_memory().store_experience(
                 agent_id=user_id,
                 experience={
                     "interaction_id": interaction_id,
@@ -84,12 +85,30 @@ class VesselsInterface:
 
     def get_status(self) -> Dict[str, Any]:
         """Get system status."""
+        agent_zero = get_agent_zero()
         return {
             "agent_zero": "active" if agent_zero.running else "idle",
             "agents": len(agent_zero.agents),
-            "memory_entries": len(community_memory.memory_store)
+            "memory_entries": len(get_community_memory().memory_store)
         }
 
 
-# Global instance
-vessels_interface = VesselsInterface()
+_vessels_interface: Optional[VesselsInterface] = None
+_vessels_interface_lock = threading.Lock()
+
+
+def get_vessels_interface() -> VesselsInterface:
+    """Shared VesselsInterface, created on first call rather than at import."""
+    global _vessels_interface
+    if _vessels_interface is None:
+        with _vessels_interface_lock:
+            if _vessels_interface is None:
+                _vessels_interface = VesselsInterface()
+    return _vessels_interface
+
+
+def __getattr__(name: str) -> Any:
+    # Backward compatibility: `from vessels_interface import vessels_interface`
+    if name == "vessels_interface":
+        return get_vessels_interface()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+VESSELS SERVER - HTTP and WebSocket serving mode
+Exposes AgentZeroCore request processing, agent status and SSF invocation.
+
+HTTP (keep-alive; pipelined requests on a connection are answered in order):
+    GET  /health                 Liveness probe
+    GET  /status                 Core, runtime, pool and subsystem status
+    GET  /agents                 Status of all agents (?vessel_id=...)
+    GET  /agents/{agent_id}      Status of one agent
+    POST /requests               {"input": str, "user_id": str} -> result
+                                 {"requests": [str | {"input", "user_id"}]} ->
+                                 NDJSON stream, one line per result as it finishes
+                                 (at most max_batch requests, else 413)
+    POST /ssf/invoke             {"tool", "arguments"} -> ToolResult; needs an
+                                 "Authorization: Bearer <token>" SSF session
+    GET  /metrics                Prometheus text metrics (HTTP routes, SSF stage latencies)
+
+WebSocket (/ws) multiplexes many requests over one connection. Each text
+frame is a JSON message with a client-chosen "id" (string or integer);
+messages are handled concurrently and replies carry the same id, in
+completion order:
+    {"id": 1, "type": "request", "input": "...", "user_id": "..."}
+    {"id": 2, "type": "status"}
+    {"id": 3, "type": "agent_status", "agent_id": "..."}
+    {"id": 4, "type": "ssf_invoke", "tool": "...", "arguments": {...}}
+        (the SSF session comes from the handshake's Authorization header)
+    {"id": 5, "type": "cancel", "target": 1}
+Replies are {"id", "ok": true, "result": ...} or {"id", "ok": false, "error": ...}.
+
+SSF invocation acts as a persona, so the caller's identity is never taken
+from the request. An SSF session file (--ssf-sessions or VESSELS_SSF_SESSIONS)
+maps bearer tokens to personas; without one SSF invocation is disabled:
+    {"<token>": {"persona_id": "<uuid>", "name": "...", "community_id": "...",
+                 "agent_id": "...", "vessel_id": "..."}}
+
+`python vessels_server.py` binds to 127.0.0.1 unless --host or VESSELS_HOST
+says otherwise; `VESSELS_MODE=web python main.py`, the container entry
+point, binds to 0.0.0.0 unless VESSELS_HOST is set.
+
+Run with `VESSELS_MODE=web python main.py` or `python vessels_server.py`.
+"""
+
+import argparse
+import asyncio
+import functools
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set
+from uuid import UUID
+
+try:
+    from aiohttp import WSCloseCode, WSMsgType, web
+except ImportError:  # Optional dependency: only needed in web mode
+    web = None
+
+logger = logging.getLogger("VesselsServer")
+
+DEFAULT_HOST = os.getenv("VESSELS_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.getenv("VESSELS_PORT", "5000"))
+DEFAULT_SSF_SESSIONS = os.getenv("VESSELS_SSF_SESSIONS")
+
+_dumps = functools.partial(json.dumps, default=str)
+
+
+class _RouteMetrics:
+    """Request count, errors and latency for one route."""
+
+    __slots__ = ("count", "errors", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.seconds = 0.0
+
+
+class VesselsServer:
+    """
+    aiohttp application serving an AgentZeroCore.
+
+    Requests are processed on the core through process_request_async, with
+    at most max_concurrency in flight across all connections; callers
+    beyond that wait for a slot instead of piling work onto the executor.
+    """
+
+    def __init__(self, agent_zero: Any = None, max_concurrency: int = 64,
+                 keepalive_timeout: float = 75.0, heartbeat: float = 30.0,
+                 ssf_sessions: Optional[Dict[str, Dict[str, Any]]] = None,
+                 max_batch: int = 256):
+        """
+        Initialize the server.
+
+        Args:
+            agent_zero: AgentZeroCore to serve (default: get_agent_zero())
+            max_concurrency: Max requests processed at once
+            keepalive_timeout: Seconds an idle keep-alive connection is kept open
+            heartbeat: WebSocket ping interval in seconds
+            ssf_sessions: Bearer token -> persona record for SSF invocation
+                (see load_ssf_sessions); None disables SSF invocation
+            max_batch: Max requests in one POST /requests batch
+        """
+        if web is None:
+            raise RuntimeError("Web mode requires aiohttp (pip install -r requirements.txt)")
+        if agent_zero is None:
+            from agent_zero_core import get_agent_zero
+            agent_zero = get_agent_zero()
+        self.agent_zero = agent_zero
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_batch = max(1, max_batch)
+        self.keepalive_timeout = keepalive_timeout
+        self.heartbeat = heartbeat
+        # Keyed by token digest so lookups do not compare raw tokens
+        self._ssf_sessions = {
+            _token_digest(token): _session_record(record)
+            for token, record in (ssf_sessions or {}).items()
+        }
+
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._websockets: Set[Any] = set()
+        self._metrics: Dict[str, _RouteMetrics] = {}
+        self._in_flight = 0
+        self._ws_messages = 0
+        self._started = time.time()
+
+    # =========================================================================
+    # APPLICATION
+    # =========================================================================
+
+    def create_app(self) -> "web.Application":
+        """Build the aiohttp application."""
+        @web.middleware
+        async def metrics_middleware(request, handler):
+            return await self._record_metrics(request, handler)
+
+        app = web.Application(middlewares=[metrics_middleware])
+        app.router.add_get("/health", self.handle_health)
+        app.router.add_get("/status", self.handle_status)
+        app.router.add_get("/agents", self.handle_agents)
+        app.router.add_get("/agents/{agent_id}", self.handle_agent_status)
+        app.router.add_post("/requests", self.handle_requests)
+        app.router.add_post("/ssf/invoke", self.handle_ssf_invoke)
+        app.router.add_get("/metrics", self.handle_metrics)
+        app.router.add_get("/ws", self.handle_websocket)
+        app.on_startup.append(self._on_startup)
+        app.on_shutdown.append(self._on_shutdown)
+        return app
+
+    def run(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        """Serve until interrupted (SIGINT/SIGTERM)."""
+        logger.info(f"Vessels server listening on http://{host}:{port}")
+        web.run_app(
+            self.create_app(), host=host, port=port,
+            keepalive_timeout=self.keepalive_timeout, access_log=None, print=None,
+        )
+
+    async def _on_startup(self, app: "web.Application") -> None:
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        # process_request_async runs on the loop's default executor outside
+        # the ASYNCIO runtime; size it to the concurrency limit
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="vessels-http")
+        )
+
+    async def _on_shutdown(self, app: "web.Application") -> None:
+        for ws in list(self._websockets):
+            await ws.close(code=WSCloseCode.GOING_AWAY, message=b"Server shutdown")
+
+    async def _record_metrics(self, request: "web.Request", handler) -> "web.StreamResponse":
+        route = request.match_info.route.resource
+        name = route.canonical if route is not None else "unmatched"
+        metrics = self._metrics.get(name)
+        if metrics is None:
+            metrics = self._metrics[name] = _RouteMetrics()
+        start = time.perf_counter()
+        try:
+            response = await handler(request)
+        except web.HTTPException as e:
+            metrics.errors += e.status >= 500
+            raise
+        except Exception:
+            metrics.errors += 1
+            raise
+        finally:
+            metrics.count += 1
+            metrics.seconds += time.perf_counter() - start
+        metrics.errors += response.status >= 500
+        return response
+
+    # =========================================================================
+    # OPERATIONS (shared by HTTP and WebSocket)
+    # =========================================================================
+
+    async def process(self, user_input: str, user_id: str = "default") -> Dict[str, Any]:
+        """Process one natural language request within the concurrency limit."""
+        async with self._slots:
+            self._in_flight += 1
+            try:
+                return await self.agent_zero.process_request_async(user_input, user_id=user_id)
+            finally:
+                self._in_flight -= 1
+
+    def status(self) -> Dict[str, Any]:
+        core = self.agent_zero
+        return {
+            "running": core.running,
+            "agents": len(core.agents),
+            "runtime": core.get_runtime_stats(),
+            "pool": core.get_pool_stats(),
+            "subsystems": core.get_subsystem_stats(),
+            "server": {
+                "uptime_seconds": time.time() - self._started,
+                "in_flight": self._in_flight,
+                "max_concurrency": self.max_concurrency,
+                "websockets": len(self._websockets),
+            },
+        }
+
+    def ssf_session(self, authorization: Optional[str]) -> Dict[str, Any]:
+        """
+        Resolve an Authorization header to the persona record of its SSF session.
+
+        Raises:
+            PermissionError: SSF invocation is disabled, or the token is missing or unknown
+        """
+        if not self._ssf_sessions:
+            raise PermissionError("SSF invocation is disabled: no SSF sessions configured")
+        scheme, _, token = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer" or not token.strip():
+            raise PermissionError("SSF invocation requires an 'Authorization: Bearer <token>' header")
+        digest = _token_digest(token.strip())
+        for known, session in self._ssf_sessions.items():
+            if hmac.compare_digest(known, digest):
+                return session
+        raise PermissionError("Unknown SSF session token")
+
+    async def invoke_ssf(self, body: Dict[str, Any], session: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run an SSF tool call (invoke_ssf, find_ssf, compose_ssfs, ssf_*).
+
+        The persona and agent come from the caller's SSF session (see
+        ssf_session), never from the request body; permissions are the SSF
+        defaults and cannot be raised by the request.
+        """
+        from vessels.ssf.runtime import A0AgentInstance, Persona
+
+        tool = body.get("tool")
+        if not tool:
+            raise ValueError("'tool' is required")
+        persona = Persona(
+            id=session["persona_id"],
+            name=session["name"],
+            community_id=session["community_id"],
+        )
+        agent = A0AgentInstance(
+            agent_id=session["agent_id"],
+            persona_id=persona.id,
+            vessel_id=session["vessel_id"],
+        )
+        async with self._slots:
+            result = await self.agent_zero.handle_ssf_tool_call(
+                tool, body.get("arguments") or {}, persona, agent
+            )
+        return result.to_dict() if hasattr(result, "to_dict") else result
+
+    # =========================================================================
+    # HTTP HANDLERS
+    # =========================================================================
+
+    async def handle_health(self, request: "web.Request") -> "web.Response":
+        return web.json_response({"status": "ok"})
+
+    async def handle_status(self, request: "web.Request") -> "web.Response":
+        return web.json_response(self.status(), dumps=_dumps)
+
+    async def handle_agents(self, request: "web.Request") -> "web.Response":
+        vessel_id = request.query.get("vessel_id")
+        return web.json_response(self.agent_zero.get_all_agents_status(vessel_id), dumps=_dumps)
+
+    async def handle_agent_status(self, request: "web.Request") -> "web.Response":
+        status = self.agent_zero.get_agent_status(request.match_info["agent_id"])
+        if status is None:
+            return _error(404, "Agent not found")
+        return web.json_response(status, dumps=_dumps)
+
+    async def handle_requests(self, request: "web.Request") -> "web.StreamResponse":
+        try:
+            body = await request.json()
+        except ValueError:
+            return _error(400, "Body must be JSON")
+        if not isinstance(body, dict):
+            return _error(400, "Body must be a JSON object")
+
+        if "requests" in body:
+            return await self._stream_requests(request, body)
+        try:
+            text = _request_input(body.get("input"))
+        except ValueError as e:
+            return _error(400, str(e))
+        try:
+            result = await self.process(text, body.get("user_id", "default"))
+        except Exception as e:
+            logger.error(f"Request failed: {e}")
+            return _error(500, str(e))
+        return web.json_response(result, dumps=_dumps)
+
+    async def _stream_requests(self, request: "web.Request", body: Dict[str, Any]) -> "web.StreamResponse":
+        """Process a list of requests concurrently, streaming NDJSON results as they finish."""
+        items = body["requests"]
+        if not isinstance(items, list):
+            return _error(400, "'requests' must be a list")
+        if len(items) > self.max_batch:
+            return _error(413, f"At most {self.max_batch} requests per batch, got {len(items)}")
+        default_user = body.get("user_id", "default")
+
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        async def run(index: int, item: Any) -> Dict[str, Any]:
+            # The stream has started: a bad item gets an error line, not an aborted response
+            try:
+                if isinstance(item, str):
+                    text, user_id = _request_input(item), default_user
+                elif isinstance(item, dict):
+                    text, user_id = _request_input(item.get("input")), item.get("user_id", default_user)
+                else:
+                    raise ValueError("Each request must be a string or a JSON object")
+                return {"index": index, "ok": True, "result": await self.process(text, user_id)}
+            except Exception as e:
+                return {"index": index, "ok": False, "error": str(e)}
+
+        for finished in asyncio.as_completed([run(i, item) for i, item in enumerate(items)]):
+            await response.write((_dumps(await finished) + "\n").encode())
+        await response.write_eof()
+        return response
+
+    async def handle_ssf_invoke(self, request: "web.Request") -> "web.Response":
+        try:
+            session = self.ssf_session(request.headers.get("Authorization"))
+        except PermissionError as e:
+            return _error(401, str(e))
+        try:
+            body = await request.json()
+        except ValueError:
+            return _error(400, "Body must be JSON")
+        if not isinstance(body, dict):
+            return _error(400, "Body must be a JSON object")
+        try:
+            result = await self.invoke_ssf(body, session)
+        except (ValueError, KeyError) as e:
+            return _error(400, str(e))
+        except RuntimeError as e:  # SSF integration not available
+            return _error(503, str(e))
+        return web.json_response(result, dumps=_dumps)
+
+    async def handle_metrics(self, request: "web.Request") -> "web.Response":
+        routes = sorted(self._metrics.items())
+        lines = []
+        for family, value in (
+            ("vessels_http_requests_total", lambda m: m.count),
+            ("vessels_http_errors_total", lambda m: m.errors),
+            ("vessels_http_request_seconds_total", lambda m: f"{m.seconds:.6f}"),
+        ):
+            lines.append(f"# TYPE {family} counter")
+            lines += [f'{family}{{route="{route}"}} {value(metrics)}' for route, metrics in routes]
+        lines += [
+            "# TYPE vessels_requests_in_flight gauge",
+            f"vessels_requests_in_flight {self._in_flight}",
+            "# TYPE vessels_websocket_connections gauge",
+            f"vessels_websocket_connections {len(self._websockets)}",
+            "# TYPE vessels_websocket_messages_total counter",
+            f"vessels_websocket_messages_total {self._ws_messages}",
+            "# TYPE vessels_agents gauge",
+            f"vessels_agents {len(self.agent_zero.agents)}",
+        ]
+        text = "\n".join(lines) + "\n"
+        # SSF stage latencies, once the SSF subsystem has been used (not built here)
+        core = self.agent_zero
+        if "ssf" in core.get_subsystem_stats()["initialized"] and core.ssf_integration:
+            text += core.ssf_integration.runtime.get_prometheus_metrics()
+        return web.Response(text=text, content_type="text/plain")
+
+    # =========================================================================
+    # WEBSOCKET
+    # =========================================================================
+
+    async def handle_websocket(self, request: "web.Request") -> "web.WebSocketResponse":
+        # SSF calls on this connection act as the handshake's session, if any
+        authorization = request.headers.get("Authorization")
+        ws = web.WebSocketResponse(heartbeat=self.heartbeat)
+        await ws.prepare(request)
+        self._websockets.add(ws)
+
+        send_lock = asyncio.Lock()
+        tasks: Dict[Any, asyncio.Task] = {}  # by message id, for cancel
+        in_flight: Set[asyncio.Task] = set()
+
+        async def reply(message: Dict[str, Any]) -> None:
+            if ws.closed:
+                return
+            async with send_lock:
+                await ws.send_str(_dumps(message))
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    if msg.type == WSMsgType.ERROR:
+                        logger.warning(f"WebSocket error: {ws.exception()}")
+                    continue
+                self._ws_messages += 1
+                try:
+                    message = json.loads(msg.data)
+                except ValueError:
+                    await reply({"id": None, "ok": False, "error": "Message must be JSON"})
+                    continue
+                if not isinstance(message, dict):
+                    await reply({"id": None, "ok": False, "error": "Message must be a JSON object"})
+                    continue
+
+                message_id = message.get("id")
+                target = message.get("target")
+                if not (_valid_id(message_id) and _valid_id(target)):
+                    # Ids key the task map: an unhashable one must not end the connection
+                    await reply({"id": None, "ok": False, "error": "'id' and 'target' must be a string or integer"})
+                    continue
+                if message.get("type") == "cancel":
+                    task = tasks.get(target)
+                    if task is not None:
+                        task.cancel()
+                    await reply({"id": message_id, "ok": True, "result": {"cancelled": task is not None}})
+                    continue
+
+                # Pipelining: handle each message concurrently, reply when done
+                task = asyncio.create_task(self._ws_dispatch(message, reply, authorization))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                if message_id is not None:
+                    # A reused id cancels the newest task; an older one must not unmap it
+                    tasks[message_id] = task
+                    task.add_done_callback(
+                        lambda done, key=message_id: tasks.pop(key) if tasks.get(key) is done else None
+                    )
+        finally:
+            self._websockets.discard(ws)
+            for task in list(in_flight):
+                task.cancel()
+        return ws
+
+    async def _ws_dispatch(self, message: Dict[str, Any], reply,
+                           authorization: Optional[str] = None) -> None:
+        message_id = message.get("id")
+        kind = message.get("type", "request")
+        try:
+            if kind == "request":
+                result = await self.process(_request_input(message.get("input")),
+                                            message.get("user_id", "default"))
+            elif kind == "status":
+                result = self.status()
+            elif kind == "agent_status":
+                result = self.agent_zero.get_agent_status(message.get("agent_id", ""))
+                if result is None:
+                    raise KeyError("Agent not found")
+            elif kind == "ssf_invoke":
+                result = await self.invoke_ssf(message, self.ssf_session(authorization))
+            else:
+                raise ValueError(f"Unknown message type: {kind}")
+        except asyncio.CancelledError:
+            await reply({"id": message_id, "ok": False, "error": "cancelled"})
+            raise
+        except Exception as e:
+            await reply({"id": message_id, "ok": False, "error": str(e)})
+            return
+        await reply({"id": message_id, "ok": True, "result": result})
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _session_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate an SSF session record and fill in defaults."""
+    if not isinstance(record, dict) or not record.get("persona_id"):
+        raise ValueError("Each SSF session needs a 'persona_id'")
+    return {
+        "persona_id": UUID(str(record["persona_id"])),
+        "name": record.get("name", "http"),
+        "community_id": record.get("community_id", "default"),
+        "agent_id": record.get("agent_id", "http"),
+        "vessel_id": record.get("vessel_id"),
+    }
+
+
+def load_ssf_sessions(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load SSF sessions from a JSON file mapping bearer tokens to persona records.
+
+    Raises:
+        ValueError: The file is not a JSON object of valid session records
+    """
+    with open(path, encoding="utf-8") as f:
+        sessions = json.load(f)
+    if not isinstance(sessions, dict):
+        raise ValueError(f"{path} must contain a JSON object of token -> session")
+    for record in sessions.values():
+        _session_record(record)
+    return sessions
+
+
+def _valid_id(value: Any) -> bool:
+    """Whether a WebSocket message id (or cancel target) is usable as a task key."""
+    return value is None or isinstance(value, (str, int))
+
+
+def _request_input(value: Any) -> str:
+    """A request's natural language input; ValueError unless a non-empty string."""
+    if not isinstance(value, str) or not value:
+        raise ValueError("'input' must be a non-empty string")
+    return value
+
+
+def _error(status: int, message: str) -> "web.Response":
+    return web.json_response({"error": message}, status=status)
+
+
+def run_server(agent_zero: Any = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+               max_concurrency: int = 64, ssf_sessions_path: Optional[str] = DEFAULT_SSF_SESSIONS) -> None:
+    """Serve an AgentZeroCore over HTTP and WebSocket until interrupted."""
+    ssf_sessions = load_ssf_sessions(ssf_sessions_path) if ssf_sessions_path else None
+    VesselsServer(agent_zero, max_concurrency=max_concurrency, ssf_sessions=ssf_sessions).run(host, port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vessels HTTP/WebSocket server')
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Bind address (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument('--max-concurrency', type=int, default=64,
+                        help='Max requests processed at once (default: 64)')
+    parser.add_argument('--ssf-sessions', default=DEFAULT_SSF_SESSIONS,
+                        help='JSON file mapping bearer tokens to SSF personas (default: $VESSELS_SSF_SESSIONS; '
+                             'SSF invocation is disabled without one)')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    from agent_zero_core import get_agent_zero
+    agent_zero = get_agent_zero()
+    agent_zero.initialize()
+    try:
+        run_server(agent_zero, args.host, args.port, args.max_concurrency, args.ssf_sessions)
+    finally:
+        agent_zero.shutdown()
+
+
+if __name__ == "__main__":
+    main()